@@ -0,0 +1,6 @@
+"""Benchmarks for workshop code at sizes far beyond the toy asset inputs.
+
+Run from the repository root:
+
+    python -m benchmarks.algorithms --help
+"""
@@ -0,0 +1,392 @@
+"""Benchmark the algorithms in some_algos.py and some_cp_problems.py at scale.
+
+Each case builds a seeded input of size n, times the target function on it
+in a child process and reports the growth exponent between sizes, so an
+O(n*k) implementation stands out next to an O(n) one. Results can be saved
+as a baseline JSON and later runs compared against it.
+
+    python -m benchmarks.algorithms --contributor <github_id>
+    python -m benchmarks.algorithms --save-baseline benchmarks/baseline.json
+    python -m benchmarks.algorithms --baseline benchmarks/baseline.json
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import math
+import platform
+import sys
+
+import numpy as np
+
+from benchmarks import generators as gen
+from benchmarks.runner import REPO_ROOT, run_isolated, scaling_exponent
+
+PLAYGROUND = REPO_ROOT / "test_playground"
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_SEED = 12345
+DEFAULT_TOLERANCE = 1.5
+REGISTRY = "benchmarks.algorithms"  # imported by name in child processes
+
+# case name -> {"target", "where", "sizes", "prepare"}
+CASES: Dict[str, Dict[str, Any]] = {}
+
+Prepare = Callable[[Callable[..., Any], int, int], Callable[[], Any]]
+
+
+def case(name: str, target: str, where: str = "playground", sizes=DEFAULT_SIZES) -> Callable[[Prepare], Prepare]:
+    """Register a benchmark case.
+
+    `target` is "rel/path.py:function", relative to the playground root being
+    measured (where="playground") or to the repository root (where="repo").
+    The decorated function receives (fn, n, seed), builds the input and
+    returns a zero-argument callable that is timed. If that callable has a
+    `cleanup` attribute, it is called once after the measurements.
+    """
+
+    def register(prepare: Prepare) -> Prepare:
+        CASES[name] = {"target": target, "where": where, "sizes": tuple(sizes), "prepare": prepare}
+        return prepare
+
+    return register
+
+
+# some_algos.py
+@case("binary_search", "miscellaneous/some_algos.py:binary_search")
+def bench_binary_search(fn, n, seed):
+    # 1000 lookups, half present and half absent
+    arr = gen.sorted_unique_array(n, seed)
+    present = gen.int_array(500, seed, 0, n)
+    targets = [arr[i] for i in present] + [arr[i] + 1 for i in present]
+    return lambda: [fn(arr, t) for t in targets]
+
+
+@case("sliding_window_max", "miscellaneous/some_algos.py:sliding_window_max")
+def bench_sliding_window_max(fn, n, seed):
+    # window k = sqrt(n): O(n*k) grows with exponent ~1.5, O(n) with ~1.0
+    arr = gen.int_array(n, seed)
+    k = max(1, math.isqrt(n))
+    return lambda: fn(arr, k)
+
+
+@case("two_pointers_pair_sum", "miscellaneous/some_algos.py:two_pointers_pair_sum")
+def bench_two_pointers_pair_sum(fn, n, seed):
+    # no pair sums to -1, so both pointers walk the whole array
+    arr = gen.sorted_unique_array(n, seed)
+    return lambda: fn(arr, -1)
+
+
+@case("dfs", "miscellaneous/some_algos.py:dfs")
+def bench_dfs(fn, n, seed):
+    # n counts edges; graphs keep an average out-degree of 4
+    adj = gen.random_graph(max(2, n // 4), n, seed)
+    return lambda: fn(adj, 0)
+
+
+@case("bfs", "miscellaneous/some_algos.py:bfs")
+def bench_bfs(fn, n, seed):
+    adj = gen.random_graph(max(2, n // 4), n, seed)
+    return lambda: fn(adj, 0)
+
+
+# some_cp_problems.py
+@case("problem_sum_pairs", "miscellaneous/some_cp_problems.py:problem_sum_pairs")
+def bench_problem_sum_pairs(fn, n, seed):
+    # all values are even, an odd target forces a full scan
+    arr = gen.distinct_array(n, seed)
+    return lambda: fn(arr, 1)
+
+
+@case("problem_max_subarray", "miscellaneous/some_cp_problems.py:problem_max_subarray")
+def bench_problem_max_subarray(fn, n, seed):
+    arr = gen.int_array(n, seed)
+    return lambda: fn(arr)
+
+
+@case("prefix_sum_query", "miscellaneous/some_cp_problems.py:prefix_sum_query")
+def bench_prefix_sum_query(fn, n, seed):
+    # 100 range queries against the same array
+    arr = gen.int_array(n, seed)
+    queries = gen.range_queries(n, 100, seed)
+    return lambda: [fn(arr, lo, hi) for lo, hi in queries]
+
+
+# O(n) engines under tutorials/miscellaneous/cp_dsa, measured on the same inputs
+@case("sliding_window_max_deque", "tutorials/miscellaneous/cp_dsa/sliding_window.py:sliding_window_max", where="repo")
+def bench_sliding_window_max_deque(fn, n, seed):
+    arr = gen.int_array(n, seed)
+    k = max(1, math.isqrt(n))
+    return lambda: fn(arr, k)
+
+
+@case("sliding_window_max_numpy", "tutorials/miscellaneous/cp_dsa/sliding_window.py:sliding_window_np", where="repo")
+def bench_sliding_window_max_numpy(fn, n, seed):
+    arr = np.asarray(gen.int_array(n, seed))
+    k = max(1, math.isqrt(n))
+    return lambda: fn(arr, k, "max")
+
+
+@case("prefix_sum_query_index", "tutorials/miscellaneous/cp_dsa/range_query.py:RangeQueryIndex", where="repo")
+def bench_prefix_sum_query_index(fn, n, seed):
+    # same 100 queries as prefix_sum_query; the build is included in the timing
+    arr = gen.int_array(n, seed)
+    lefts, rights = zip(*gen.range_queries(n, 100, seed))
+    return lambda: fn(arr).query_many(lefts, rights)
+
+
+@case("dfs_csr", "tutorials/miscellaneous/cp_dsa/csr_graph.py:CSRGraph", where="repo")
+def bench_dfs_csr(fn, n, seed):
+    # same graphs as dfs/bfs; the CSR build happens outside the timing
+    graph = fn.from_dict(gen.random_graph(max(2, n // 4), n, seed))
+    return lambda: graph.dfs_order(0)
+
+
+@case("bfs_csr", "tutorials/miscellaneous/cp_dsa/csr_graph.py:CSRGraph", where="repo")
+def bench_bfs_csr(fn, n, seed):
+    graph = fn.from_dict(gen.random_graph(max(2, n // 4), n, seed))
+    return lambda: graph.bfs_order(0)
+
+
+@case("pair_search_many", "tutorials/miscellaneous/cp_dsa/pair_search.py:two_sum_many", where="repo")
+def bench_pair_search_many(fn, n, seed):
+    # 1000 targets in one call: 500 sums of two elements, 500 odd (no pair)
+    arr = gen.distinct_array(n, seed)
+    picks = gen.int_array(1000, seed, 0, n)
+    targets = [arr[a] + arr[b] for a, b in zip(picks[:500], picks[500:]) if a != b]
+    targets += [2 * t + 1 for t in range(500)]
+    return lambda: fn(arr, targets)
+
+
+@case("coin_change_many", "tutorials/miscellaneous/cp_dsa/coin_change_engine.py:CoinChange", where="repo")
+def bench_coin_change_many(fn, n, seed):
+    # table build up to n plus 10k fewest-coins queries in one call
+    amounts = gen.int_array(10_000, seed, 0, n + 1)
+    return lambda: fn([1, 5, 10, 25, 50, 100], n).min_coins(amounts)
+
+
+@case("sudoku_validate_many", "tutorials/miscellaneous/cp_dsa/sudoku_engine.py:validate_many", where="repo")
+def bench_sudoku_validate_many(fn, n, seed):
+    # n boards: digit relabelings of one solved grid, half the cells blanked
+    rng = gen.rng_for(seed, n)
+    solved = np.array([(r * 3 + r // 3 + c) % 9 for r in range(9) for c in range(9)])
+    relabel = np.argsort(rng.random((n, 9)), axis=1).astype(np.uint8) + 1
+    boards = relabel[:, solved].reshape(n, 9, 9)
+    boards[rng.random((n, 9, 9)) < 0.5] = 0
+    return lambda: fn(boards)
+
+
+@case("array_linked_list", "tutorials/miscellaneous/cp_dsa/linked_containers.py:ArrayLinkedList", where="repo")
+def bench_array_linked_list(fn, n, seed):
+    # n single pushes, then 1000 reads, updates and deletes at random positions
+    values = gen.int_array(n, seed)
+    picks = gen.int_array(1000, seed, 0, n // 2)
+
+    def run():
+        ll = fn()
+        for v in values:
+            ll.push(v)
+        for i in picks:
+            ll.read(i)
+            ll.update(i, 0)
+            ll.delete(i)
+        return ll
+
+    return run
+
+
+@case("dijkstra_indexed_heap", "tutorials/miscellaneous/cp_dsa/indexed_heap.py:dijkstra", where="repo",
+      sizes=(1_000, 10_000, 100_000))
+def bench_dijkstra_indexed_heap(fn, n, seed):
+    # n nodes, 4n random weighted edges; one entry per node in the heap
+    from csr_graph import CSRGraph  # next to the target, which load_target put on sys.path
+
+    rng = gen.rng_for(seed, n)
+    src, dst = rng.integers(0, n, 4 * n), rng.integers(0, n, 4 * n)
+    graph = CSRGraph.from_edges(src, dst, n=n, weights=rng.random(4 * n))
+    return lambda: fn(graph, 0)
+
+
+@case("vigenere_encrypt_bytes", "tutorials/miscellaneous/cryptography/cipher_engine.py:vigenere_encrypt", where="repo")
+def bench_vigenere_encrypt_bytes(fn, n, seed):
+    # n bytes of mixed-case letters, spaces and punctuation
+    alphabet = np.frombuffer(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ    ,.", dtype=np.uint8)
+    data = alphabet[gen.rng_for(seed, n).integers(0, alphabet.size, n)].tobytes()
+    return lambda: fn(data, "LEMON")
+
+
+@case("crack_vigenere", "tutorials/miscellaneous/cryptography/cipher_cracker.py:crack", where="repo")
+def bench_crack_vigenere(fn, n, seed):
+    # n letters drawn with English frequencies, Vigenère-encrypted with a 7-letter key
+    from cipher_cracker import ENGLISH
+    from cipher_engine import vigenere_encrypt
+
+    letters = gen.rng_for(seed, n).choice(26, size=n, p=ENGLISH / ENGLISH.sum()).astype(np.uint8) + 97
+    data = vigenere_encrypt(letters.tobytes(), "WORKSHO")
+    return lambda: fn(data, plaintext=False)
+
+
+@case("sqlite_insert_many", "tutorials/miscellaneous/storage/sqlite_repository.py:ItemRepository", where="repo",
+      sizes=(1_000, 10_000, 100_000))
+def bench_sqlite_insert_many(fn, n, seed):
+    # n rows bulk-loaded into a fresh WAL database in one transaction
+    import tempfile
+
+    tmp = tempfile.TemporaryDirectory(prefix="bench_sqlite_")
+    rows = [(f"item-{k}", float(k % 1000)) for k in range(n)]
+    calls = iter(range(1 << 30))
+
+    def run():
+        repo = fn(Path(tmp.name) / f"items-{next(calls)}.db")
+        repo.init_db()
+        repo.insert_many(rows)
+        repo.close()
+
+    run.cleanup = tmp.cleanup
+    return run
+
+
+@case("cart_add_item", "tutorials/miscellaneous/storage/cart_journal.py:CartManager", where="repo",
+      sizes=(1_000, 10_000, 100_000))
+def bench_cart_add_item(fn, n, seed):
+    # n add_item calls spread over 100 journaled carts
+    import tempfile
+
+    rng = gen.rng_for(seed, n)
+    tmp = tempfile.TemporaryDirectory(prefix="bench_carts_")
+    ops = list(zip(rng.integers(0, 100, n).tolist(), rng.integers(1, 5, n).tolist(), rng.integers(1, 4, n).tolist()))
+    calls = iter(range(1 << 30))
+
+    def run():
+        directory = Path(tmp.name) / str(next(calls))
+        carts = [fn(f"user{k}", directory=directory) for k in range(100)]
+        for user, item_id, qty in ops:
+            carts[user].add_item(item_id, qty)
+
+    run.cleanup = tmp.cleanup
+    return run
+
+
+def run_cases(
+    names: List[str],
+    root: Path,
+    sizes: Optional[List[int]],
+    seed: int,
+    repeat: int,
+    track_memory: bool,
+    timeout: float,
+) -> List[Dict[str, Any]]:
+    """Run every named case over its sizes, skipping larger sizes after a timeout."""
+    results: List[Dict[str, Any]] = []
+    for name in names:
+        prev = None
+        for n in sizes or CASES[name]["sizes"]:
+            r = run_isolated(REGISTRY, name, root, n, seed, repeat, track_memory, timeout)
+            r["exponent"] = scaling_exponent(prev, r) if prev else None
+            results.append(r)
+            print(format_row(r), flush=True)
+            if r["status"] != "ok":
+                break
+            prev = r
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Attach baseline ratios; return results slower than tolerance x baseline."""
+    base = {(b["case"], b["n"]): b for b in baseline.get("results", []) if b.get("status") == "ok"}
+    regressions = []
+    for r in results:
+        b = base.get((r["case"], r["n"]))
+        if b is None or r["status"] != "ok":
+            continue
+        r["vs_baseline"] = r["best_s"] / b["best_s"] if b["best_s"] > 0 else None
+        if r["vs_baseline"] is not None and r["vs_baseline"] > tolerance:
+            regressions.append(r)
+    return regressions
+
+
+def format_row(r: Dict[str, Any]) -> str:
+    """Return one fixed-width report line."""
+    if r["status"] != "ok":
+        return f"{r['case']:<24}{r['n']:>11,}  {r['status'].upper()}: {r.get('error', '')}"
+    peak = f"{r['peak_bytes'] / 2**20:9.1f}" if r.get("peak_bytes") is not None else "        -"
+    exp = f"{r['exponent']:6.2f}" if r.get("exponent") is not None else "     -"
+    line = f"{r['case']:<24}{r['n']:>11,}{r['best_s'] * 1e3:12.2f}{r['mean_s'] * 1e3:12.2f}{peak}{exp}"
+    if r.get("vs_baseline") is not None:
+        line += f"{r['vs_baseline']:9.2f}x"
+    return line
+
+
+HEADER = f"{'case':<24}{'n':>11}{'best ms':>12}{'mean ms':>12}{'peak MB':>9}{'exp':>6}"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.algorithms", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--root", type=Path, default=PLAYGROUND, help="playground root to measure (default: test_playground)")
+    target.add_argument("--contributor", metavar="ID", help="measure SOLUTIONS/<ID>_solutions instead")
+    parser.add_argument("--cases", nargs="*", choices=sorted(CASES), help="cases to run (default: all)")
+    parser.add_argument("--sizes", nargs="*", type=int, help="input sizes, e.g. 1000 100000 10000000")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="input seed (same seed, same inputs)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size; the best is reported")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds allowed per case and size")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run used for peak memory")
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against a report saved earlier")
+    parser.add_argument("--save-baseline", type=Path, metavar="PATH", help="save this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="flag cases slower than this x baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    root = args.root
+    if args.contributor:
+        from grading.engine import discover_contributors
+
+        root = discover_contributors().get(args.contributor)
+        if root is None:
+            print(f"No playground found for contributor {args.contributor!r}")
+            return 1
+
+    print(f"Benchmarking {root} (seed={args.seed})")
+    print(HEADER)
+    results = run_cases(args.cases or list(CASES), root, args.sizes, args.seed, args.repeat,
+                        not args.no_memory, args.timeout)
+
+    report = {
+        "meta": {
+            "root": str(root),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        print()
+        print(f"Compared with {args.baseline} (tolerance {args.tolerance:g}x)")
+        print(HEADER + f"{'vs base':>10}")
+        for r in results:
+            print(format_row(r))
+        if regressions:
+            print(f"{len(regressions)} regression(s): " + ", ".join(f"{r['case']}@{r['n']:,}" for r in regressions))
+            status = 1
+        else:
+            print("No regressions.")
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            print("Report written to", path)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
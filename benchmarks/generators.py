@@ -0,0 +1,58 @@
+"""Seeded input generators for benchmarks.
+
+Every generator takes an explicit seed so a (seed, size) pair always
+produces the same input, on any machine.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def rng_for(seed: int, n: int) -> np.random.Generator:
+    """Return a generator seeded by both the run seed and the input size."""
+    return np.random.default_rng([seed, n])
+
+
+def int_array(n: int, seed: int, lo: int = -1000, hi: int = 1000) -> List[int]:
+    """Return n random ints in [lo, hi)."""
+    return rng_for(seed, n).integers(lo, hi, size=n).tolist()
+
+
+def sorted_unique_array(n: int, seed: int) -> List[int]:
+    """Return n strictly increasing ints with gaps >= 2, so x + 1 is never present."""
+    gaps = rng_for(seed, n).integers(2, 10, size=n)
+    return np.cumsum(gaps).tolist()
+
+
+def distinct_array(n: int, seed: int) -> List[int]:
+    """Return a random permutation of 2n, 2n+2, ... (even, distinct, positive)."""
+    return (rng_for(seed, n).permutation(n) * 2 + 2 * n).tolist()
+
+
+def random_graph(n_nodes: int, n_edges: int, seed: int) -> Dict[int, List[int]]:
+    """Return a directed random graph as adjacency lists over nodes 0..n_nodes-1.
+
+    Node 0 reaches every node through a random spanning path, so traversals
+    starting at 0 always visit the whole graph.
+    """
+    rng = rng_for(seed, n_edges)
+    order = rng.permutation(n_nodes)
+    order = order[order != 0]
+    chain_src = np.concatenate(([0], order[:-1]))
+    extra = max(0, n_edges - len(order))
+    src = np.concatenate((chain_src, rng.integers(0, n_nodes, size=extra)))
+    dst = np.concatenate((order, rng.integers(0, n_nodes, size=extra)))
+
+    adj: Dict[int, List[int]] = {i: [] for i in range(n_nodes)}
+    for u, v in zip(src.tolist(), dst.tolist()):
+        adj[u].append(v)
+    return adj
+
+
+def range_queries(n: int, q: int, seed: int) -> List[Tuple[int, int]]:
+    """Return q random inclusive (left, right) ranges inside [0, n)."""
+    rng = rng_for(seed, n + q)
+    a = rng.integers(0, n, size=q)
+    b = rng.integers(0, n, size=q)
+    return list(zip(np.minimum(a, b).tolist(), np.maximum(a, b).tolist()))
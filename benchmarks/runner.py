@@ -0,0 +1,114 @@
+"""Run one benchmark case in a child process and report time and memory.
+
+Each (case, size) pair gets its own process so a runaway implementation can
+be stopped with a timeout and peak memory is not polluted by earlier cases.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import importlib
+import importlib.util
+import json
+import math
+import multiprocessing
+import statistics
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_target(spec: str, root: Path) -> Callable[..., Any]:
+    """Load "rel/path.py:function" relative to root."""
+    rel_path, _, func_name = spec.partition(":")
+    path = (root / rel_path).resolve()
+    module_name = f"bench_{path.stem}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec_obj = importlib.util.spec_from_file_location(module_name, str(path))
+        module = importlib.util.module_from_spec(spec_obj)
+        sys.path.insert(0, str(path.parent))
+        sys.modules[module_name] = module
+        spec_obj.loader.exec_module(module)
+    return getattr(module, func_name)
+
+
+def measure(thunk: Callable[[], Any], repeat: int, track_memory: bool) -> Dict[str, Any]:
+    """Time `repeat` calls of thunk, then record peak traced memory of one more call."""
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        thunk()
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if track_memory:
+        # traced run is slower, so it is kept out of the timings above
+        tracemalloc.start()
+        thunk()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        "best_s": min(times),
+        "mean_s": statistics.fmean(times),
+        "peak_bytes": peak,
+    }
+
+
+def _child(conn, registry: str, case_name: str, root: str, n: int, seed: int, repeat: int, track_memory: bool) -> None:
+    # runs inside the child process; sends one JSON string back
+    try:
+        case = importlib.import_module(registry).CASES[case_name]
+        base = Path(root) if case["where"] == "playground" else REPO_ROOT
+        fn = load_target(case["target"], base)
+        thunk = case["prepare"](fn, n, seed)
+        try:
+            payload = {"status": "ok", **measure(thunk, repeat, track_memory)}
+        finally:
+            cleanup = getattr(thunk, "cleanup", None)  # e.g. removing scratch files, outside the timings
+            if cleanup is not None:
+                cleanup()
+    except BaseException as exc:  # report anything, including SystemExit from student code
+        payload = {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    conn.send(json.dumps(payload))
+    conn.close()
+
+
+def run_isolated(
+    registry: str,
+    case_name: str,
+    root: Path,
+    n: int,
+    seed: int,
+    repeat: int = 3,
+    track_memory: bool = True,
+    timeout: float = 30.0,
+) -> Dict[str, Any]:
+    """Run one case at size n in a child process, killing it after timeout seconds."""
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    proc = multiprocessing.Process(
+        target=_child,
+        args=(child_conn, registry, case_name, str(root), n, seed, repeat, track_memory),
+        daemon=True,
+    )
+    proc.start()
+    child_conn.close()
+    result: Dict[str, Any] = {"case": case_name, "n": n}
+    if parent_conn.poll(timeout):
+        try:
+            result.update(json.loads(parent_conn.recv()))
+        except EOFError:
+            result.update(status="error", error=f"child exited with code {proc.exitcode}")
+    else:
+        result.update(status="timeout", error=f"no result after {timeout:g}s")
+        proc.terminate()
+    proc.join(5)
+    return result
+
+
+def scaling_exponent(prev: Dict[str, Any], cur: Dict[str, Any]) -> Optional[float]:
+    """Return log(t2/t1) / log(n2/n1): ~1 for linear, ~2 for quadratic growth."""
+    if prev.get("status") != "ok" or cur.get("status") != "ok" or prev["best_s"] <= 0:
+        return None
+    return math.log(cur["best_s"] / prev["best_s"]) / math.log(cur["n"] / prev["n"])
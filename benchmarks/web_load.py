@@ -0,0 +1,559 @@
+"""Load-test the web_dev notes apps and the basic_flask_routing apps on localhost.
+
+Each target app is started in a child process: uvicorn for the FastAPI
+app, Werkzeug's threaded server for the Flask apps. It is loaded from a
+scratch copy of its directory, so the SQLite files it creates never touch
+the committed ones. After a seeding phase, an asyncio load generator in
+this process keeps `concurrency` keep-alive connections busy with a
+weighted mix of CRUD requests for `duration` seconds. The report gives
+RPS, latency percentiles and error rates per target, concurrency level
+and operation.
+
+    python -m benchmarks.web_load --targets notes_fastapi --concurrency 1 50 500
+    python -m benchmarks.web_load --save-baseline benchmarks/web_baseline.json
+    python -m benchmarks.web_load --baseline benchmarks/web_baseline.json
+
+The client speaks just enough HTTP/1.1 itself (Content-Length, chunked,
+close-delimited bodies). A full client library costs more CPU per
+request than the apps being measured. The client and the servers share
+the machine, so compare reports taken on the same machine.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.runner import REPO_ROOT
+
+PLAYGROUND = REPO_ROOT / "test_playground"
+DEFAULT_CONCURRENCY = (1, 50, 500)
+DEFAULT_DURATION = 10.0
+DEFAULT_WARMUP = 1.0
+DEFAULT_SEED_ROWS = 1000
+DEFAULT_SEED = 12345
+DEFAULT_TOLERANCE = 1.5
+HOST = "127.0.0.1"
+
+# method, path, headers, body
+Request = Tuple[str, str, Dict[str, str], bytes]
+
+WORDS = ("alpha", "beta", "gamma", "delta", "search", "notes", "sqlite", "cache", "index", "python")
+
+
+def form(**fields: str) -> Tuple[Dict[str, str], bytes]:
+    """Headers and body of an urlencoded form post."""
+    return {"Content-Type": "application/x-www-form-urlencoded"}, urlencode(fields).encode()
+
+
+def json_body(obj: Any) -> Tuple[Dict[str, str], bytes]:
+    """Headers and body of a JSON request."""
+    return {"Content-Type": "application/json"}, json.dumps(obj).encode()
+
+
+# --- workloads -------------------------------------------------------------------
+
+
+class Workload(ABC):
+    # seeding requests plus a weighted operation mix over the ids they created
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.stable: List[str] = []  # ids read and updated, never deleted
+        self.doomed: List[str] = []  # ids handed out once each to delete operations
+        self.ops: List[Tuple[str, float, Callable[[], Optional[Request]], Tuple[int, ...]]] = []
+
+    @abstractmethod
+    def seed_requests(self, rows: int) -> List[Request]:
+        """Requests that create the initial rows."""
+
+    @abstractmethod
+    def seeded(self, responses: List[Tuple[int, bytes]]) -> None:
+        """Record the ids created by seed_requests from their responses."""
+
+    def split_ids(self, ids: List[str]) -> None:
+        # the first half (at least one id) is kept for reads and updates, the rest may be deleted
+        if not ids:
+            raise RuntimeError("seeding created no rows")
+        half = (len(ids) + 1) // 2
+        self.stable, self.doomed = ids[:half], ids[half:]
+        self.rng.shuffle(self.doomed)
+
+    def add(self, name: str, weight: float, build: Callable[[], Optional[Request]], *expected: int) -> None:
+        self.ops.append((name, weight, build, expected))
+
+    def next(self) -> Tuple[str, Request, Tuple[int, ...]]:
+        """Pick the next operation; ones that cannot run any more (no ids left) are retried."""
+        weights = [op[1] for op in self.ops]
+        while True:
+            name, _, build, expected = self.rng.choices(self.ops, weights)[0]
+            request = build()
+            if request is not None:
+                return name, request, expected
+
+    def stable_id(self) -> str:
+        return self.rng.choice(self.stable)
+
+    def doomed_id(self) -> Optional[str]:
+        return self.doomed.pop() if self.doomed else None
+
+
+class NotesWorkload(Workload):
+    # notes_app_fastapi / notes_app_flask: page views, search, add, update, delete
+    def __init__(self, rng: random.Random, field: str):
+        super().__init__(rng)
+        self.field = field
+        redirect = (302, 303)
+        self.add("list", 55, lambda: ("GET", "/", {}, b""), 200)
+        self.add("page", 10, lambda: ("GET", f"/?before={self.stable_id()}", {}, b""), 200)
+        self.add("search", 10, lambda: ("GET", f"/search?q={quote(self.rng.choice(WORDS))}", {}, b""), 200)
+        self.add("add", 10, lambda: ("POST", "/add", *form(**{self.field: self.text()})), *redirect)
+        self.add("update", 10, lambda: ("POST", f"/update/{self.stable_id()}", *form(**{self.field: self.text()})),
+                 *redirect)
+        self.add("delete", 5, self.delete, *redirect)
+
+    def text(self) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(6))
+
+    def delete(self) -> Optional[Request]:
+        note_id = self.doomed_id()
+        return None if note_id is None else ("POST", f"/delete/{note_id}", {}, b"")
+
+    def seed_requests(self, rows: int) -> List[Request]:
+        return [("POST", "/add", *form(**{self.field: self.text()})) for _ in range(rows)]
+
+    def seeded(self, responses: List[Tuple[int, bytes]]) -> None:
+        # the scratch database starts empty, so the seeded notes are ids 1..rows
+        self.split_ids([str(k) for k in range(1, len(responses) + 1)])
+
+
+class ItemsWorkload(Workload):
+    # basic_flask_routing: list, get, create, update, delete items
+    def __init__(self, rng: random.Random):
+        super().__init__(rng)
+        self.add("list", 35, lambda: ("GET", "/items", {}, b""), 200)
+        self.add("get", 30, lambda: ("GET", f"/items/{self.stable_id()}", {}, b""), 200)
+        self.add("create", 15, lambda: ("POST", "/items", *json_body(self.item())), 200, 201)
+        self.add("update", 15, lambda: ("PUT", f"/items/{self.stable_id()}", *json_body({"qty": self.rng.randrange(100)})),
+                 200)
+        self.add("delete", 5, self.delete, 200, 204)
+
+    def item(self) -> Dict[str, Any]:
+        return {"name": self.rng.choice(WORDS), "qty": self.rng.randrange(100)}
+
+    def delete(self) -> Optional[Request]:
+        item_id = self.doomed_id()
+        return None if item_id is None else ("DELETE", f"/items/{item_id}", {}, b"")
+
+    def seed_requests(self, rows: int) -> List[Request]:
+        return [("POST", "/items", *json_body(self.item())) for _ in range(rows)]
+
+    def seeded(self, responses: List[Tuple[int, bytes]]) -> None:
+        ids = []
+        for status, body in responses:
+            if status in (200, 201):
+                ids.append(str(json.loads(body)["id"]))
+        self.split_ids(list(dict.fromkeys(ids)))  # colliding ids (a known playground bug) count once
+
+
+# target name -> {"target", "where", "server", "factory", "workload"}
+TARGETS: Dict[str, Dict[str, Any]] = {}
+
+
+def target(name: str, spec: str, server: str, where: str = "repo", factory: bool = False,
+           workload: Callable[[random.Random], Workload] = ItemsWorkload) -> None:
+    """Register an app: "rel/path.py:attr" (an app, or a factory when factory=True) served by "asgi" or "wsgi"."""
+    TARGETS[name] = {"target": spec, "where": where, "server": server, "factory": factory, "workload": workload}
+
+
+target("notes_fastapi", "tutorials/miscellaneous/web_dev/notes_app_fastapi.py:app", "asgi",
+       workload=lambda rng: NotesWorkload(rng, "note"))
+target("notes_flask", "tutorials/miscellaneous/web_dev/notes_app_flask.py:app", "wsgi",
+       workload=lambda rng: NotesWorkload(rng, "note_content"))
+target("basic_flask_routing", "miscellaneous/basic_flask_routing.py:create_app", "wsgi", where="playground",
+       factory=True)
+target("sharded_flask_routing", "tutorials/miscellaneous/storage/sharded_store.py:create_app", "wsgi", factory=True)
+
+
+# --- server side (child process) --------------------------------------------------
+
+
+def load_app(spec: str, root: Path, scratch: Path, factory: bool) -> Any:
+    """Import an app from a scratch copy of its directory (its databases are created there)."""
+    rel_path, _, attr = spec.partition(":")
+    src = (root / rel_path).resolve()
+    for path in src.parent.glob("*.py"):
+        shutil.copy2(path, scratch / path.name)
+    os.chdir(scratch)
+    sys.path.insert(0, str(scratch))
+    module_spec = importlib.util.spec_from_file_location(f"load_{src.stem}", str(scratch / src.name))
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    app = getattr(module, attr)
+    return app() if factory else app
+
+
+def _serve(conn, name: str, root: str) -> None:
+    # child process: load the app, bind a free port, report it, serve until terminated
+    info = TARGETS[name]
+    try:
+        with tempfile.TemporaryDirectory(prefix=f"web_load_{name}_") as scratch:
+            base = Path(root) if info["where"] == "playground" else REPO_ROOT
+            app = load_app(info["target"], base, Path(scratch), info["factory"])
+            if info["server"] == "asgi":
+                import uvicorn
+
+                sock = socket.socket()
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                # uvicorn sets TCP_NODELAY on sockets it binds itself; accepted sockets inherit it from here.
+                # Without it, the response body waits behind the headers for a delayed ACK (~40 ms).
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.bind((HOST, 0))
+                config = uvicorn.Config(app, log_level="warning", access_log=False, backlog=4096)
+                conn.send(("ready", sock.getsockname()[1]))
+                uvicorn.Server(config).run(sockets=[sock])
+            else:
+                from werkzeug.serving import make_server
+
+                logging.getLogger("werkzeug").setLevel(logging.ERROR)
+                server = make_server(HOST, 0, app, threaded=True)
+                server.socket.listen(4096)  # the default backlog of 128 drops connects at high concurrency
+                conn.send(("ready", server.server_port))
+                server.serve_forever()
+    except BaseException as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+class Server:
+    # one app in a child process, started by __enter__ and killed by __exit__
+    def __init__(self, name: str, root: Path, timeout: float = 60.0):
+        self.name, self.root, self.timeout = name, root, timeout
+        self.port = 0
+
+    def __enter__(self) -> "Server":
+        parent, child = multiprocessing.Pipe(duplex=False)
+        self.proc = multiprocessing.Process(target=_serve, args=(child, self.name, str(self.root)), daemon=True)
+        self.proc.start()
+        child.close()
+        if not parent.poll(self.timeout):
+            self.__exit__()
+            raise RuntimeError(f"{self.name}: no answer from the server process after {self.timeout:g}s")
+        status, value = parent.recv()
+        if status != "ready":
+            self.__exit__()
+            raise RuntimeError(f"{self.name}: {value}")
+        self.port = value
+        deadline = time.monotonic() + self.timeout
+        while True:  # the port is known before the server listens on it
+            try:
+                socket.create_connection((HOST, self.port), timeout=1).close()
+                return self
+            except OSError:
+                if time.monotonic() > deadline:
+                    self.__exit__()
+                    raise RuntimeError(f"{self.name}: port {self.port} never accepted a connection")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc: Any) -> None:
+        self.proc.terminate()
+        self.proc.join(5)
+
+
+# --- client side ------------------------------------------------------------------
+
+
+class HttpConnection:
+    # one keep-alive HTTP/1.1 connection, reopened after errors or "Connection: close"
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+        """Send one request and read the whole response; returns (status, body)."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+        reader = self.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("server closed the connection")
+        version, status = status_line.split(None, 2)[:2]
+        status = int(status)
+        length, chunked = None, False
+        keep_alive = version == b"HTTP/1.1"
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.partition(b":")
+            key, value = key.strip().lower(), value.strip().lower()
+            if key == b"content-length":
+                length = int(value)
+            elif key == b"transfer-encoding":
+                chunked = b"chunked" in value
+            elif key == b"connection":
+                keep_alive = value == b"keep-alive" or (keep_alive and value != b"close")
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            data = b""
+        elif chunked:
+            parts = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                parts.append(await reader.readexactly(size + 2))
+            data = b"".join(p[:-2] for p in parts)
+        elif length is not None:
+            data = await reader.readexactly(length)
+        else:
+            data, keep_alive = await reader.read(), False
+        if not keep_alive:
+            await self.close()
+        return status, data
+
+
+async def _seed(port: int, requests: List[Request], concurrency: int = 8) -> List[Tuple[int, bytes]]:
+    # send the seeding requests in order over a few connections; responses come back in request order
+    results: List[Tuple[int, bytes]] = [(0, b"")] * len(requests)
+    cursor = iter(range(len(requests)))
+
+    async def worker() -> None:
+        conn = HttpConnection(HOST, port)
+        for k in cursor:
+            results[k] = await conn.request(*requests[k])
+        await conn.close()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+async def _drive(port: int, workload: Workload, concurrency: int, duration: float, warmup: float,
+                 request_timeout: float) -> List[Tuple[str, float, Optional[int], bool]]:
+    # closed loop: every client sends its next request as soon as the previous one is answered
+    samples: List[Tuple[str, float, Optional[int], bool]] = []
+    start = time.perf_counter()
+    measure_from, stop = start + warmup, start + warmup + duration
+
+    async def client() -> None:
+        conn = HttpConnection(HOST, port)
+        while True:
+            t0 = time.perf_counter()
+            if t0 >= stop:
+                break
+            name, request, expected = workload.next()
+            try:
+                status, _ = await asyncio.wait_for(conn.request(*request), request_timeout)
+            except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                status = None
+                await conn.close()
+            if t0 >= measure_from:
+                samples.append((name, time.perf_counter() - t0, status, status in expected))
+        await conn.close()
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return samples
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty one)."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))]
+
+
+def summarize(samples: List[Tuple[str, float, Optional[int], bool]], duration: float) -> Dict[str, Any]:
+    """RPS, latency percentiles (ms) and error counts, overall and per operation."""
+
+    def stats(rows: List[Tuple[str, float, Optional[int], bool]]) -> Dict[str, Any]:
+        lat = sorted(r[1] for r in rows)
+        errors = sum(1 for r in rows if not r[3])
+        statuses: Dict[str, int] = {}
+        for r in rows:
+            key = str(r[2]) if r[2] is not None else "error"
+            statuses[key] = statuses.get(key, 0) + 1
+        return {
+            "requests": len(rows),
+            "rps": len(rows) / duration,
+            "p50_ms": percentile(lat, 50) * 1e3,
+            "p95_ms": percentile(lat, 95) * 1e3,
+            "p99_ms": percentile(lat, 99) * 1e3,
+            "max_ms": (lat[-1] if lat else 0.0) * 1e3,
+            "errors": errors,
+            "error_rate": errors / len(rows) if rows else 0.0,
+            "statuses": dict(sorted(statuses.items())),
+        }
+
+    by_op: Dict[str, List[Tuple[str, float, Optional[int], bool]]] = {}
+    for row in samples:
+        by_op.setdefault(row[0], []).append(row)
+    return {**stats(samples), "ops": {name: stats(rows) for name, rows in sorted(by_op.items())}}
+
+
+def run_target(name: str, root: Path, concurrency: int, duration: float, warmup: float, seed_rows: int,
+               seed: int, request_timeout: float) -> Dict[str, Any]:
+    """Boot one app, seed it, load it at one concurrency level and summarize."""
+    result: Dict[str, Any] = {"target": name, "concurrency": concurrency, "duration_s": duration}
+    try:
+        with Server(name, root) as server:
+            workload = TARGETS[name]["workload"](random.Random(seed))
+            responses = asyncio.run(_seed(server.port, workload.seed_requests(seed_rows)))
+            workload.seeded(responses)
+            samples = asyncio.run(_drive(server.port, workload, concurrency, duration, warmup, request_timeout))
+        result.update(status="ok", **summarize(samples, duration))
+    except Exception as exc:
+        result.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    return result
+
+
+# --- reporting ----------------------------------------------------------------------
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Attach baseline ratios; return runs with RPS below base/tolerance or p99 above base*tolerance."""
+    base = {(b["target"], b["concurrency"]): b for b in baseline.get("results", []) if b.get("status") == "ok"}
+    regressions = []
+    for r in results:
+        b = base.get((r["target"], r["concurrency"]))
+        if b is None or r["status"] != "ok" or not b["rps"] or not b["p99_ms"]:
+            continue
+        r["rps_vs_baseline"] = r["rps"] / b["rps"]
+        r["p99_vs_baseline"] = r["p99_ms"] / b["p99_ms"]
+        if r["rps_vs_baseline"] < 1 / tolerance or r["p99_vs_baseline"] > tolerance:
+            regressions.append(r)
+    return regressions
+
+
+def format_row(r: Dict[str, Any]) -> str:
+    """Return one fixed-width report line."""
+    if r["status"] != "ok":
+        return f"{r['target']:<22}{r['concurrency']:>6}  {r['status'].upper()}: {r.get('error', '')}"
+    line = (f"{r['target']:<22}{r['concurrency']:>6}{r['requests']:>10,}{r['rps']:>10.1f}"
+            f"{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['error_rate'] * 100:>8.2f}%")
+    if r.get("rps_vs_baseline") is not None:
+        line += f"{r['rps_vs_baseline']:>9.2f}x{r['p99_vs_baseline']:>8.2f}x"
+    return line
+
+
+HEADER = f"{'target':<22}{'conc':>6}{'requests':>10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>9}"
+
+
+def git_revision() -> Optional[str]:
+    """HEAD commit of the repository, if git is available."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.web_load", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--root", type=Path, default=PLAYGROUND, help="playground root for playground apps")
+    where.add_argument("--contributor", metavar="ID", help="load playground apps from SOLUTIONS/<ID>_solutions")
+    parser.add_argument("--targets", nargs="*", choices=sorted(TARGETS), help="apps to load (default: all)")
+    parser.add_argument("--concurrency", nargs="*", type=int, help=f"open connections (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="measured seconds per run")
+    parser.add_argument("--warmup", type=float, default=DEFAULT_WARMUP, help="unmeasured seconds before that")
+    parser.add_argument("--seed-rows", type=int, default=DEFAULT_SEED_ROWS, help="rows created before the run")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="workload seed (same seed, same request mix)")
+    parser.add_argument("--request-timeout", type=float, default=30.0, help="seconds before a request counts as failed")
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against a report saved earlier")
+    parser.add_argument("--save-baseline", type=Path, metavar="PATH", help="save this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="flag runs with RPS below 1/x or p99 above x times the baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    root = args.root
+    if args.contributor:
+        from grading.engine import discover_contributors
+
+        root = discover_contributors().get(args.contributor)
+        if root is None:
+            print(f"No playground found for contributor {args.contributor!r}")
+            return 1
+
+    print(f"Load testing on {HOST} ({args.duration:g}s per run, seed={args.seed})")
+    print(HEADER)
+    results = []
+    for name in args.targets or list(TARGETS):
+        for concurrency in args.concurrency or DEFAULT_CONCURRENCY:
+            r = run_target(name, root, concurrency, args.duration, args.warmup, args.seed_rows, args.seed,
+                           args.request_timeout)
+            results.append(r)
+            print(format_row(r), flush=True)
+
+    report = {
+        "meta": {
+            "root": str(root),
+            "commit": git_revision(),
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed_rows": args.seed_rows,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        print()
+        print(f"Compared with {args.baseline} (tolerance {args.tolerance:g}x)")
+        print(HEADER + f"{'rps/base':>10}{'p99/base':>9}")
+        for r in results:
+            print(format_row(r))
+        if regressions:
+            print(f"{len(regressions)} regression(s): " + ", ".join(f"{r['target']}@{r['concurrency']}" for r in regressions))
+            status = 1
+        else:
+            print("No regressions.")
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            print("Report written to", path)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
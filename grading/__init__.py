@@ -0,0 +1,6 @@
+"""Grade contributor copies of test_playground against reference checks.
+
+Run from the repository root:
+
+    python -m grading --help
+"""
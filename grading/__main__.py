@@ -0,0 +1,72 @@
+"""Command line entry point: python -m grading"""
+
+from pathlib import Path
+from typing import List, Optional
+import argparse
+import time
+
+from grading import engine
+from grading.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_ENTRIES, ResultCache
+from grading.incremental import incremental_tasks
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m grading", description=__doc__)
+    parser.add_argument("--solutions", type=Path, default=engine.SOLUTIONS_DIR, help="folder holding <id>_solutions trees")
+    parser.add_argument("--only", nargs="*", metavar="ID", help="grade only these contributor ids")
+    parser.add_argument("--module", nargs="*", metavar="REL_PATH", help="grade only these modules, e.g. miscellaneous/some_algos.py")
+    parser.add_argument(
+        "--changed",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="RANGE",
+        help="regrade only files changed in the working tree, or in a git range such as origin/main...HEAD",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=engine.DEFAULT_TIMEOUT, help="seconds allowed per module")
+    parser.add_argument("--no-cache", action="store_true", help="re-run every module even if an identical copy was graded before")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="where cached results are stored")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES, help="max cached results kept (least recently used dropped first)")
+    parser.add_argument("--json", type=Path, default=None, help="write full results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    contributors = engine.discover_contributors(args.solutions)
+    if args.only:
+        contributors = {cid: p for cid, p in contributors.items() if cid in set(args.only)}
+    if not contributors:
+        print(f"No <id>_solutions folders found in {args.solutions}")
+        return 1
+
+    if args.changed is None:
+        tasks = engine.build_tasks(contributors, args.module)
+    else:
+        tasks = incremental_tasks(contributors, args.solutions, args.changed or None)
+        if args.module:
+            tasks = [t for t in tasks if t["module"] in set(args.module)]
+        if not tasks:
+            print("No graded files changed. Nothing to regrade.")
+            return 0
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size)
+    start = time.perf_counter()
+    results = engine.grade(tasks, workers=args.workers, timeout=args.timeout, cache=cache)
+    elapsed = time.perf_counter() - start
+
+    print(engine.format_matrix(results))
+    print()
+    graded_ids = {r["contributor"] for r in results}
+    print(f"Graded {len(results)} modules for {len(graded_ids)} contributors in {elapsed:.2f}s: {engine.summarize(results)}")
+    executed = sum(1 for r in results if not r.get("cached") and r["status"] != "missing")
+    reused = sum(1 for r in results if r.get("cached"))
+    print(f"Executed {executed} unique module versions, reused {reused} results")
+    if args.json:
+        print("Report written to", engine.write_report(results, args.json))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
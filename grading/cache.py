@@ -0,0 +1,113 @@
+"""Content-addressed on-disk cache of grading results.
+
+Most contributor files are byte-identical to test_playground, so a result is
+keyed on what the worker actually sees: the module source, the asset files
+it reads and the reference checks it is graded against. Identical inputs
+are executed once and every other copy reuses the stored result.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import inspect
+import json
+import os
+
+from grading.reference_checks import ASSET_INPUTS, CHECKS
+
+CACHE_VERSION = "1"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".grading_cache"
+DEFAULT_MAX_ENTRIES = 5000
+
+# statuses worth remembering; a timeout may just mean a busy machine
+CACHEABLE_STATUSES = ("pass", "fail", "error")
+
+_fingerprints: Dict[str, str] = {}
+
+
+def checks_fingerprint(rel_path: str) -> str:
+    """Return a hash of the reference check sources for one module."""
+    if rel_path not in _fingerprints:
+        h = hashlib.sha256()
+        for fn in CHECKS.get(rel_path, []):
+            h.update(inspect.getsource(fn).encode("utf-8"))
+        _fingerprints[rel_path] = h.hexdigest()
+    return _fingerprints[rel_path]
+
+
+def task_key(task: Dict[str, Any]) -> Optional[str]:
+    """Return the SHA-256 cache key for a task, or None if the module is missing."""
+    playground: Path = task["playground"]
+    rel_path: str = task["module"]
+    source = playground / rel_path
+    if not source.is_file():
+        return None
+
+    h = hashlib.sha256()
+    h.update(f"grading-cache-v{CACHE_VERSION}\0{rel_path}\0".encode("utf-8"))
+    h.update(checks_fingerprint(rel_path).encode("ascii"))
+    h.update(source.read_bytes())
+    for name in ASSET_INPUTS.get(rel_path, []):
+        asset = playground / "assets" / name
+        h.update(f"\0{name}\0".encode("utf-8"))
+        h.update(asset.read_bytes() if asset.is_file() else b"<missing>")
+    return h.hexdigest()
+
+
+class ResultCache:
+    # one JSON file per key; file mtime doubles as the LRU clock
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for key and mark it recently used."""
+        path = self._path(key)
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """Store a result unless its status is not cacheable."""
+        if result.get("status") not in CACHEABLE_STATUSES:
+            return False
+        stored = {k: v for k, v in result.items() if k not in ("contributor", "elapsed", "cached")}
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(stored), encoding="utf-8")
+        os.replace(tmp, path)
+        return True
+
+    def evict(self) -> int:
+        """Drop least recently used entries above max_entries; return count removed."""
+        if not self.root.is_dir():
+            return 0
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        return excess
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        for path in self.root.glob("*/*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,188 @@
+"""Discover SOLUTIONS/<id>_solutions trees and grade them in parallel."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import json
+import os
+import subprocess
+import sys
+import time
+
+from grading.cache import ResultCache, task_key
+from grading.reference_checks import CHECKS
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SOLUTIONS_DIR = REPO_ROOT / "SOLUTIONS"
+PLAYGROUND_DIRS = ("basics", "intermediate", "advanced", "miscellaneous")
+DEFAULT_TIMEOUT = 10.0
+
+
+def find_playground(solution_dir: Path) -> Optional[Path]:
+    """Return the test_playground root inside one contributor folder."""
+    # most contributors copied test_playground as a whole, a few copied its contents
+    for candidate in (solution_dir / "test_playground", solution_dir):
+        if any((candidate / name).is_dir() for name in PLAYGROUND_DIRS):
+            return candidate
+    return None
+
+
+def discover_contributors(solutions_dir: Path = SOLUTIONS_DIR) -> Dict[str, Path]:
+    """Map contributor id -> playground root for every <id>_solutions folder."""
+    found: Dict[str, Path] = {}
+    if not solutions_dir.is_dir():
+        return found
+    for entry in sorted(solutions_dir.iterdir(), key=lambda p: p.name.lower()):
+        if not entry.is_dir() or not entry.name.endswith("_solutions"):
+            continue
+        playground = find_playground(entry)
+        if playground is not None:
+            found[entry.name[: -len("_solutions")]] = playground
+    return found
+
+
+def build_tasks(contributors: Dict[str, Path], modules: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """Return one grading task per (contributor, module) pair."""
+    selected = sorted(modules) if modules is not None else sorted(CHECKS)
+    return [
+        {"contributor": cid, "playground": playground, "module": rel}
+        for cid, playground in contributors.items()
+        for rel in selected
+    ]
+
+
+def _task_result(task: Dict[str, Any], status: str, error: Optional[str] = None) -> Dict[str, Any]:
+    # result record for tasks that never produced worker output
+    return {
+        "contributor": task["contributor"],
+        "module": task["module"],
+        "status": status,
+        "passed": 0,
+        "total": len(CHECKS.get(task["module"], [])),
+        "failures": {},
+        "error": error,
+    }
+
+
+def run_task(task: Dict[str, Any], timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """Grade one module in a fresh interpreter and return its result record."""
+    if not (task["playground"] / task["module"]).is_file():
+        return _task_result(task, "missing")
+
+    cmd = [sys.executable, "-m", "grading.worker", str(task["playground"]), task["module"]]
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", MPLBACKEND="Agg")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            cmd,
+            cwd=str(REPO_ROOT),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        result = _task_result(task, "timeout", f"no result after {timeout:g}s")
+        result["elapsed"] = round(time.perf_counter() - start, 4)
+        return result
+
+    lines = proc.stdout.strip().splitlines()
+    try:
+        result = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        tail = (proc.stderr.strip().splitlines() or [f"worker exited with code {proc.returncode}"])[-1]
+        result = _task_result(task, "error", tail)
+    result["contributor"] = task["contributor"]
+    result["elapsed"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def grade(
+    tasks: List[Dict[str, Any]],
+    workers: Optional[int] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    cache: Optional[ResultCache] = None,
+) -> List[Dict[str, Any]]:
+    """Run all tasks with up to `workers` concurrent worker processes.
+
+    With a cache, tasks are grouped by content hash first: each unique
+    (module source, asset inputs, checks) version runs at most once and its
+    result is shared by every contributor holding an identical copy.
+    """
+    workers = workers or os.cpu_count() or 1
+    if cache is None:
+        groups = {str(i): [task] for i, task in enumerate(tasks)}
+    else:
+        groups = {}
+        for i, task in enumerate(tasks):
+            groups.setdefault(task_key(task) or f"missing:{i}", []).append(task)
+
+    results: List[Dict[str, Any]] = []
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    for key, group in groups.items():
+        stored = cache.get(key) if cache is not None and not key.startswith("missing:") else None
+        if stored is None:
+            pending[key] = group
+            continue
+        for task in group:
+            results.append(dict(stored, contributor=task["contributor"], cached=True, elapsed=0.0))
+
+    def run_group(key: str) -> None:
+        group = pending[key]
+        first = run_task(group[0], timeout)
+        if cache is not None and not key.startswith("missing:"):
+            cache.put(key, first)
+        results.append(first)
+        for task in group[1:]:
+            results.append(dict(first, contributor=task["contributor"], cached=True, elapsed=0.0))
+
+    # threads only wait on child processes, so the GIL is not a bottleneck here
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run_group, list(pending)))
+    if cache is not None:
+        cache.evict()
+    return sorted(results, key=lambda r: (r["contributor"].lower(), r["module"]))
+
+
+def _cell(result: Dict[str, Any]) -> str:
+    # compact matrix cell text
+    status = result["status"]
+    if status == "missing":
+        return "-"
+    if status == "timeout":
+        return "T/O"
+    if status == "error":
+        return "ERR"
+    return f"{result['passed']}/{result['total']}"
+
+
+def format_matrix(results: List[Dict[str, Any]]) -> str:
+    """Return a contributor x module text table of results."""
+    modules = sorted({r["module"] for r in results})
+    headers = [Path(m).stem for m in modules]
+    by_contributor: Dict[str, Dict[str, str]] = {}
+    for r in results:
+        by_contributor.setdefault(r["contributor"], {})[r["module"]] = _cell(r)
+
+    name_width = max([len("contributor")] + [len(c) for c in by_contributor])
+    widths = [max(len(h), 5) for h in headers]
+    lines = ["  ".join(["contributor".ljust(name_width)] + [h.ljust(w) for h, w in zip(headers, widths)])]
+    for cid, cells in by_contributor.items():
+        row = [cells.get(m, "").ljust(w) for m, w in zip(modules, widths)]
+        lines.append("  ".join([cid.ljust(name_width)] + row))
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Count results per status."""
+    counts: Dict[str, int] = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    return counts
+
+
+def write_report(results: List[Dict[str, Any]], path: Path) -> Path:
+    """Write the full result records as JSON."""
+    path.write_text(json.dumps({"summary": summarize(results), "results": results}, indent=2), encoding="utf-8")
+    return path
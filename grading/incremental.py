@@ -0,0 +1,96 @@
+"""Select only the grading tasks affected by a git diff.
+
+A changed SOLUTIONS/<id>_solutions module is regraded for that contributor.
+A changed asset file regrades every module that lists it in ASSET_INPUTS:
+for that contributor when it lives in their tree, for everyone when it is
+one of the shared test_playground/assets files.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+import subprocess
+
+from grading.reference_checks import ASSET_INPUTS, CHECKS
+from my_dir_setup import find_git_root
+
+
+def _git_paths(git_root: Path, *args: str) -> List[str]:
+    # run a git command that prints NUL-separated paths relative to git_root
+    out = subprocess.check_output(["git", *args, "-z"], cwd=str(git_root), stderr=subprocess.DEVNULL)
+    return [p for p in out.decode("utf-8").split("\0") if p]
+
+
+def changed_paths(git_root: Path, rev_range: Optional[str] = None) -> List[Path]:
+    """Return absolute paths changed in rev_range, or in the working tree vs HEAD."""
+    if rev_range:
+        rel = _git_paths(git_root, "diff", "--name-only", rev_range)
+    else:
+        rel = _git_paths(git_root, "diff", "--name-only", "HEAD")
+        rel += _git_paths(git_root, "ls-files", "--others", "--exclude-standard")
+    return sorted({git_root / p for p in rel})
+
+
+def modules_using_asset(name: str) -> List[str]:
+    """Return checked modules whose results depend on assets/<name>."""
+    return sorted(rel for rel, assets in ASSET_INPUTS.items() if name in assets)
+
+
+def _under(path: Path, root: Path) -> Optional[Path]:
+    # relative path of `path` inside `root`, or None
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return None
+
+
+def affected_tasks(
+    paths: List[Path],
+    contributors: Dict[str, Path],
+    solutions_dir: Path,
+    shared_assets: Path,
+) -> List[Dict[str, Any]]:
+    """Map changed file paths to (contributor, module) grading tasks."""
+    solutions_dir = solutions_dir.resolve()
+    shared_assets = shared_assets.resolve()
+    wanted: Set[Tuple[str, str]] = set()
+
+    for path in paths:
+        path = path.resolve()
+        rel = _under(path, shared_assets)
+        if rel is not None:
+            for module in modules_using_asset(rel.as_posix()):
+                wanted.update((cid, module) for cid in contributors)
+            continue
+
+        rel = _under(path, solutions_dir)
+        if rel is None or not rel.parts or not rel.parts[0].endswith("_solutions"):
+            continue
+        cid = rel.parts[0][: -len("_solutions")]
+        playground = contributors.get(cid)
+        inner = _under(path, playground.resolve()) if playground is not None else None
+        if inner is None:
+            continue
+        inner_posix = inner.as_posix()
+        if inner_posix in CHECKS:
+            wanted.add((cid, inner_posix))
+        elif inner.parts[0] == "assets" and len(inner.parts) > 1:
+            for module in modules_using_asset(Path(*inner.parts[1:]).as_posix()):
+                wanted.add((cid, module))
+
+    return [
+        {"contributor": cid, "playground": contributors[cid], "module": module}
+        for cid, module in sorted(wanted, key=lambda cm: (cm[0].lower(), cm[1]))
+    ]
+
+
+def incremental_tasks(
+    contributors: Dict[str, Path],
+    solutions_dir: Path,
+    rev_range: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Return grading tasks for files changed in rev_range (default: working tree)."""
+    git_root = find_git_root(solutions_dir)
+    if git_root is None:
+        raise RuntimeError(f"{solutions_dir} is not within a git repository")
+    paths = changed_paths(git_root, rev_range)
+    return affected_tasks(paths, contributors, solutions_dir, git_root / "test_playground" / "assets")
@@ -0,0 +1,501 @@
+"""Reference assertions for the importable test_playground exercises."""
+
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List
+import json
+
+Check = Callable[[ModuleType], None]
+
+# module path relative to a playground root -> ordered list of checks
+CHECKS: Dict[str, List[Check]] = {}
+
+# asset files (under <playground>/assets) whose contents can change a module's result
+ASSET_INPUTS: Dict[str, List[str]] = {
+    "intermediate/boss.py": ["bills.csv", "cart_grader.json"],
+    "intermediate/sql_handler.py": ["workshop.db"],
+    "miscellaneous/ciphers.py": ["cipher_cases.json"],
+    "miscellaneous/some_cp_problems.py": ["cp_tests.json"],
+    "miscellaneous/some_data_structures.py": ["ds_sequences.json"],
+}
+
+
+def check(rel_path: str) -> Callable[[Check], Check]:
+    """Register a reference check for one playground module."""
+
+    def register(fn: Check) -> Check:
+        CHECKS.setdefault(rel_path, []).append(fn)
+        return fn
+
+    return register
+
+
+# intermediate/class_basics.py
+@check("intermediate/class_basics.py")
+def rectangle(m: ModuleType) -> None:
+    r = m.Rectangle(5, 3)
+    assert r.area() == 15, f"area() -> {r.area()}"
+    assert r.perimeter() == 16, f"perimeter() -> {r.perimeter()}"
+
+
+@check("intermediate/class_basics.py")
+def bank_account(m: ModuleType) -> None:
+    acc = m.BankAccount("Ada", 100.0)
+    assert acc.deposit(50) == 150.0
+    assert acc.withdraw(20) == 130.0, "withdraw should subtract"
+    assert acc.withdraw(130) == 0.0, "withdrawing full balance should be allowed"
+    try:
+        acc.deposit(0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("zero deposit should raise ValueError")
+
+
+@check("intermediate/class_basics.py")
+def counter(m: ModuleType) -> None:
+    c = m.Counter(10)
+    assert c.value == 10, "start argument is ignored"
+    assert c.increment() == 11
+    assert c.increment(4) == 15
+    c.reset()
+    assert c.value == 0
+
+
+# intermediate/dict_ops.py
+@check("intermediate/dict_ops.py")
+def invert_dict(m: ModuleType) -> None:
+    assert m.invert_dict({"a": 1, "b": 2, 0: 7}) == {1: "a", 2: "b", 7: 0}
+
+
+@check("intermediate/dict_ops.py")
+def merge_dicts(m: ModuleType) -> None:
+    assert m.merge_dicts([{"x": 1}, {"y": 2}, {"x": 9}]) == {"x": 9, "y": 2}
+
+
+@check("intermediate/dict_ops.py")
+def count_keys_with_prefix(m: ModuleType) -> None:
+    sample = {"pre_name": "A", "pre_age": 20, "city": "BLR"}
+    assert m.count_keys_with_prefix(sample, "pre_") == 2
+
+
+# intermediate/inheritance.py
+@check("intermediate/inheritance.py")
+def greetings(m: ModuleType) -> None:
+    assert "Ada" in m.Person("Ada", 30).greet()
+    greeting = m.Employee("Ada", 30, "E100").greet()
+    assert "Ada" in greeting and "E100" in greeting, f"greet() -> {greeting!r}"
+
+
+@check("intermediate/inheritance.py")
+def manager_team(m: ModuleType) -> None:
+    e1 = m.Employee("Ada", 30, "E100")
+    mgr = m.Manager("Grace", 40, "M001")
+    mgr.add_member(e1)
+    assert mgr.team_size() == 1, f"team_size() -> {mgr.team_size()}"
+    assert mgr.team[0] is e1, "team should store Employee objects"
+
+
+# intermediate/lambdas.py
+@check("intermediate/lambdas.py")
+def sort_by_lastname(m: ModuleType) -> None:
+    names = ["Ada Lovelace", "Grace Hopper", "Alan Turing"]
+    assert m.sort_by_lastname(names) == ["Grace Hopper", "Ada Lovelace", "Alan Turing"]
+
+
+@check("intermediate/lambdas.py")
+def apply_transform(m: ModuleType) -> None:
+    assert m.apply_transform([1, 2, 3], lambda x: x + 10) == [11, 12, 13]
+
+
+@check("intermediate/lambdas.py")
+def filter_even_squares(m: ModuleType) -> None:
+    assert m.filter_even_squares([1, 2, 3, 4, 5, 6]) == [4, 16, 36]
+
+
+# intermediate/list_ops.py
+@check("intermediate/list_ops.py")
+def remove_duplicates(m: ModuleType) -> None:
+    assert m.remove_duplicates([1, 2, 2, 3, 1, 4]) == [1, 2, 3, 4]
+
+
+@check("intermediate/list_ops.py")
+def flatten(m: ModuleType) -> None:
+    assert m.flatten([[1, 2], [3], [4, 5]]) == [1, 2, 3, 4, 5]
+
+
+@check("intermediate/list_ops.py")
+def rotate_list(m: ModuleType) -> None:
+    assert m.rotate_list([10, 20, 30, 40], 1) == [40, 10, 20, 30]
+    assert m.rotate_list([], 3) == []
+
+
+# intermediate/set_ops.py
+@check("intermediate/set_ops.py")
+def unique_intersection(m: ModuleType) -> None:
+    assert m.unique_intersection([1, 2, 3], [2, 3, 4]) == {2, 3}
+
+
+@check("intermediate/set_ops.py")
+def is_subset(m: ModuleType) -> None:
+    assert m.is_subset([1, 2], [1, 2, 3]) is True
+    assert m.is_subset([1, 4], [1, 2, 3]) is False
+
+
+@check("intermediate/set_ops.py")
+def symmetric_difference(m: ModuleType) -> None:
+    assert m.symmetric_difference([1, 2, 3], [3, 4, 5]) == {1, 2, 4, 5}
+
+
+# intermediate/some_functions.py
+@check("intermediate/some_functions.py")
+def fibonacci(m: ModuleType) -> None:
+    assert [m.fibonacci(i) for i in range(1, 7)] == [1, 1, 2, 3, 5, 8]
+
+
+@check("intermediate/some_functions.py")
+def factorial(m: ModuleType) -> None:
+    assert [m.factorial(i) for i in range(0, 6)] == [1, 1, 2, 6, 24, 120]
+
+
+@check("intermediate/some_functions.py")
+def is_prime(m: ModuleType) -> None:
+    got = [i for i in range(1, 20) if m.is_prime(i)]
+    assert got == [2, 3, 5, 7, 11, 13, 17, 19], f"primes below 20 -> {got}"
+
+
+@check("intermediate/some_functions.py")
+def gcd(m: ModuleType) -> None:
+    assert m.gcd(48, 18) == 6
+    assert m.gcd(7, 0) == 7
+
+
+@check("intermediate/some_functions.py")
+def sum_of_squares(m: ModuleType) -> None:
+    assert m.sum_of_squares(5) == 55
+    assert m.sum_of_squares(0) == 0
+
+
+# intermediate/tuple_ops.py
+@check("intermediate/tuple_ops.py")
+def tuple_to_list(m: ModuleType) -> None:
+    assert m.tuple_to_list((1, 2, 3)) == [1, 2, 3]
+
+
+@check("intermediate/tuple_ops.py")
+def swap_first_last(m: ModuleType) -> None:
+    assert m.swap_first_last((10, 20, 30, 40)) == (40, 20, 30, 10)
+    assert m.swap_first_last((1, 2)) == (2, 1)
+
+
+@check("intermediate/tuple_ops.py")
+def count_in_tuple(m: ModuleType) -> None:
+    assert m.count_in_tuple((1, 2, 1, "1"), 1) == 2
+
+
+# intermediate/csv_handler.py
+@check("intermediate/csv_handler.py")
+def csv_create_and_read(m: ModuleType) -> None:
+    m.csv_create("grade_demo.csv", ["name", "age"], [["A", 20], ["B", 21]])
+    rows = m.csv_read("grade_demo.csv")
+    assert rows == [{"name": "A", "age": "20"}, {"name": "B", "age": "21"}], f"csv_read -> {rows}"
+
+
+@check("intermediate/csv_handler.py")
+def csv_append(m: ModuleType) -> None:
+    m.csv_create("grade_demo.csv", ["name", "age"], [["A", 20]])
+    m.csv_append("grade_demo.csv", ["C", 22])
+    rows = m.csv_read("grade_demo.csv")
+    assert rows[-1] == {"name": "C", "age": "22"}, f"last row -> {rows[-1]}"
+
+
+@check("intermediate/csv_handler.py")
+def csv_update_row_by_index(m: ModuleType) -> None:
+    m.csv_create("grade_demo.csv", ["name", "age"], [["A", 20], ["B", 21]])
+    assert m.csv_update_row_by_index("grade_demo.csv", 1, ["Z", 99]) is True
+    rows = m.csv_read("grade_demo.csv")
+    assert rows[0] == {"name": "Z", "age": "99"}, f"rows -> {rows}"
+    assert m.csv_update_row_by_index("grade_demo.csv", 0, ["x", 0]) is False
+    assert m.csv_update_row_by_index("grade_demo.csv", 5, ["x", 0]) is False
+
+
+@check("intermediate/csv_handler.py")
+def csv_delete(m: ModuleType) -> None:
+    m.csv_create("grade_demo.csv", ["name"], [["A"]])
+    assert m.csv_delete("grade_demo.csv") is True
+    assert m.csv_delete("grade_demo.csv") is False
+
+
+# intermediate/json_handler.py
+@check("intermediate/json_handler.py")
+def json_roundtrip(m: ModuleType) -> None:
+    payload = {"a": {"b": 1}, "list": [1, 2, 3]}
+    m.json_write("grade_demo.json", payload)
+    assert m.json_read("grade_demo.json") == payload
+
+
+@check("intermediate/json_handler.py")
+def json_update_key(m: ModuleType) -> None:
+    m.json_write("grade_demo.json", {"a": {"b": 1}})
+    assert m.json_update_key("grade_demo.json", "a.c", 2) is True
+    assert m.json_read("grade_demo.json") == {"a": {"b": 1, "c": 2}}
+
+
+@check("intermediate/json_handler.py")
+def json_delete_key(m: ModuleType) -> None:
+    m.json_write("grade_demo.json", {"a": {"b": 1}})
+    assert m.json_delete_key("grade_demo.json", "a.b") is True
+    assert m.json_delete_key("grade_demo.json", "a.missing") is False
+
+
+# intermediate/txt_handler.py
+@check("intermediate/txt_handler.py")
+def text_roundtrip(m: ModuleType) -> None:
+    m.write_text("grade_demo.txt", "Hello students!")
+    assert m.read_text("grade_demo.txt").rstrip("\n") == "Hello students!"
+
+
+@check("intermediate/txt_handler.py")
+def append_text(m: ModuleType) -> None:
+    m.write_text("grade_demo.txt", "first")
+    m.append_text("grade_demo.txt", "second")
+    text = m.read_text("grade_demo.txt")
+    assert "first" in text and "second" in text, f"read_text -> {text!r}"
+
+
+@check("intermediate/txt_handler.py")
+def overwrite_line(m: ModuleType) -> None:
+    m.write_text("grade_demo.txt", "a\nb\nc")
+    assert m.overwrite_line("grade_demo.txt", 0, "z") is True
+    assert m.read_text("grade_demo.txt").splitlines() == ["z", "b", "c"]
+
+
+# intermediate/sql_handler.py
+# contributor trees may ship a workshop.db with old rows, so only inspect our own ids
+@check("intermediate/sql_handler.py")
+def sql_insert_and_query(m: ModuleType) -> None:
+    m.init_db()
+    first = m.insert_item("Notebook", 45.5)
+    second = m.insert_item("Pen", 20.25)
+    rows = [tuple(r) for r in m.query_items()]
+    ours = [r for r in rows if r[0] in (first, second)]
+    assert ours == [(first, "Notebook", 45.5), (second, "Pen", 20.25)], f"rows -> {ours}"
+    assert [r[0] for r in rows] == sorted(r[0] for r in rows), "rows should be ordered by ascending id"
+
+
+@check("intermediate/sql_handler.py")
+def sql_update_item(m: ModuleType) -> None:
+    m.init_db()
+    first = m.insert_item("A", 1.0)
+    second = m.insert_item("B", 2.0)
+    assert m.update_item(first, price=9.5) is True
+    prices = {r[0]: r[2] for r in m.query_items()}
+    assert prices[first] == 9.5 and prices[second] == 2.0, f"prices -> {prices[first]}, {prices[second]}"
+    assert m.update_item(max(prices) + 1000, price=1.0) is False
+
+
+@check("intermediate/sql_handler.py")
+def sql_delete_item(m: ModuleType) -> None:
+    m.init_db()
+    first = m.insert_item("A", 1.0)
+    second = m.insert_item("B", 2.0)
+    assert m.delete_item(first) is True
+    ids = [r[0] for r in m.query_items()]
+    assert first not in ids and second in ids, "delete_item should remove exactly one row"
+    assert m.delete_item(first) is False
+
+
+# intermediate/boss.py
+@check("intermediate/boss.py")
+def cart_helpers(m: ModuleType) -> None:
+    assert abs(m.compute_tax(100.0) - 18.0) < 1e-9
+    assert abs(m.compute_tax(100.0, rate=0.05) - 5.0) < 1e-9
+    assert m.normalize_user_id("  Student1 ") == "student1"
+
+
+@check("intermediate/boss.py")
+def cart_manager(m: ModuleType) -> None:
+    cart = m.CartManager("grader")
+    cart.clear()
+    cart.add_item(1, 2)
+    cart.add_item(1, 1)
+    cart.add_item(2, 1)
+    assert [r["qty"] for r in cart.list_items()] == [3, 1]
+    assert cart.total() == 3 * 45.0 + 20.0, f"total() -> {cart.total()}"
+    assert cart.remove_item(2) is True
+    assert cart.remove_item(2) is False
+    assert cart.checkout()["total"] == 135.0
+
+
+# miscellaneous/os_path.py
+@check("miscellaneous/os_path.py")
+def list_files(m: ModuleType) -> None:
+    base = Path("grade_dir")
+    (base / "sub").mkdir(parents=True, exist_ok=True)
+    (base / "file.txt").write_text("x", encoding="utf-8")
+    assert m.list_files(str(base)) == ["file.txt"]
+    assert m.list_files("does_not_exist") == []
+
+
+@check("miscellaneous/os_path.py")
+def make_nested_dirs(m: ModuleType) -> None:
+    first = m.make_nested_dirs("grade_nested/a/b")
+    assert Path(first).resolve() == Path("grade_nested/a/b").resolve()
+    m.make_nested_dirs("grade_nested/a/b")  # repeat runs should not fail
+
+
+@check("miscellaneous/os_path.py")
+def safe_remove(m: ModuleType) -> None:
+    inside = Path("grade_base/inside.txt")
+    inside.parent.mkdir(parents=True, exist_ok=True)
+    inside.write_text("x", encoding="utf-8")
+    outside = Path("outside.txt")
+    outside.write_text("x", encoding="utf-8")
+    assert m.safe_remove(str(inside), base="grade_base") is True
+    assert not inside.exists()
+    assert m.safe_remove(str(inside), base="grade_base") is False
+    assert m.safe_remove(str(outside), base="grade_base") is False
+    assert outside.exists()
+
+
+# miscellaneous/ciphers.py
+@check("miscellaneous/ciphers.py")
+def caesar_encrypt(m: ModuleType) -> None:
+    assert m.caesar_encrypt("HelloWorld", 3) == "KhoorZruog"
+    assert m.caesar_encrypt("xyz, ABC!", 3) == "abc, DEF!"
+
+
+@check("miscellaneous/ciphers.py")
+def caesar_roundtrip(m: ModuleType) -> None:
+    for case in json.loads(Path("assets/cipher_cases.json").read_text(encoding="utf-8"))["caesar"]:
+        enc = m.caesar_encrypt(case["text"], case["shift"])
+        assert m.caesar_decrypt(enc, case["shift"]) == case["text"]
+
+
+@check("miscellaneous/ciphers.py")
+def vigenere_encrypt(m: ModuleType) -> None:
+    assert m.vigenere_encrypt("ATTACKATDAWN", "LEMON") == "LXFOPVEFRNHR"
+
+
+@check("miscellaneous/ciphers.py")
+def vigenere_roundtrip(m: ModuleType) -> None:
+    for case in json.loads(Path("assets/cipher_cases.json").read_text(encoding="utf-8"))["vigenere"]:
+        enc = m.vigenere_encrypt(case["text"], case["key"])
+        assert m.vigenere_decrypt(enc, case["key"]) == case["text"]
+
+
+# miscellaneous/some_algos.py
+@check("miscellaneous/some_algos.py")
+def binary_search(m: ModuleType) -> None:
+    arr = [1, 3, 5, 7, 9]
+    assert [m.binary_search(arr, x) for x in arr] == [0, 1, 2, 3, 4]
+    assert m.binary_search(arr, 4) == -1
+    assert m.binary_search([], 1) == -1
+
+
+@check("miscellaneous/some_algos.py")
+def sliding_window_max(m: ModuleType) -> None:
+    assert m.sliding_window_max([1, 3, 2, 5, 8, 7], 3) == [3, 5, 8, 8]
+    assert m.sliding_window_max([4, 2], 2) == [4]
+    assert m.sliding_window_max([1, 2], 3) == []
+
+
+@check("miscellaneous/some_algos.py")
+def two_pointers_pair_sum(m: ModuleType) -> None:
+    assert m.two_pointers_pair_sum([1, 2, 4, 6, 8], 10) == [1, 4]
+    assert m.two_pointers_pair_sum([1, 2, 3], 100) == []
+
+
+@check("miscellaneous/some_algos.py")
+def dfs(m: ModuleType) -> None:
+    g = {1: [2, 3], 2: [4], 3: [5], 4: [], 5: []}
+    order = m.dfs(g, 1)
+    assert order in ([1, 2, 4, 3, 5], [1, 3, 5, 2, 4]), f"dfs -> {order}"
+    assert m.dfs(g, 99) == []
+
+
+@check("miscellaneous/some_algos.py")
+def bfs(m: ModuleType) -> None:
+    g = {1: [2, 3], 2: [4], 3: [5], 4: [], 5: []}
+    assert m.bfs(g, 1) == [1, 2, 3, 4, 5]
+    assert m.bfs(g, 99) == []
+
+
+# miscellaneous/some_cp_problems.py
+@check("miscellaneous/some_cp_problems.py")
+def problem_sum_pairs(m: ModuleType) -> None:
+    assert m.problem_sum_pairs([2, 7, 11, 15], 9) == [0, 1]
+    assert m.problem_sum_pairs([3, 2, 4], 6) == [1, 2]
+    assert m.problem_sum_pairs([1, 2], 10) == []
+
+
+@check("miscellaneous/some_cp_problems.py")
+def problem_max_subarray(m: ModuleType) -> None:
+    assert m.problem_max_subarray([3, -2, 5, -1, 6, -3]) == 11
+    assert m.problem_max_subarray([-3, -1, -2]) == -1
+
+
+@check("miscellaneous/some_cp_problems.py")
+def prefix_sum_query(m: ModuleType) -> None:
+    arr = [4, 2, 7, 1, 9, 3]
+    assert m.prefix_sum_query(arr, 1, 4) == 19
+    assert m.prefix_sum_query(arr, 0, 0) == 4
+    assert m.prefix_sum_query(arr, 0, 5) == 26
+
+
+# miscellaneous/some_data_structures.py
+@check("miscellaneous/some_data_structures.py")
+def stack_ops(m: ModuleType) -> None:
+    out = m.stack_ops([10, 20, 30, 40])
+    assert out["top"] == 40 and out["popped"] == "UPDATED", f"stack_ops -> {out}"
+    assert out["after_delete"] == []
+
+
+@check("miscellaneous/some_data_structures.py")
+def queue_ops(m: ModuleType) -> None:
+    out = m.queue_ops([10, 20, 30, 40])
+    assert out["front"] == 10 and out["removed"] == "UPDATED", f"queue_ops -> {out}"
+    assert out["traversed"] == ["UPDATED", 20, 30, 40]
+
+
+@check("miscellaneous/some_data_structures.py")
+def heap_ops(m: ModuleType) -> None:
+    out = m.heap_ops([7, 2, 9, 1, 5])
+    assert out["root"] == 1, f"heap_ops -> {out}"
+    assert out["after_delete"] == []
+
+
+@check("miscellaneous/some_data_structures.py")
+def dict_ops(m: ModuleType) -> None:
+    out = m.dict_ops([["a", 1], ["b", 2], ["c", 3]])
+    assert out["first_value"] == 1
+    assert out["after_delete"] == {"b": 2, "c": 3}, f"dict_ops -> {out}"
+
+
+@check("miscellaneous/some_data_structures.py")
+def linked_list(m: ModuleType) -> None:
+    ll = m.LinkedListOps()
+    for v in [10, 20, 30, 40]:
+        ll.push(v)
+    assert ll.read(1) == 20
+    assert ll.traverse() == [10, 20, 30, 40]
+    assert ll.update(9, "x") is False
+    assert ll.delete(2) is True
+    assert ll.traverse() == [10, 20, 40]
+    assert ll.delete(3) is False
+
+
+# miscellaneous/basic_flask_routing.py
+@check("miscellaneous/basic_flask_routing.py")
+def flask_crud(m: ModuleType) -> None:
+    client = m.create_app().test_client()
+    assert [i["id"] for i in client.get("/items").get_json()] == ["1"]
+    created = client.post("/items", json={"name": "pen", "qty": 2})
+    assert created.status_code == 201, f"POST status {created.status_code}"
+    new_id = created.get_json()["id"]
+    assert new_id != "1", "new id collides with existing item"
+    updated = client.put(f"/items/{new_id}", json={"name": "pencil"}).get_json()
+    assert updated["name"] == "pencil"
+    deleted = client.delete(f"/items/{new_id}")
+    assert deleted.status_code == 204 and not deleted.data
+    assert client.get(f"/items/{new_id}").status_code == 404
@@ -0,0 +1,102 @@
+"""Import one playground module in a scratch directory and run its checks.
+
+The engine starts one interpreter per module:
+
+    python -m grading.worker <playground_root> <rel_path>
+
+and reads a single JSON result line from stdout.
+"""
+
+from pathlib import Path
+from typing import Any, Dict
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+
+from grading.reference_checks import CHECKS
+
+
+def _short_error(exc: BaseException) -> str:
+    # one-line description used in the results matrix
+    text = str(exc).strip().splitlines()
+    return f"{type(exc).__name__}: {text[0]}" if text else type(exc).__name__
+
+
+def _import_from_path(path: Path):
+    # load a module by file path without touching sys.modules names of others
+    spec = importlib.util.spec_from_file_location(f"graded_{path.stem}", str(path))
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(path.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_module(playground: Path, rel_path: str) -> Dict[str, Any]:
+    """Copy one module plus assets to a temp dir, import it and run checks."""
+    checks = CHECKS.get(rel_path, [])
+    result: Dict[str, Any] = {
+        "module": rel_path,
+        "status": "pass",
+        "passed": 0,
+        "total": len(checks),
+        "failures": {},
+        "error": None,
+    }
+    start = time.perf_counter()
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="grade_", ignore_cleanup_errors=True) as tmp:
+        work = Path(tmp)
+        assets = playground / "assets"
+        if assets.is_dir():
+            shutil.copytree(assets, work / "assets")
+        else:
+            (work / "assets").mkdir()
+        target = work / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(playground / rel_path, target)
+
+        os.chdir(work)
+        captured = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(captured):
+                try:
+                    module = _import_from_path(target)
+                except BaseException as exc:  # student code may raise anything, even SystemExit
+                    result["status"] = "error"
+                    result["error"] = _short_error(exc)
+                    result["traceback"] = traceback.format_exc(limit=-3)
+                    return result
+
+                for fn in checks:
+                    try:
+                        fn(module)
+                        result["passed"] += 1
+                    except BaseException as exc:
+                        result["failures"][fn.__name__] = _short_error(exc)
+        finally:
+            os.chdir(old_cwd)
+            result["elapsed"] = round(time.perf_counter() - start, 4)
+
+    if result["failures"]:
+        result["status"] = "fail"
+    return result
+
+
+def main() -> None:
+    if len(sys.argv) != 3:
+        print("usage: python -m grading.worker <playground_root> <rel_path>", file=sys.stderr)
+        sys.exit(2)
+    result = run_module(Path(sys.argv[1]).resolve(), sys.argv[2])
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
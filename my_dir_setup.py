@@ -3,18 +3,21 @@ import subprocess
 import shutil
 import sys
 
+def find_git_root(start):
+    # Traverse upwards from start to find the root of the git repo (folder holding .git)
+    start = pathlib.Path(start).resolve()
+    for parent in [start, *start.parents]:
+        if (parent / ".git").exists():
+            return parent
+    return None
+
 def setup_solutions():
     # 1. Locate the file with Pathlib
     current_file = pathlib.Path(__file__).resolve()
     current_dir = current_file.parent
 
     # 2. Fetch repo info (searching for .git directory)
-    # We traverse upwards from the file's location to find the root of the git repo
-    git_root = None
-    for parent in current_file.parents:
-        if (parent / ".git").exists():
-            git_root = parent
-            break
+    git_root = find_git_root(current_file)
 
     if not git_root:
         print("Error: File is not within a git repository.")
@@ -0,0 +1,149 @@
+"""Coin change for many amounts: build the DP tables once, answer many queries.
+
+coin_change_1_and_2.py fills a Python list per call and answers exactly
+one amount. CoinChange fills NumPy tables up to a max amount once. Each
+coin is then a single vectorized pass instead of a Python loop over
+amounts.
+
+With an unlimited supply of coin c, split the table into residues mod c:
+for one residue the values a_0, a_1, a_2, ... sit at r, r + c, r + 2c, ...
+Reshaped to (blocks, c), every column is one residue class, and
+
+- fewest coins:  new_i = min over j <= i of (a_j + i - j)
+                       = i + cummin(a_j - j)      -> np.minimum.accumulate
+- combinations:  new_i = sum over j <= i of a_j   -> np.cumsum
+
+both along axis 0, so one coin costs O(max_amount) NumPy work.
+
+Counts are int64 until a pass could overflow. The table then switches to
+Python ints (object arrays), so answers stay exact.
+"""
+
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+_INT64_SAFE = float(2**62)
+
+
+def _blocks(table: np.ndarray, coin: int, fill) -> np.ndarray:
+    # pad to a multiple of coin and view as (blocks, coin): column r holds residue r
+    pad = (-table.size) % coin
+    if pad:
+        table = np.concatenate((table, np.full(pad, fill, dtype=table.dtype)))
+    return table.reshape(-1, coin)
+
+
+class CoinChange:
+    # tables are built lazily, and rebuilt larger when a query exceeds max_amount
+    def __init__(self, coins: Iterable[int], max_amount: int = 0):
+        coins = sorted(set(int(c) for c in coins))
+        if any(c <= 0 for c in coins):
+            raise ValueError("coins must be positive integers")
+        self.coins = coins
+        self.max_amount = max(0, int(max_amount))
+        self._fewest: Optional[np.ndarray] = None
+        self._last_coin: Optional[np.ndarray] = None
+        self._ways: Optional[np.ndarray] = None
+
+    def _grow(self, amount: int) -> None:
+        # keep tables covering `amount`; double to avoid rebuilding on every larger query
+        if amount > self.max_amount:
+            self.max_amount = max(amount, 2 * self.max_amount)
+            self._fewest = self._last_coin = self._ways = None
+
+    # --- fewest coins (coinChange) --------------------------------------
+
+    def _build_fewest(self) -> None:
+        n = self.max_amount + 1
+        unreachable = n  # more coins than any answer can need
+        dp = np.full(n, unreachable, dtype=np.int64)
+        dp[0] = 0
+        for coin in self.coins:
+            if coin >= n:
+                break
+            grid = _blocks(dp, coin, unreachable)
+            step = np.arange(grid.shape[0], dtype=np.int64)[:, None]
+            best = np.minimum.accumulate(grid - step, axis=0) + step
+            dp = np.minimum(best, unreachable).ravel()[:n]
+        # one coin that is part of an optimal solution, for reconstruction
+        last = np.full(n, -1, dtype=np.int64)
+        for coin in self.coins:
+            if coin >= n:
+                break
+            ok = (dp[coin:] < unreachable) & (dp[coin:] == dp[:-coin] + 1) & (last[coin:] < 0)
+            last[coin:][ok] = coin
+        dp[dp == unreachable] = -1
+        self._fewest, self._last_coin = dp, last
+
+    def min_coins(self, amounts: Union[int, Iterable[int]]) -> Union[int, np.ndarray]:
+        """Fewest coins for each amount (-1 where impossible); int in, int out."""
+        query = np.asarray(amounts, dtype=np.int64)
+        if query.size and query.min() < 0:
+            raise ValueError("amounts must be non-negative")
+        self._grow(int(query.max()) if query.size else 0)
+        if self._fewest is None:
+            self._build_fewest()
+        return int(self._fewest[query]) if query.ndim == 0 else self._fewest[query]
+
+    def combination(self, amount: int) -> Optional[Dict[int, int]]:
+        """One fewest-coins multiset as {coin: count}, or None if impossible."""
+        if self.min_coins(amount) < 0:
+            return None
+        last = self._last_coin
+        used: Dict[int, int] = {}
+        while amount:
+            coin = int(last[amount])
+            used[coin] = used.get(coin, 0) + 1
+            amount -= coin
+        return dict(sorted(used.items()))
+
+    # --- number of combinations (coinChange2) ---------------------------
+
+    def _build_ways(self) -> None:
+        n = self.max_amount + 1
+        dp = np.zeros(n, dtype=np.int64)
+        dp[0] = 1
+        for coin in self.coins:
+            if coin >= n:
+                break
+            grid = _blocks(dp, coin, 0)
+            if dp.dtype != object and np.cumsum(grid, axis=0, dtype=np.float64).max() >= _INT64_SAFE:
+                # this pass could overflow int64: continue with exact Python ints
+                grid = grid.astype(object)
+            dp = np.cumsum(grid, axis=0, dtype=grid.dtype).ravel()[:n]
+        self._ways = dp
+
+    def ways(self, amounts: Union[int, Iterable[int]]) -> Union[int, np.ndarray]:
+        """Number of coin combinations (order ignored) for each amount; int in, int out."""
+        query = np.asarray(amounts, dtype=np.int64)
+        if query.size and query.min() < 0:
+            raise ValueError("amounts must be non-negative")
+        self._grow(int(query.max()) if query.size else 0)
+        if self._ways is None:
+            self._build_ways()
+        return int(self._ways[query]) if query.ndim == 0 else self._ways[query]
+
+
+def coin_change(coins: List[int], amount: int) -> int:
+    """Drop-in for Solution.coinChange."""
+    return CoinChange(coins, amount).min_coins(amount)
+
+
+def coin_change_2(coins: List[int], amount: int) -> int:
+    """Drop-in for Solution.coinChange2."""
+    return CoinChange(coins, amount).ways(amount)
+
+
+# Example usage:
+if __name__ == "__main__":
+    print(coin_change([1, 2, 5], 11))  # Output: 3
+    print(coin_change_2([1, 2, 5], 11))  # Output: 11
+
+    prices = CoinChange([1, 5, 10, 25, 50, 100], max_amount=100_000)
+    print(prices.min_coins([63, 99, 100_000]))  # Output: [   5    8 1000]
+    print(prices.combination(63))  # Output: {1: 3, 10: 1, 50: 1}
+    print(prices.ways(100_000))  # Output: 13398445413854501
+    print(CoinChange(range(1, 21)).ways(5_000) > 2**63)  # Output: True (exact Python int)
+
+    print(CoinChange([2, 7]).min_coins([1, 3, 11]))  # Output: [-1 -1  3]
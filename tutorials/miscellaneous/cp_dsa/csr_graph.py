@@ -0,0 +1,329 @@
+"""Compact graphs in CSR form with BFS, DFS, components and shortest paths.
+
+A Dict[int, List[int]] graph spends a Python list per node and an int
+object per edge. CSR (compressed sparse row) keeps two flat NumPy arrays:
+
+    neighbors[offsets[u] : offsets[u + 1]]  are the out-neighbors of u
+
+so 10^7 edges take ~40 MB of int32 instead of several hundred MB of
+Python objects. Traversals keep their state (dist, parent, seen) in flat
+arrays too:
+
+- BFS is level-synchronous: a whole frontier is expanded with a few NumPy
+  calls; small frontiers (long thin mazes) fall back to a plain loop over
+  memoryviews so the per-level overhead stays tiny.
+- DFS walks an explicit stack with one edge pointer per node, so it never
+  recurses and never pops from the front of a list.
+- connected components hook every edge's larger label onto the smaller one
+  and then pointer-jump, a few vectorized passes over the edge list.
+
+Grids (count_islands, cses_laybyrinth) become graphs with from_grid: cell
+(r, c) is node r * cols + c.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# frontiers up to this size are expanded with a Python loop instead of NumPy
+_SMALL_FRONTIER = 64
+
+DIRECTIONS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+DIRECTIONS_8 = DIRECTIONS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _index_dtype(size: int):
+    return np.int32 if size < 2**31 else np.int64
+
+
+def grid_mask(grid: Any, walls: str = "#0") -> np.ndarray:
+    """Return a bool array, True for open cells.
+
+    Strings and lists of characters are open unless the character is in
+    `walls`; numeric and bool arrays are open where nonzero.
+    """
+    if isinstance(grid, np.ndarray) and grid.dtype.kind in "biuf":
+        return grid.astype(bool)
+    rows = ["".join(row) if not isinstance(row, (str, bytes)) else row for row in grid]
+    if not rows:
+        return np.zeros((0, 0), dtype=bool)
+    raw = np.frombuffer(b"".join(r.encode() if isinstance(r, str) else r for r in rows), dtype=np.uint8)
+    if raw.size != len(rows) * len(rows[0]):
+        raise ValueError("grid rows must all have the same length")
+    cells = raw.reshape(len(rows), -1)
+    return ~np.isin(cells, np.frombuffer(walls.encode(), dtype=np.uint8))
+
+
+class CSRGraph:
+    # offsets has n + 1 entries; node ids are 0..n-1
+    def __init__(self, offsets: np.ndarray, neighbors: np.ndarray, labels: Optional[List[Hashable]] = None,
+                 shape: Optional[Tuple[int, int]] = None, active: Optional[np.ndarray] = None,
+                 weights: Optional[np.ndarray] = None):
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights  # edge costs aligned with neighbors; None means unweighted
+        self.n = offsets.size - 1
+        self.labels = labels  # node id -> original label (from_dict only)
+        self.shape = shape  # (rows, cols) for grid graphs
+        self.active = active  # open cells of a grid graph; None means every node counts
+        self._index: Optional[Dict[Hashable, int]] = None
+
+    # --- constructors ---------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, src: Iterable[int], dst: Iterable[int], n: Optional[int] = None,
+                   directed: bool = True, weights: Optional[Iterable[float]] = None) -> "CSRGraph":
+        """Build from parallel source/target (and optional weight) arrays; neighbor order follows edge order."""
+        src = np.asarray(src, dtype=np.int64).ravel()
+        dst = np.asarray(dst, dtype=np.int64).ravel()
+        if src.shape != dst.shape:
+            raise ValueError("src and dst must have the same length")
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64).ravel()
+            if weights.shape != src.shape:
+                raise ValueError("weights must have one entry per edge")
+        if not directed:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+            if weights is not None:
+                weights = np.concatenate((weights, weights))
+        if n is None:
+            n = int(max(src.max(), dst.max())) + 1 if src.size else 0
+        if src.size and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+            raise ValueError(f"node ids must lie in [0, {n})")
+        counts = np.bincount(src, minlength=n)
+        offsets = np.zeros(n + 1, dtype=_index_dtype(src.size))
+        np.cumsum(counts, out=offsets[1:])
+        order = np.argsort(src, kind="stable")
+        return cls(offsets, dst[order].astype(_index_dtype(n)), weights=None if weights is None else weights[order])
+
+    @classmethod
+    def from_dict(cls, adj: Dict[Hashable, Sequence[Hashable]]) -> "CSRGraph":
+        """Build from adjacency lists; any hashable labels, mapped to ids in first-seen order."""
+        index: Dict[Hashable, int] = {}
+        for u in adj:
+            index.setdefault(u, len(index))
+        for vs in adj.values():
+            for v in vs:
+                index.setdefault(v, len(index))
+        counts = np.fromiter((len(adj.get(u, ())) for u in index), dtype=np.int64, count=len(index))
+        offsets = np.zeros(len(index) + 1, dtype=_index_dtype(int(counts.sum())))
+        np.cumsum(counts, out=offsets[1:])
+        flat = (index[v] for u in index for v in adj.get(u, ()))
+        neighbors = np.fromiter(flat, dtype=_index_dtype(len(index)), count=int(offsets[-1]))
+        graph = cls(offsets, neighbors, labels=list(index))
+        graph._index = index
+        return graph
+
+    @classmethod
+    def from_grid(cls, grid: Any, walls: str = "#0", diagonal: bool = False) -> "CSRGraph":
+        """Build from a grid; open cells link to open 4- (or 8-) neighbors.
+
+        `grid` is a list of strings, a list of character lists, or a 2-D
+        NumPy array (see grid_mask for what counts as open).
+        """
+        mask = grid_mask(grid, walls)
+        rows, cols = mask.shape
+        dirs = DIRECTIONS_8 if diagonal else DIRECTIONS_4
+        dt = _index_dtype(rows * cols)
+        ids = np.arange(rows * cols, dtype=dt).reshape(rows, cols)
+        # one column per direction; -1 where there is no edge; row-major == sorted by source
+        nbr = np.full((rows, cols, len(dirs)), -1, dtype=dt)
+        for k, (dr, dc) in enumerate(dirs):
+            src = (slice(max(0, -dr), rows - max(0, dr)), slice(max(0, -dc), cols - max(0, dc)))
+            dst = (slice(max(0, dr), rows - max(0, -dr)), slice(max(0, dc), cols - max(0, -dc)))
+            ok = mask[src] & mask[dst]
+            nbr[src + (k,)] = np.where(ok, ids[dst], -1)
+        nbr = nbr.reshape(rows * cols, len(dirs))
+        has = nbr >= 0
+        offsets = np.zeros(rows * cols + 1, dtype=_index_dtype(int(has.sum())))
+        np.cumsum(has.sum(axis=1), out=offsets[1:])
+        return cls(offsets, nbr[has], shape=(rows, cols), active=mask.ravel())
+
+    # --- basics ---------------------------------------------------------
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.offsets[-1])
+
+    def node(self, label: Hashable) -> int:
+        """Return the node id for a from_dict label (ids pass through otherwise)."""
+        if self._index is None:
+            return int(label)
+        return self._index[label]
+
+    def neighbors_of(self, u: int) -> np.ndarray:
+        """Return the out-neighbors of u (a view, do not modify)."""
+        return self.neighbors[self.offsets[u] : self.offsets[u + 1]]
+
+    def degree(self) -> np.ndarray:
+        """Return every node's out-degree."""
+        return np.diff(self.offsets)
+
+    def cell(self, u: int) -> Tuple[int, int]:
+        """Return (row, col) of a grid node."""
+        return divmod(int(u), self.shape[1])
+
+    def _expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # all (neighbor, source) pairs leaving the frontier, in adjacency order
+        starts = self.offsets[frontier]
+        counts = self.offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        base = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return self.neighbors[base + np.arange(total)], np.repeat(frontier, counts)
+
+    # --- traversals -----------------------------------------------------
+
+    def bfs_tree(self, source: int, target: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """BFS from source; return (order, dist, parent).
+
+        order lists nodes in the order a queue-based BFS visits them, dist is
+        -1 for unreachable nodes and parent is -1 for the source and for
+        unreachable nodes. With target given, stops after its level.
+        """
+        dist = np.full(self.n, -1, dtype=np.int32)
+        parent = np.full(self.n, -1, dtype=self.neighbors.dtype)
+        dist[source] = 0
+        frontier = np.array([source], dtype=self.neighbors.dtype)
+        levels = [frontier]
+        off, nb = memoryview(self.offsets), memoryview(self.neighbors)
+        dmv, pmv = memoryview(dist), memoryview(parent)
+        level = 0
+        while frontier.size and (target is None or dmv[target] < 0):
+            level += 1
+            if frontier.size <= _SMALL_FRONTIER:
+                nxt = []
+                for u in frontier.tolist():
+                    for e in range(off[u], off[u + 1]):
+                        v = nb[e]
+                        if dmv[v] < 0:
+                            dmv[v] = level
+                            pmv[v] = u
+                            nxt.append(v)
+                frontier = np.array(nxt, dtype=self.neighbors.dtype)
+            else:
+                nbr, src = self._expand(frontier)
+                fresh = dist[nbr] < 0
+                nbr, src = nbr[fresh], src[fresh]
+                # first discovery wins, exactly like a FIFO queue
+                first = np.unique(nbr, return_index=True)[1]
+                first.sort()
+                frontier = nbr[first]
+                parent[frontier] = src[first]
+                dist[frontier] = level
+            levels.append(frontier)
+        return np.concatenate(levels), dist, parent
+
+    def bfs_levels(self, source: int) -> np.ndarray:
+        """Return the hop distance from source to every node (-1 if unreachable)."""
+        return self.bfs_tree(source)[1]
+
+    def bfs_order(self, source: int) -> np.ndarray:
+        """Return nodes in BFS visit order."""
+        return self.bfs_tree(source)[0]
+
+    def dfs_order(self, source: int) -> np.ndarray:
+        """Return nodes in DFS preorder (same order as the recursive version)."""
+        off, nb = memoryview(self.offsets), memoryview(self.neighbors)
+        ptr = memoryview(self.offsets[:-1].copy())
+        seen = bytearray(self.n)
+        seen[source] = 1
+        order = [source]
+        stack = [source]
+        while stack:
+            u = stack[-1]
+            e, end = ptr[u], off[u + 1]
+            while e < end and seen[nb[e]]:
+                e += 1
+            if e < end:
+                v = nb[e]
+                ptr[u] = e + 1
+                seen[v] = 1
+                order.append(v)
+                stack.append(v)
+            else:
+                ptr[u] = e
+                stack.pop()
+        return np.array(order, dtype=self.neighbors.dtype)
+
+    def shortest_path(self, source: int, target: int) -> List[int]:
+        """Return the fewest-edges path source..target as node ids, or [] if unreachable."""
+        _, dist, parent = self.bfs_tree(source, target)
+        if dist[target] < 0:
+            return []
+        path = [target]
+        pmv = memoryview(parent)
+        while path[-1] != source:
+            path.append(pmv[path[-1]])
+        return path[::-1]
+
+    def connected_components(self) -> Tuple[int, np.ndarray]:
+        """Return (count, labels); edges are treated as undirected.
+
+        labels[u] is the component number of u, numbered by smallest node
+        id; inactive grid cells get -1 and are not counted.
+        """
+        label = np.arange(self.n, dtype=self.neighbors.dtype)
+        src = np.repeat(label, self.degree())
+        dst = self.neighbors
+        while src.size:
+            lu, lv = label[src], label[dst]
+            differ = lu != lv
+            src, dst, lu, lv = src[differ], dst[differ], lu[differ], lv[differ]
+            if not src.size:
+                break
+            # hook each root onto the smallest root it touches, then flatten
+            np.minimum.at(label, np.maximum(lu, lv), np.minimum(lu, lv))
+            while True:
+                jumped = label[label]
+                if np.array_equal(jumped, label):
+                    break
+                label = jumped
+        # every label is now its component's smallest node id; number the roots in order
+        is_root = label == np.arange(self.n)
+        if self.active is not None:
+            is_root &= self.active
+        number = np.cumsum(is_root, dtype=self.neighbors.dtype) - 1
+        labels = number[label]
+        if self.active is not None:
+            labels[~self.active] = -1
+        return int(is_root.sum()), labels
+
+
+def bfs(adj: Dict[Hashable, Sequence[Hashable]], start: Hashable) -> List[Hashable]:
+    """Drop-in for some_algos.bfs: BFS visit order over dict adjacency."""
+    if start not in adj:
+        return []
+    g = CSRGraph.from_dict(adj)
+    return [g.labels[u] for u in g.bfs_order(g.node(start)).tolist()]
+
+
+def dfs(adj: Dict[Hashable, Sequence[Hashable]], start: Hashable) -> List[Hashable]:
+    """Drop-in for some_algos.dfs: DFS preorder over dict adjacency."""
+    if start not in adj:
+        return []
+    g = CSRGraph.from_dict(adj)
+    return [g.labels[u] for u in g.dfs_order(g.node(start)).tolist()]
+
+
+def count_islands(grid: Any) -> int:
+    """Count 4-connected groups of '1' cells, like count_islands.Solution.countIslands."""
+    return CSRGraph.from_grid(grid, walls="0").connected_components()[0]
+
+
+# Example usage:
+if __name__ == "__main__":
+    g = {1: [2, 3], 2: [4], 3: [5], 4: [], 5: []}
+    print(bfs(g, 1))  # Output: [1, 2, 3, 4, 5]
+    print(dfs(g, 1))  # Output: [1, 2, 4, 3, 5]
+
+    edges = CSRGraph.from_edges([0, 0, 1, 3], [1, 2, 2, 4], n=6, directed=False)
+    print(edges.bfs_levels(0))  # Output: [ 0  1  1 -1 -1 -1]
+    print(edges.connected_components())  # Output: (3, array([0, 0, 0, 1, 1, 2], dtype=int32))
+
+    islands = ["11000", "11000", "00100", "00011"]
+    print(count_islands(islands))  # Output: 3
+
+    maze = ["#######", "#A#...#", "#.#.#.#", "#...#B#", "#######"]
+    grid = CSRGraph.from_grid(maze, walls="#")
+    start, end = 1 * 7 + 1, 3 * 7 + 5
+    print([grid.cell(u) for u in grid.shortest_path(start, end)])
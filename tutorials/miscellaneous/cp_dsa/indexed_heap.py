@@ -0,0 +1,251 @@
+"""Indexed d-ary heap: a priority queue whose entries can be found and changed.
+
+heapq only knows positions, so changing one priority means editing the
+list and calling heapify (O(n)), as heap_ops in some_data_structures.py
+does. Dijkstra/A* with heapq or queue.PriorityQueue push a fresh entry
+instead and skip the stale ones later, so the heap holds one entry per
+relaxation, not per node. PriorityQueue also takes a lock on every call.
+
+IndexedHeap keeps, next to the heap arrays, the position of every item:
+
+- push, pop, remove(item) and update/decrease_key are O(log n) sifts from
+  that position, and `item in heap` is one lookup;
+- every item is in the heap at most once, so a graph search never holds
+  more than one entry per node;
+- with `capacity`, items are the ints 0..capacity-1 and positions live in
+  a flat list instead of a dict, which is what graph searches want;
+- a d-ary layout (d=4 by default) halves the depth of a binary heap.
+  That makes sift-up (push, decrease_key) cheaper, at the price of a few
+  more comparisons per level on pop.
+
+There are no locks. Share one heap between threads behind your own lock,
+or better, keep one per search.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+
+class IndexedHeap:
+    # min-heap of (priority, item) with item -> position; items are unique
+    def __init__(self, d: int = 4, capacity: Optional[int] = None):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self._prio: List[Any] = []
+        self._items: List[Hashable] = []
+        self._dense = capacity is not None
+        # item -> index into _prio/_items (-1 when absent, dense mode)
+        self._pos: Any = [-1] * capacity if self._dense else {}
+
+    def _find(self, item: Hashable) -> int:
+        if self._dense:
+            return self._pos[item] if 0 <= item < len(self._pos) else -1
+        return self._pos.get(item, -1)
+
+    def _forget(self, item: Hashable) -> None:
+        if self._dense:
+            self._pos[item] = -1
+        else:
+            del self._pos[item]
+
+    def _up(self, i: int) -> None:
+        prio, items, pos, d = self._prio, self._items, self._pos, self.d
+        p, item = prio[i], items[i]
+        while i:
+            parent = (i - 1) // d
+            if not p < prio[parent]:
+                break
+            prio[i] = prio[parent]
+            items[i] = moved = items[parent]
+            pos[moved] = i
+            i = parent
+        prio[i], items[i] = p, item
+        pos[item] = i
+
+    def _down(self, i: int) -> None:
+        prio, items, pos, d = self._prio, self._items, self._pos, self.d
+        n = len(prio)
+        p, item = prio[i], items[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            children = prio[first : first + d]  # min over a short slice runs in C
+            best_p = min(children)
+            if not best_p < p:
+                break
+            best = first + children.index(best_p)
+            prio[i] = best_p
+            items[i] = moved = items[best]
+            pos[moved] = i
+            i = best
+        prio[i], items[i] = p, item
+        pos[item] = i
+
+    def _take(self, i: int) -> Tuple[Hashable, Any]:
+        # remove the entry at position i and restore the heap around it
+        prio, items = self._prio, self._items
+        item, p = items[i], prio[i]
+        self._forget(item)
+        last_p, last_item = prio.pop(), items.pop()
+        if i < len(prio):
+            prio[i], items[i] = last_p, last_item
+            if i and last_p < prio[(i - 1) // self.d]:
+                self._up(i)
+            else:
+                self._down(i)
+        return item, p
+
+    def push(self, item: Hashable, priority: Any) -> None:
+        """Add an item; ValueError if it is already queued."""
+        if self._find(item) >= 0:
+            raise ValueError(f"{item!r} is already in the heap")
+        self._prio.append(priority)
+        self._items.append(item)
+        self._up(len(self._prio) - 1)
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Remove and return (item, priority) with the smallest priority."""
+        if not self._prio:
+            raise IndexError("pop from an empty heap")
+        return self._take(0)
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        """(item, priority) with the smallest priority, left in place."""
+        if not self._prio:
+            raise IndexError("peek at an empty heap")
+        return self._items[0], self._prio[0]
+
+    def remove(self, item: Hashable) -> Any:
+        """Remove a queued item and return its priority; KeyError if absent."""
+        i = self._find(item)
+        if i < 0:
+            raise KeyError(item)
+        return self._take(i)[1]
+
+    def update(self, item: Hashable, priority: Any) -> None:
+        """Set the priority of an item, pushing it if it is absent."""
+        i = self._find(item)
+        if i < 0:
+            self.push(item, priority)
+            return
+        old = self._prio[i]
+        self._prio[i] = priority
+        if priority < old:
+            self._up(i)
+        else:
+            self._down(i)
+
+    def decrease_key(self, item: Hashable, priority: Any) -> bool:
+        """Push the item or lower its priority; False if it already has a lower or equal one."""
+        i = self._find(item)
+        if i < 0:
+            self._prio.append(priority)
+            self._items.append(item)
+            self._up(len(self._prio) - 1)
+            return True
+        if not priority < self._prio[i]:
+            return False
+        self._prio[i] = priority
+        self._up(i)
+        return True
+
+    def priority(self, item: Hashable) -> Any:
+        """Current priority of a queued item; KeyError if absent."""
+        i = self._find(item)
+        if i < 0:
+            raise KeyError(item)
+        return self._prio[i]
+
+    def traverse(self) -> List[Tuple[Hashable, Any]]:
+        """(item, priority) pairs in heap storage order (not sorted)."""
+        return list(zip(self._items, self._prio))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for item in self._items:
+            self._forget(item)
+        self._prio.clear()
+        self._items.clear()
+
+    def __contains__(self, item: Hashable) -> bool:
+        return self._find(item) >= 0
+
+    def __len__(self) -> int:
+        return len(self._prio)
+
+
+def dijkstra(graph, source: int, target: Optional[int] = None,
+             heuristic: Optional[Callable[[int], float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Shortest distances from source over a CSRGraph (see csr_graph.py).
+
+    Edge costs come from graph.weights (CSRGraph.from_edges(..., weights=)),
+    all 1 for an unweighted graph. With a target the search stops once it
+    is settled, and a consistent heuristic(node) turns it into A*. Returns
+    (dist, parent) arrays, inf/-1 for nodes that were not reached.
+    """
+    n = graph.n
+    offsets = memoryview(np.ascontiguousarray(graph.offsets, dtype=np.int64))
+    neighbors = memoryview(np.ascontiguousarray(graph.neighbors, dtype=np.int64))
+    weights = getattr(graph, "weights", None)
+    cost = None if weights is None else memoryview(np.ascontiguousarray(weights, dtype=np.float64))
+    dist_np = np.full(n, np.inf)
+    parent_np = np.full(n, -1, dtype=np.int64)
+    dist, parent = memoryview(dist_np), memoryview(parent_np)
+    done = bytearray(n)
+
+    heap = IndexedHeap(capacity=n)
+    dist[source] = 0.0
+    heap.push(source, heuristic(source) if heuristic else 0.0)
+    while heap:
+        u, _ = heap.pop()
+        done[u] = 1
+        if u == target:
+            break
+        du = dist[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = neighbors[k]
+            if done[v]:
+                continue
+            nd = du + (cost[k] if cost is not None else 1.0)
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heap.decrease_key(v, nd + heuristic(v) if heuristic else nd)
+    return dist_np, parent_np
+
+
+def heap_ops(seq: List[int]) -> Dict[str, Any]:
+    """Drop-in for heap_ops in some_data_structures.py, updating the root in O(log n)."""
+    heap = IndexedHeap()
+    for k, x in enumerate(seq):
+        heap.push(k, x)  # items are positions in seq, so duplicate values are fine
+    root = heap.peek()[1] if heap else None
+    if heap:
+        item, value = heap.peek()
+        heap.update(item, value + 1)
+    traversed = [value for _, value in heap.traverse()]
+    popped = heap.pop()[1] if heap else None
+    heap.clear()
+    return {"root": root, "traversed": traversed, "popped": popped, "after_delete": [v for _, v in heap.traverse()]}
+
+
+# Example usage:
+if __name__ == "__main__":
+    heap = IndexedHeap()
+    for task, due in [("write", 5), ("test", 3), ("ship", 9)]:
+        heap.push(task, due)
+    heap.decrease_key("ship", 1)
+    heap.remove("test")
+    print("write" in heap, "test" in heap)  # Output: True False
+    print(heap.pop(), heap.pop())  # Output: ('ship', 1) ('write', 5)
+
+    print(heap_ops([7, 2, 9, 1, 5])["root"])  # Output: 1
+
+    from csr_graph import CSRGraph
+
+    graph = CSRGraph.from_edges([0, 0, 1, 2], [1, 2, 3, 3], n=4, weights=[4.0, 1.0, 1.0, 1.0])
+    dist, parent = dijkstra(graph, 0)
+    print(dist, parent)  # Output: [0. 4. 1. 2.] [-1  0  0  2]
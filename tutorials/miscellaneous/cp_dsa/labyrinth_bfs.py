@@ -0,0 +1,190 @@
+"""CSES Labyrinth (https://cses.fi/problemset/task/1193) for very large mazes.
+
+cses_laybyrinth.py reads the maze with input(), keeps visited/parent as
+lists of lists of tuples and rebuilds the path as a list of coordinates.
+That is several Python objects per cell, which is too much at 5000 x 5000.
+Here the maze stays bytes from input to output:
+
+- the input is memory-mapped (a file) or read once from sys.stdin.buffer;
+- rows keep their line stride, so the newline byte after every row is a
+  wall column. A wall row above and below completes the border, and
+  neighbours are just i +- 1 and i +- stride with no bounds checks;
+- `free` is a bytearray: 1 for an open cell that has not been reached yet;
+- `came` is a bytearray holding the move letter (L/R/U/D) that first
+  reached each cell. It is the whole parent array, one byte per cell;
+- BFS runs level by level: big frontiers are expanded with NumPy (views on
+  the same bytearrays), small ones with a plain Python FIFO loop, as in
+  csr_graph.py;
+- the answer is read straight off `came` by walking back from B.
+"""
+
+import mmap
+import sys
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+# frontiers smaller than this are expanded in Python; NumPy's per-call cost dominates there
+_SMALL_FRONTIER = 64
+
+WALL, START, END = ord("#"), ord("A"), ord("B")
+NEWLINE = ord("\n")
+
+
+def _line_length(raw: np.ndarray, limit: int) -> int:
+    # bytes before the first newline among the first `limit`, or -1 if there is none
+    hits = np.flatnonzero(raw[:limit] == NEWLINE)
+    return int(hits[0]) if hits.size else -1
+
+
+class Labyrinth:
+    # rows x cols maze stored flat with `stride` bytes per row and one wall row above and below
+    def __init__(self, free: bytearray, rows: int, cols: int, stride: int, start: int, end: int):
+        self.free = free
+        self.rows, self.cols, self.stride = rows, cols, stride
+        self.start, self.end = start, end
+
+    @classmethod
+    def from_buffer(cls, buf: Union[bytes, bytearray, memoryview, mmap.mmap]) -> "Labyrinth":
+        """Parse CSES input ("n m" line, then n rows of '.', '#', 'A', 'B')."""
+        raw = np.frombuffer(buf, dtype=np.uint8)
+        first = _line_length(raw, 64)
+        if first < 0:
+            raise ValueError("expected an 'n m' line first")
+        n, m = map(int, bytes(raw[:first]).split())
+        body = raw[first + 1 :]
+        # row stride from the first line: m + 1 for "\n" endings, m + 2 for "\r\n"
+        line = _line_length(body, m + 2)
+        stride = line + 1 if line >= 0 else m + 1
+        if stride not in (m + 1, m + 2):
+            raise ValueError(f"expected rows of {m} cells, got a {stride - 1} byte line")
+        if body.size < n * stride:
+            body = np.concatenate((body, np.full(n * stride - body.size, NEWLINE, dtype=np.uint8)))
+        grid = body[: n * stride].reshape(n, stride)
+
+        free = bytearray((n + 2) * stride)
+        view = np.frombuffer(free, dtype=np.uint8).reshape(n + 2, stride)
+        view[1:-1, :m] = grid[:, :m] != WALL
+        starts = np.flatnonzero(grid[:, :m] == START)
+        ends = np.flatnonzero(grid[:, :m] == END)
+        if starts.size != 1 or ends.size != 1:
+            raise ValueError("the maze needs exactly one 'A' and one 'B'")
+        start, end = (divmod(int(k[0]), m) for k in (starts, ends))
+        return cls(free, n, m, stride, (start[0] + 1) * stride + start[1], (end[0] + 1) * stride + end[1])
+
+    @classmethod
+    def from_file(cls, path: str) -> "Labyrinth":
+        """Memory-map a maze file and parse it; only the free/came arrays stay in memory."""
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return cls.from_buffer(mm)
+
+    def cell(self, i: int) -> Tuple[int, int]:
+        """(row, col) of flat index i."""
+        row, col = divmod(i, self.stride)
+        return row - 1, col
+
+    def solve(self) -> Optional[str]:
+        """Shortest path from A to B as a string of L/R/U/D moves, or None."""
+        free = bytearray(self.free)  # consumed by the search; keeps the maze reusable
+        came = bytearray(len(free))
+        free_np = np.frombuffer(free, dtype=np.uint8)
+        came_np = np.frombuffer(came, dtype=np.uint8)
+        s = self.stride
+        moves = ((1, ord("R")), (-1, ord("L")), (s, ord("D")), (-s, ord("U")))
+        R, L, D, U = (letter for _, letter in moves)
+        start, end = self.start, self.end
+
+        free[start] = 0
+        frontier = [start]
+        while len(frontier) and free[end]:
+            if len(frontier) < _SMALL_FRONTIER:
+                # FIFO over a list; level boundaries are only checked to hand big levels to NumPy
+                queue = frontier if isinstance(frontier, list) else frontier.tolist()
+                push = queue.append
+                head, level_end = 0, len(queue)
+                while True:
+                    if head == level_end:
+                        if head == len(queue) or not free[end] or len(queue) - head >= _SMALL_FRONTIER:
+                            break
+                        if head > 1 << 16:
+                            del queue[:head]  # keep the list short along long corridors
+                            head = 0
+                        level_end = len(queue)
+                    i = queue[head]
+                    head += 1
+                    j = i + 1
+                    if free[j]:
+                        free[j] = 0
+                        came[j] = R
+                        push(j)
+                    j = i - 1
+                    if free[j]:
+                        free[j] = 0
+                        came[j] = L
+                        push(j)
+                    j = i + s
+                    if free[j]:
+                        free[j] = 0
+                        came[j] = D
+                        push(j)
+                    j = i - s
+                    if free[j]:
+                        free[j] = 0
+                        came[j] = U
+                        push(j)
+                frontier = queue[head:]
+            else:
+                frontier = np.asarray(frontier, dtype=np.intp)
+                parts = []
+                for off, letter in moves:
+                    # one offset maps distinct cells to distinct cells, so no duplicates within a part
+                    nb = frontier + off
+                    nb = nb[free_np[nb] != 0]
+                    free_np[nb] = 0
+                    came_np[nb] = letter
+                    parts.append(nb)
+                frontier = np.concatenate(parts)
+
+        if free[end]:
+            return None
+        step = [0] * 256
+        for off, letter in moves:
+            step[letter] = off
+        path = bytearray()
+        i = end
+        while i != start:
+            letter = came[i]
+            path.append(letter)
+            i -= step[letter]
+        path.reverse()
+        return path.decode()
+
+
+def solve(buf) -> str:
+    """CSES output for one input buffer: "YES", the length and the path, or "NO"."""
+    path = Labyrinth.from_buffer(buf).solve()
+    if path is None:
+        return "NO"
+    return f"YES\n{len(path)}\n{path}"
+
+
+def main():
+    # python labyrinth_bfs.py < input.txt, or python labyrinth_bfs.py maze.txt (memory-mapped)
+    if len(sys.argv) > 1:
+        path = Labyrinth.from_file(sys.argv[1]).solve()
+        answer = "NO" if path is None else f"YES\n{len(path)}\n{path}"
+    else:
+        answer = solve(sys.stdin.buffer.read())
+    sys.stdout.write(answer + "\n")
+
+
+# Example usage:
+if __name__ == "__main__":
+    if len(sys.argv) > 1 or not sys.stdin.isatty():
+        main()
+    else:
+        print(solve(b"5 8\n########\n#.A#...#\n#.##.#B#\n#......#\n########\n"))
+        # Output:
+        # YES
+        # 9
+        # LDDRRRRRU
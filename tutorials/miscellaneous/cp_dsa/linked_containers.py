@@ -0,0 +1,334 @@
+"""Linked lists that stay fast at a million elements.
+
+LinkedListOps in test_playground/miscellaneous/some_data_structures.py
+walks from `head` on every push, read, update and delete. Pushing n items
+is therefore O(n^2), and every Node carries its own __dict__. Two
+replacements with the same push/read/update/traverse/delete API, plus
+extend, iteration and len():
+
+- LinkedList: __slots__ nodes and a tail pointer, so push is O(1). Indexed
+  operations still walk, as in any linked list.
+- ArrayLinkedList: no node objects at all. Slot k of the parallel arrays
+  holds the value, next slot and previous slot of one element. Deleted
+  slots are chained into a free list and reused. A slot-per-position
+  index (`_order`) makes read/update O(1) and delete an O(1) unlink plus
+  one array memmove. extend links a whole batch of consecutive slots at
+  once.
+
+ArrayLinkedList also hands out slots as stable handles. insert_after and
+remove on a handle are O(1), and the position index is rebuilt lazily,
+with one walk, on the next indexed access.
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+NIL = -1  # "no slot": end of a chain
+
+
+def _slots(start: int, stop: int) -> bytes:
+    # machine bytes of array("q", range(start, stop)), built without per-int Python objects
+    return np.arange(start, stop, dtype=np.int64).tobytes()
+
+
+# --- node based ------------------------------------------------------------
+
+
+class Node:
+    # linked-list node without a per-instance __dict__
+    __slots__ = ("value", "next")
+
+    def __init__(self, value: Any, next: Optional["Node"] = None):
+        self.value = value
+        self.next = next
+
+
+class LinkedList:
+    # singly linked list with a tail pointer: O(1) push, O(index) read/update/delete
+    def __init__(self, values: Iterable[Any] = ()):
+        self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
+        self.size = 0
+        self.extend(values)
+
+    def push(self, value: Any) -> None:
+        """Insert node at end."""
+        node = Node(value)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.size += 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Push every value in order."""
+        tail = self.tail
+        count = 0
+        for value in values:
+            node = Node(value)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        self.tail = tail
+        self.size += count
+
+    def _node(self, index: int) -> Optional[Node]:
+        if not 0 <= index < self.size:
+            return None
+        if index == self.size - 1:
+            return self.tail
+        cur = self.head
+        for _ in range(index):
+            cur = cur.next
+        return cur
+
+    def read(self, index: int) -> Any:
+        """Return value at index, or None if there is none."""
+        node = self._node(index)
+        return None if node is None else node.value
+
+    def update(self, index: int, value: Any) -> bool:
+        """Update value at index; False if the index is missing."""
+        node = self._node(index)
+        if node is None:
+            return False
+        node.value = value
+        return True
+
+    def traverse(self) -> List[Any]:
+        """Return list traversal."""
+        return list(self)
+
+    def delete(self, index: int) -> bool:
+        """Delete node at index; False if the index is missing."""
+        if not 0 <= index < self.size:
+            return False
+        if index == 0:
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+        else:
+            prev = self._node(index - 1)
+            prev.next = prev.next.next
+            if prev.next is None:
+                self.tail = prev
+        self.size -= 1
+        return True
+
+    def __iter__(self) -> Iterator[Any]:
+        cur = self.head
+        while cur is not None:
+            yield cur.value
+            cur = cur.next
+
+    def __len__(self) -> int:
+        return self.size
+
+
+# --- array backed -------------------------------------------------------------
+
+
+class ArrayLinkedList:
+    # doubly linked list over parallel arrays; slot numbers are stable handles
+    def __init__(self, values: Iterable[Any] = ()):
+        self._value: List[Any] = []
+        self._next = array("q")
+        self._prev = array("q")
+        self._free = NIL  # first free slot; free slots are chained through _next
+        self.head = self.tail = NIL
+        self.size = 0
+        self._order: Optional[array] = array("q")  # slot at each position, None while stale
+        self.extend(values)
+
+    # slots
+
+    def _alloc(self, value: Any) -> int:
+        slot = self._free
+        if slot == NIL:
+            slot = len(self._value)
+            self._value.append(value)
+            self._next.append(NIL)
+            self._prev.append(NIL)
+        else:
+            self._free = self._next[slot]
+            self._value[slot] = value
+        return slot
+
+    def _unlink(self, slot: int) -> Any:
+        # detach slot from the chain and put it on the free list
+        prev, nxt = self._prev[slot], self._next[slot]
+        if prev == NIL:
+            self.head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt == NIL:
+            self.tail = prev
+        else:
+            self._prev[nxt] = prev
+        value = self._value[slot]
+        self._value[slot] = None  # drop the reference
+        self._next[slot] = self._free
+        self._free = slot
+        self.size -= 1
+        return value
+
+    def _index(self) -> array:
+        # position -> slot, rebuilt with one walk after handle-based edits
+        if self._order is None:
+            order = array("q")
+            nxt = self._next
+            slot = self.head
+            while slot != NIL:
+                order.append(slot)
+                slot = nxt[slot]
+            self._order = order
+        return self._order
+
+    def slot(self, index: int) -> int:
+        """Handle of the element at index, or NIL."""
+        if not 0 <= index < self.size:
+            return NIL
+        return self._index()[index]
+
+    # same API as LinkedListOps
+
+    def push(self, value: Any) -> int:
+        """Insert node at end; returns its slot."""
+        slot = self._alloc(value)
+        self._prev[slot] = self.tail
+        self._next[slot] = NIL
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+        if self._order is not None:
+            self._order.append(slot)
+        return slot
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Push every value in order; fresh slots are linked in bulk."""
+        values = values if isinstance(values, Sequence) else list(values)
+        reused = 0
+        while self._free != NIL and reused < len(values):
+            self.push(values[reused])
+            reused += 1
+        count = len(values) - reused
+        if not count:
+            return
+        # slots first..last are consecutive: next is k + 1, prev is k - 1
+        first = len(self._value)
+        last = first + count - 1
+        self._value.extend(values[reused:] if reused else values)
+        self._next.frombytes(_slots(first + 1, last + 2))
+        self._next[last] = NIL
+        self._prev.frombytes(_slots(first - 1, last))
+        self._prev[first] = self.tail
+        if self.tail == NIL:
+            self.head = first
+        else:
+            self._next[self.tail] = first
+        self.tail = last
+        self.size += count
+        if self._order is not None:
+            self._order.frombytes(_slots(first, last + 1))
+
+    def read(self, index: int) -> Any:
+        """Return value at index, or None if there is none."""
+        slot = self.slot(index)
+        return None if slot == NIL else self._value[slot]
+
+    def update(self, index: int, value: Any) -> bool:
+        """Update value at index; False if the index is missing."""
+        slot = self.slot(index)
+        if slot == NIL:
+            return False
+        self._value[slot] = value
+        return True
+
+    def traverse(self) -> List[Any]:
+        """Return list traversal."""
+        return list(map(self._value.__getitem__, self._index()))
+
+    def delete(self, index: int) -> bool:
+        """Delete node at index; False if the index is missing."""
+        slot = self.slot(index)
+        if slot == NIL:
+            return False
+        self._unlink(slot)
+        del self._order[index]
+        return True
+
+    # handle-based edits
+
+    def get(self, slot: int) -> Any:
+        """Value stored in a live slot."""
+        return self._value[slot]
+
+    def insert_after(self, slot: int, value: Any) -> int:
+        """Insert value right after a live slot in O(1); returns the new slot."""
+        if slot == self.tail:
+            return self.push(value)
+        new = self._alloc(value)
+        nxt = self._next[slot]
+        self._next[new], self._prev[new] = nxt, slot
+        self._next[slot] = self._prev[nxt] = new
+        self.size += 1
+        self._order = None
+        return new
+
+    def remove(self, slot: int) -> Any:
+        """Unlink a live slot in O(1) and return its value."""
+        if slot == self.tail and self._order is not None:
+            self._order.pop()
+        else:
+            self._order = None
+        return self._unlink(slot)
+
+    def clear(self) -> None:
+        """Remove everything and release the arrays."""
+        self.__init__()
+
+    def __iter__(self) -> Iterator[Any]:
+        value, nxt = self._value, self._next
+        slot = self.head
+        while slot != NIL:
+            yield value[slot]
+            slot = nxt[slot]
+
+    def __len__(self) -> int:
+        return self.size
+
+
+# drop-in for some_data_structures.LinkedListOps
+LinkedListOps = ArrayLinkedList
+
+
+# Example usage:
+if __name__ == "__main__":
+    ll = LinkedListOps()
+    for v in [10, 20, 30, 40]:
+        ll.push(v)
+    print(ll.read(1), ll.update(9, "x"), ll.delete(2))  # Output: 20 False True
+    print(ll.traverse())  # Output: [10, 20, 40]
+
+    big = ArrayLinkedList(range(1_000_000))
+    print(len(big), big.read(999_999))  # Output: 1000000 999999
+
+    handle = big.slot(0)
+    big.insert_after(handle, "after first")
+    big.remove(big.slot(2))
+    print(big.traverse()[:3])  # Output: [0, 'after first', 2]
+
+    nodes = LinkedList("abc")
+    nodes.delete(2)
+    nodes.push("d")
+    print(list(nodes), len(nodes))  # Output: ['a', 'b', 'd'] 3
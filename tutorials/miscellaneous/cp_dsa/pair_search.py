@@ -0,0 +1,229 @@
+"""Two-sum for many targets against one array, built once.
+
+twosum.py and problem_sum_pairs rebuild a dict on every call, so T targets
+against an n-element array cost T full passes plus T dict builds. PairIndex
+builds its index once:
+
+- numeric arrays are sorted once (argsort keeps the original indices) and
+  targets are answered in batches with np.searchsorted, one vectorized
+  call per chunk of candidates instead of one dict lookup per element.
+  Each target only scans the smaller half of its pair, values in
+  [target - max, target / 2], and stops at the first hit;
+- for integer arrays with a moderate value range, one FFT of the value
+  indicator gives every achievable pair sum up front, so targets with no
+  pair are rejected in O(1) instead of costing a full scan;
+- all_pairs_many returns every pair per target: two searchsorted calls
+  give each value's run of partners, expanded with np.repeat;
+- anything NumPy cannot hold natively (ints beyond int64, Fractions,
+  Decimals) falls back to a value -> indices dict, also built only once.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# largest (max - min) value span for which the FFT sum table is built
+FFT_SPAN_LIMIT = 1 << 22
+# candidate matrix size per searchsorted call (targets x values)
+_BLOCK = 1 << 22
+
+
+class PairIndex:
+    # build once, then ask for index pairs (i < j) with arr[i] + arr[j] == target
+    def __init__(self, arr: Sequence[Any]):
+        self.n = len(arr)
+        a = np.asarray(arr) if self.n else np.asarray([], dtype=np.int64)
+        self.numeric = a.dtype.kind in "biuf"
+        if self.numeric:
+            self.order = np.argsort(a, kind="stable")
+            self.sorted = a[self.order]
+            self._sums = self._build_sum_table() if a.dtype.kind in "biu" else None
+        else:
+            self.values = list(arr)
+            self.positions: Dict[Any, List[int]] = {}
+            for i, x in enumerate(self.values):
+                self.positions.setdefault(x, []).append(i)
+
+    def _build_sum_table(self):
+        # has_pair[s - 2*lo] is True when two distinct positions sum to s
+        if not self.n:
+            return None
+        lo, hi = int(self.sorted[0]), int(self.sorted[-1])
+        span = hi - lo
+        if span > FFT_SPAN_LIMIT:
+            return None
+        counts = np.bincount((self.sorted - lo).astype(np.int64), minlength=span + 1)
+        present = (counts > 0).astype(np.float64)
+        size = 1 << (2 * span + 1).bit_length()
+        f = np.fft.rfft(present, size)
+        ordered = np.rint(np.fft.irfft(f * f, size)[: 2 * span + 1]).astype(np.int64)
+        # ordered[k] counts value pairs (x, y) with x + y == k (+2*lo); x == y needs a duplicate
+        doubles = np.zeros(2 * span + 1, dtype=np.int64)
+        doubles[::2] = present.astype(np.int64)
+        has_pair = ordered - doubles > 0
+        has_pair[::2] |= counts > 1
+        return lo, has_pair
+
+    def _maybe_has_pair(self, targets: np.ndarray) -> np.ndarray:
+        # False only when no pair can exist; True means "search"
+        if self._sums is None:
+            return np.ones(targets.shape, dtype=bool)
+        lo, has_pair = self._sums
+        k = targets - 2 * lo
+        ok = (k >= 0) & (k < has_pair.size) & (targets == np.floor(targets))
+        out = np.zeros(targets.shape, dtype=bool)
+        out[ok] = has_pair[k[ok].astype(np.int64)]
+        return out
+
+    def find_pairs_many(self, targets: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return arrays (i, j) with one pair per target; -1 where none exists.
+
+        i < j always holds; the pair found is not necessarily the first one
+        a left-to-right scan would report.
+        """
+        if not self.numeric:
+            pairs = [self.find_pair(t) for t in targets]
+            i = np.array([p[0] if p else -1 for p in pairs], dtype=np.int64)
+            j = np.array([p[1] if p else -1 for p in pairs], dtype=np.int64)
+            return i, j
+
+        t = np.asarray(targets)
+        out_i = np.full(t.shape, -1, dtype=np.int64)
+        out_j = np.full(t.shape, -1, dtype=np.int64)
+        if self.n < 2 or not t.size:
+            return out_i, out_j
+
+        vals, n = self.sorted, self.n
+        todo = np.flatnonzero(self._maybe_has_pair(t))
+        # with x <= y, the smaller value x lies in [target - max, target / 2]
+        tt = t[todo]
+        half = tt // 2 if tt.dtype.kind in "biu" and vals.dtype.kind in "biu" else tt / 2
+        cur = np.searchsorted(vals, tt - vals[-1], side="left")
+        end = np.searchsorted(vals, half, side="right")
+        live = cur < end
+        todo, cur, end = todo[live], cur[live], end[live]
+
+        while todo.size:
+            chunk = max(1, min(_BLOCK // todo.size, int((end - cur).max())))
+            slots = cur[:, None] + np.arange(chunk)[None, :]
+            valid = slots < end[:, None]
+            slots = np.minimum(slots, n - 1)
+            need = t[todo][:, None] - vals[slots]
+            pos = np.searchsorted(vals, need)
+            # pos is the leftmost slot holding `need`; if that is the candidate itself, try the next slot
+            pos = np.where(pos == slots, pos + 1, pos)
+            clipped = np.minimum(pos, n - 1)
+            hit = valid & (pos < n) & (vals[clipped] == need)
+
+            found = hit.any(axis=1)
+            if found.any():
+                rows = np.flatnonzero(found)
+                cols = hit[rows].argmax(axis=1)
+                a = self.order[slots[rows, cols]]
+                b = self.order[clipped[rows, cols]]
+                out_i[todo[rows]] = np.minimum(a, b)
+                out_j[todo[rows]] = np.maximum(a, b)
+            cur += chunk
+            keep = ~found & (cur < end)
+            todo, cur, end = todo[keep], cur[keep], end[keep]
+        return out_i, out_j
+
+    def find_pair(self, target: Any) -> List[int]:
+        """Return one [i, j] pair for target, or [] (same shape as twoSum)."""
+        if self.numeric:
+            i, j = self.find_pairs_many([target])
+            return [int(i[0]), int(j[0])] if i[0] >= 0 else []
+        for x, idxs in self.positions.items():
+            try:
+                other = self.positions.get(target - x)
+            except TypeError:
+                continue
+            if other is None:
+                continue
+            if other is idxs:
+                if len(idxs) > 1:
+                    return [idxs[0], idxs[1]]
+                continue
+            return sorted((idxs[0], other[0]))
+        return []
+
+    def all_pairs(self, target: Any) -> List[Tuple[int, int]]:
+        """Return every index pair (i, j), i < j, with arr[i] + arr[j] == target."""
+        if self.n < 2:
+            return []
+        if not self.numeric:
+            out = []
+            for x, idxs in self.positions.items():
+                try:
+                    other = self.positions.get(target - x, [])
+                except TypeError:
+                    continue
+                out.extend((a, b) for a in idxs for b in other if a < b)
+            return sorted(out)
+        return self.all_pairs_many([target])[0]
+
+    def all_pairs_many(self, targets: Sequence[Any]) -> List[List[Tuple[int, int]]]:
+        """Return, per target, every index pair (i, j), i < j, sorted; [] where none exists.
+
+        For a chunk of targets, two searchsorted calls find the run of
+        partners of every sorted position, and the runs are expanded with
+        np.repeat. There is no Python loop per value, only per target when
+        the result lists are built.
+        """
+        if not self.numeric:
+            return [self.all_pairs(target) for target in targets]
+        t = np.asarray(targets)
+        out: List[List[Tuple[int, int]]] = [[] for _ in range(t.size)]
+        if self.n < 2 or not t.size:
+            return out
+
+        vals, n = self.sorted, self.n
+        pos = np.arange(n)
+        todo = np.flatnonzero(self._maybe_has_pair(t))
+        step = max(1, _BLOCK // n)
+        for start in range(0, todo.size, step):
+            rows = todo[start:start + step]
+            need = t[rows][:, None] - vals[None, :]  # (targets, n)
+            # partners of sorted position a are the positions after a holding need[a]: each pair once
+            left = np.maximum(np.searchsorted(vals, need, side="left"), pos + 1)
+            counts = np.maximum(np.searchsorted(vals, need, side="right") - left, 0).ravel()
+            found = int(counts.sum())
+            if not found:
+                continue
+            firsts = np.cumsum(counts) - counts
+            a = np.repeat(np.tile(pos, rows.size), counts)
+            b = np.repeat(left.ravel(), counts) + np.arange(found) - np.repeat(firsts, counts)
+            ia, ib = self.order[a], self.order[b]
+            i, j = np.minimum(ia, ib), np.maximum(ia, ib)
+            per_row = counts.reshape(rows.size, n).sum(axis=1)
+            row = np.repeat(np.arange(rows.size), per_row)
+            key = np.lexsort((j, i, row))
+            i, j = i[key].tolist(), j[key].tolist()
+            ends = np.cumsum(per_row).tolist()
+            for r, lo, hi in zip(rows.tolist(), [0] + ends[:-1], ends):
+                out[r] = list(zip(i[lo:hi], j[lo:hi]))
+        return out
+
+
+def two_sum_many(arr: Sequence[Any], targets: Sequence[Any]) -> List[List[int]]:
+    """Return one [i, j] pair (or []) per target, building the index only once."""
+    i, j = PairIndex(arr).find_pairs_many(targets)
+    return [[a, b] if a >= 0 else [] for a, b in zip(i.tolist(), j.tolist())]
+
+
+def all_pairs_many(arr: Sequence[Any], targets: Sequence[Any]) -> List[List[Tuple[int, int]]]:
+    """Return every (i, j) pair, i < j, per target, building the index only once."""
+    return PairIndex(arr).all_pairs_many(targets)
+
+
+# Example usage:
+if __name__ == "__main__":
+    print(two_sum_many([2, 7, 11, 15], [9, 18, 26, 100]))  # Output: [[0, 1], [1, 2], [2, 3], []]
+
+    index = PairIndex([3, 3, 4, 2, 5])
+    print(index.find_pair(6))  # Output: a pair summing to 6, e.g. [0, 1]
+    print(index.all_pairs(7))  # Output: [(0, 2), (1, 2), (3, 4)]
+    print(all_pairs_many([3, 3, 4, 2, 5], [6, 7, 100]))  # Output: [[(0, 1), (2, 3)], [(0, 2), (1, 2), (3, 4)], []]
+
+    big = PairIndex([2**70, 5, 2**70 + 1])
+    print(big.find_pair(2**71 + 1))  # Output: [0, 2]
@@ -0,0 +1,236 @@
+"""Build-once range queries: prefix sums, Fenwick tree and sparse table.
+
+Rebuilding a prefix array on every call makes Q queries on n elements cost
+O(n*Q). Building an index once makes each query cheap:
+
+- PrefixSums: NumPy cumsum, O(1) range sum, read-only.
+- FenwickTree: O(log n) range sum and O(log n) point update.
+- SparseTable: O(1) range min or max after an O(n log n) build, read-only.
+- RangeQueryIndex: one object using all three; sums stay O(1) until the
+  first update, then switch to the Fenwick tree.
+
+Integer input is stored as int64. The first fractional update or add
+promotes the stored arrays to float64 instead of truncating the value.
+
+All ranges are inclusive: sum(left, right) == sum(arr[left:right + 1]).
+Every index also has query_many(lefts, rights), answering whole arrays of
+ranges in a few vectorized NumPy calls.
+"""
+
+from typing import Any, Dict, Iterable, Sequence
+
+import numpy as np
+
+
+def _as_array(arr: Iterable[Any]) -> np.ndarray:
+    # ints -> int64, everything else -> float64
+    a = np.asarray(arr)
+    if a.ndim != 1:
+        raise ValueError("expected a 1-D sequence")
+    return a.astype(np.int64 if a.dtype.kind in "biu" else np.float64)
+
+
+def _check_ranges(lefts, rights, n: int):
+    # validate inclusive ranges and return them as int64 arrays
+    lo = np.asarray(lefts, dtype=np.int64)
+    hi = np.asarray(rights, dtype=np.int64)
+    if lo.shape != hi.shape:
+        raise ValueError("lefts and rights must have the same shape")
+    if lo.size and (lo.min() < 0 or hi.max() >= n or np.any(lo > hi)):
+        raise IndexError(f"ranges must satisfy 0 <= left <= right < {n}")
+    return lo, hi
+
+
+class PrefixSums:
+    # static O(1) range sums
+    def __init__(self, arr: Iterable[Any]):
+        a = _as_array(arr)
+        self.n = a.size
+        self.pref = np.zeros(self.n + 1, dtype=a.dtype)
+        np.cumsum(a, out=self.pref[1:])
+
+    def sum(self, left: int, right: int):
+        """Return the sum of arr[left..right]."""
+        if not 0 <= left <= right < self.n:
+            raise IndexError(f"range must satisfy 0 <= left <= right < {self.n}")
+        return (self.pref[right + 1] - self.pref[left]).item()
+
+    def query_many(self, lefts, rights) -> np.ndarray:
+        """Return the sums of many ranges at once."""
+        lo, hi = _check_ranges(lefts, rights, self.n)
+        return self.pref[hi + 1] - self.pref[lo]
+
+
+class FenwickTree:
+    # binary indexed tree; tree[i] covers (i - lowbit(i), i] in 1-based positions
+    def __init__(self, arr: Iterable[Any]):
+        a = _as_array(arr)
+        self.n = a.size
+        self.values = a.copy()
+        # O(n) build: tree[i] = pref[i] - pref[i - lowbit(i)]
+        pref = np.zeros(self.n + 1, dtype=a.dtype)
+        np.cumsum(a, out=pref[1:])
+        idx = np.arange(self.n + 1)
+        self.tree = pref - pref[idx - (idx & -idx)]
+
+    def _fit(self, x: Any) -> None:
+        # an int64 tree cannot hold a fraction (NumPy would truncate it): switch to float64 first
+        if self.tree.dtype.kind == "i" and not isinstance(x, (int, np.integer)) and not float(x).is_integer():
+            self.values = self.values.astype(np.float64)
+            self.tree = self.tree.astype(np.float64)
+
+    def add(self, index: int, delta: Any) -> None:
+        """Add delta to arr[index]."""
+        if not 0 <= index < self.n:
+            raise IndexError(index)
+        self._fit(delta)
+        self.values[index] += delta
+        tree = self.tree
+        i = index + 1
+        while i <= self.n:
+            tree[i] += delta
+            i += i & -i
+
+    def update(self, index: int, value: Any) -> None:
+        """Set arr[index] = value."""
+        if not 0 <= index < self.n:
+            raise IndexError(index)
+        self._fit(value)
+        self.add(index, value - self.values[index].item())
+
+    def prefix(self, count: int):
+        """Return the sum of the first `count` elements."""
+        tree = self.tree
+        total = 0
+        i = count
+        while i > 0:
+            total += tree[i].item()
+            i -= i & -i
+        return total
+
+    def sum(self, left: int, right: int):
+        """Return the sum of arr[left..right]."""
+        if not 0 <= left <= right < self.n:
+            raise IndexError(f"range must satisfy 0 <= left <= right < {self.n}")
+        return self.prefix(right + 1) - self.prefix(left)
+
+    def prefix_many(self, counts) -> np.ndarray:
+        """Vectorized prefix(): at most log2(n) passes over the whole batch."""
+        i = np.array(counts, dtype=np.int64)
+        total = np.zeros(i.shape, dtype=self.tree.dtype)
+        while True:
+            live = i > 0
+            if not live.any():
+                return total
+            total[live] += self.tree[i[live]]
+            i[live] -= i[live] & -i[live]
+
+    def query_many(self, lefts, rights) -> np.ndarray:
+        """Return the sums of many ranges at once."""
+        lo, hi = _check_ranges(lefts, rights, self.n)
+        return self.prefix_many(hi + 1) - self.prefix_many(lo)
+
+
+class SparseTable:
+    # levels[j][i] = op(arr[i : i + 2**j]); two overlapping blocks cover any range
+    def __init__(self, arr: Iterable[Any], op: str = "min"):
+        if op not in ("min", "max"):
+            raise ValueError("op must be 'min' or 'max'")
+        a = _as_array(arr)
+        self.n = a.size
+        self.op = op
+        self._ufunc = np.minimum if op == "min" else np.maximum
+        self.levels = [a]
+        width = 1
+        while 2 * width <= self.n:
+            prev = self.levels[-1]
+            self.levels.append(self._ufunc(prev[:-width], prev[width:]))
+            width *= 2
+        # log_table[length] = floor(log2(length)), the level that answers a range of that length
+        self.log_table = np.zeros(self.n + 1, dtype=np.int64)
+        for j in range(1, len(self.levels)):
+            self.log_table[1 << j:] += 1
+
+    def query(self, left: int, right: int):
+        """Return op(arr[left..right])."""
+        if not 0 <= left <= right < self.n:
+            raise IndexError(f"range must satisfy 0 <= left <= right < {self.n}")
+        j = (right - left + 1).bit_length() - 1
+        level = self.levels[j]
+        a, b = level[left].item(), level[right - (1 << j) + 1].item()
+        return min(a, b) if self.op == "min" else max(a, b)
+
+    def query_many(self, lefts, rights) -> np.ndarray:
+        """Answer many ranges at once, grouping them by level."""
+        lo, hi = _check_ranges(lefts, rights, self.n)
+        out = np.empty(lo.shape, dtype=self.levels[0].dtype)
+        if not lo.size:
+            return out
+        j = self.log_table[hi - lo + 1]
+        for level_no in np.unique(j).tolist():
+            mask = j == level_no
+            level = self.levels[level_no]
+            out[mask] = self._ufunc(level[lo[mask]], level[hi[mask] - (1 << level_no) + 1])
+        return out
+
+
+class RangeQueryIndex:
+    # sums, mins and maxes over one array, with optional point updates
+    def __init__(self, arr: Iterable[Any]):
+        self.values = _as_array(arr)
+        self.n = self.values.size
+        self._prefix = PrefixSums(self.values)
+        self._fenwick = None
+        self._tables: Dict[str, SparseTable] = {}
+
+    def _sums(self):
+        # prefix sums while the array is static, Fenwick tree after the first update
+        return self._fenwick if self._fenwick is not None else self._prefix
+
+    def _table(self, op: str) -> SparseTable:
+        # sparse tables are built on first use and dropped by updates
+        if op not in self._tables:
+            self._tables[op] = SparseTable(self.values, op)
+        return self._tables[op]
+
+    def sum(self, left: int, right: int):
+        """Return the sum of arr[left..right]."""
+        return self._sums().sum(left, right)
+
+    def min(self, left: int, right: int):
+        """Return the min of arr[left..right]."""
+        return self._table("min").query(left, right)
+
+    def max(self, left: int, right: int):
+        """Return the max of arr[left..right]."""
+        return self._table("max").query(left, right)
+
+    def update(self, index: int, value: Any) -> None:
+        """Set arr[index] = value in O(log n); min/max tables rebuild on next use."""
+        if self._fenwick is None:
+            self._fenwick = FenwickTree(self.values)
+            self._prefix = None
+        self._fenwick.update(index, value)
+        if self._fenwick.values.dtype != self.values.dtype:  # promoted to float64 by a fractional value
+            self.values = self.values.astype(self._fenwick.values.dtype)
+        self.values[index] = value
+        self._tables.clear()
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int], op: str = "sum") -> np.ndarray:
+        """Answer many inclusive ranges in one vectorized call; op is sum, min or max."""
+        if op == "sum":
+            return self._sums().query_many(lefts, rights)
+        if op in ("min", "max"):
+            return self._table(op).query_many(lefts, rights)
+        raise ValueError("op must be 'sum', 'min' or 'max'")
+
+
+# Example usage:
+if __name__ == "__main__":
+    idx = RangeQueryIndex([4, 2, 7, 1, 9, 3])
+    print(idx.sum(1, 4))  # Output: 19
+    print(idx.min(1, 4), idx.max(1, 4))  # Output: 1 9
+    print(idx.query_many([0, 2, 3], [5, 2, 4]))  # Output: [26  7 10]
+
+    idx.update(3, 10)
+    print(idx.sum(1, 4), idx.max(1, 4))  # Output: 28 10
@@ -0,0 +1,198 @@
+"""Sliding-window max/min/sum/mean in O(n), streaming or vectorized.
+
+The naive version slices arr[i:i+k] and calls max() on every window, which
+is O(n*k) work and allocates a new list per step. Here:
+
+- max/min keep a monotonic deque of candidate indices: every value enters
+  and leaves the deque at most once, so the whole pass is O(n) for any k.
+- sum/mean keep a running total: add the value entering, subtract the one
+  leaving.
+- the NumPy path does the same in bulk: cumulative sums for sum/mean and
+  the van Herk / Gil-Werman block trick for max/min (O(n), not O(n*k)).
+"""
+
+from collections import deque
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+AGGREGATES = ("max", "min", "sum", "mean")
+_CHUNK = 1 << 16
+
+
+def _values(data: Iterable[Any]) -> Iterator[Any]:
+    # iterate NumPy arrays in chunks of plain Python numbers (much faster than numpy scalars)
+    if np is not None and isinstance(data, np.ndarray):
+        flat = data.ravel()
+        for start in range(0, flat.size, _CHUNK):
+            yield from flat[start : start + _CHUNK].tolist()
+    else:
+        yield from data
+
+
+def _check(k: int, agg: str) -> None:
+    if k <= 0:
+        raise ValueError("window size k must be positive")
+    if agg not in AGGREGATES:
+        raise ValueError(f"agg must be one of {AGGREGATES}, got {agg!r}")
+
+
+def sliding_window(data: Iterable[Any], k: int, agg: str = "max") -> Iterator[Any]:
+    """Yield the aggregate of every full window of size k, lazily.
+
+    Works on any iterable (lists, generators, file readers, NumPy arrays)
+    and keeps only O(k) values in memory.
+    """
+    _check(k, agg)
+    if agg in ("sum", "mean"):
+        window: deque = deque()
+        total = 0
+        for x in _values(data):
+            window.append(x)
+            total += x
+            if len(window) > k:
+                total -= window.popleft()
+            if len(window) == k:
+                yield total if agg == "sum" else total / k
+        return
+
+    # deque holds (index, value) with values decreasing (max) or increasing (min)
+    dq: deque = deque()
+    is_max = agg == "max"
+    for i, x in enumerate(_values(data)):
+        if is_max:
+            while dq and dq[-1][1] <= x:
+                dq.pop()
+        else:
+            while dq and dq[-1][1] >= x:
+                dq.pop()
+        dq.append((i, x))
+        if dq[0][0] <= i - k:
+            dq.popleft()
+        if i >= k - 1:
+            yield dq[0][1]
+
+
+def sliding_max(data: Iterable[Any], k: int) -> Iterator[Any]:
+    """Yield the max of every window of size k."""
+    return sliding_window(data, k, "max")
+
+
+def sliding_min(data: Iterable[Any], k: int) -> Iterator[Any]:
+    """Yield the min of every window of size k."""
+    return sliding_window(data, k, "min")
+
+
+def sliding_sum(data: Iterable[Any], k: int) -> Iterator[Any]:
+    """Yield the sum of every window of size k."""
+    return sliding_window(data, k, "sum")
+
+
+def sliding_mean(data: Iterable[Any], k: int) -> Iterator[float]:
+    """Yield the mean of every window of size k."""
+    return sliding_window(data, k, "mean")
+
+
+def sliding_window_max(arr: Iterable[Any], k: int) -> list:
+    """Drop-in O(n) replacement for some_algos.sliding_window_max."""
+    if k <= 0:
+        return []
+    return list(sliding_window(arr, k, "max"))
+
+
+class SlidingWindowAggregator:
+    # push-style version for streams that arrive one reading at a time
+    def __init__(self, k: int, agg: str = "max"):
+        _check(k, agg)
+        self.k = k
+        self.agg = agg
+        self.count = 0
+        self._dq: deque = deque()
+        self._total = 0
+
+    def push(self, x: Any) -> Optional[Any]:
+        """Add one value; return the current window aggregate once k values were seen."""
+        i = self.count
+        self.count += 1
+        dq = self._dq
+        if self.agg in ("sum", "mean"):
+            dq.append(x)
+            self._total += x
+            if len(dq) > self.k:
+                self._total -= dq.popleft()
+        else:
+            if self.agg == "max":
+                while dq and dq[-1][1] <= x:
+                    dq.pop()
+            else:
+                while dq and dq[-1][1] >= x:
+                    dq.pop()
+            dq.append((i, x))
+            if dq[0][0] <= i - self.k:
+                dq.popleft()
+        return self.value() if self.count >= self.k else None
+
+    def value(self) -> Optional[Any]:
+        """Return the aggregate of the last k values, or None before the window fills."""
+        if self.count < self.k:
+            return None
+        if self.agg == "sum":
+            return self._total
+        if self.agg == "mean":
+            return self._total / self.k
+        return self._dq[0][1]
+
+
+def windows(arr, k: int):
+    """Return a read-only (n-k+1, k) view of every window (no copy, via stride tricks).
+
+    Handy for custom reductions on small k; for max/min/sum/mean prefer
+    sliding_window_np, which stays O(n) however large k gets.
+    """
+    if np is None:
+        raise ImportError("NumPy is not available. Install with: pip install numpy")
+    return np.lib.stride_tricks.sliding_window_view(np.asarray(arr), k)
+
+
+def sliding_window_np(arr, k: int, agg: str = "max"):
+    """Vectorized sliding-window aggregate of a 1-D array; returns n-k+1 values."""
+    if np is None:
+        raise ImportError("NumPy is not available. Install with: pip install numpy")
+    _check(k, agg)
+    a = np.asarray(arr).ravel()
+    n = a.size
+    if k > n:
+        return a[:0].astype(float if agg == "mean" else a.dtype)
+
+    if agg in ("sum", "mean"):
+        acc_dtype = np.float64 if a.dtype.kind == "f" or agg == "mean" else np.int64
+        csum = np.concatenate(([0], np.cumsum(a, dtype=acc_dtype)))
+        sums = csum[k:] - csum[:-k]
+        return sums / k if agg == "mean" else sums
+
+    # van Herk / Gil-Werman: split into blocks of k, take running max from the
+    # left and from the right inside each block; any window spans at most two
+    # blocks, so its max is max(suffix[i], prefix[i + k - 1]).
+    op = np.maximum if agg == "max" else np.minimum
+    pad = (-n) % k
+    padded = np.pad(a, (0, pad), mode="edge").reshape(-1, k)
+    prefix = op.accumulate(padded, axis=1).ravel()
+    suffix = op.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return op(suffix[: n - k + 1], prefix[k - 1 : n])
+
+
+# Example usage:
+if __name__ == "__main__":
+    readings = [1, 3, 2, 5, 8, 7, 6]
+    print(list(sliding_max(readings, 3)))  # Output: [3, 5, 8, 8, 8]
+    print(list(sliding_min(readings, 3)))  # Output: [1, 2, 2, 5, 6]
+    print(list(sliding_mean(readings, 3)))
+
+    agg = SlidingWindowAggregator(3, "sum")
+    print([agg.push(x) for x in readings])  # Output: [None, None, 6, 10, 15, 20, 21]
+
+    if np is not None:
+        print(sliding_window_np(np.array(readings), 3, "max"))  # Output: [3 5 8 8 8]
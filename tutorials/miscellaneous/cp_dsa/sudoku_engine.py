@@ -0,0 +1,279 @@
+"""Sudoku in bulk: vectorized validation of many boards and a bitmask solver.
+
+tutorials/fundamentals/Q4_ValidSudoku.py checks one board read from stdin
+with `in nums` list scans. Here boards are an (N, 9, 9) integer array
+(0 = empty) and the check runs over all of them at once:
+
+- every digit d becomes the bit 1 << (d - 1), 0 stays 0;
+- a row, column or box has no repeated digit exactly when the sum of its
+  bits equals their bitwise OR (a repeat carries into another bit or
+  cancels in the OR, so the two differ).
+
+So validation is two reductions per unit type over the whole batch, done
+in chunks to bound memory.
+
+The solver keeps one 9-bit "used digits" mask per row, column and box.
+Candidates of a cell are then ALL & ~(row | col | box). Before branching it
+propagates:
+
+- naked singles: a cell with one candidate;
+- hidden singles: a digit that fits only one cell of a unit.
+
+Then it branches on the cell with the fewest candidates or, when every
+cell has three or more, on a digit that has only two places left in some
+unit. A branch copies 81 + 27 small ints, so typical puzzles, including
+the usual "hardest" 17-clue ones, solve in a few milliseconds.
+"""
+
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+ALL = 0x1FF  # digits 1..9 as bits 0..8
+BITCOUNT = [bin(mask).count("1") for mask in range(ALL + 1)]
+CHUNK = 1 << 16  # boards per validation chunk
+
+# bit for each cell value; index 10 is never produced (out of range values are rejected first)
+_BIT = np.array([0] + [1 << d for d in range(9)], dtype=np.uint16)
+
+# byte -> digit for puzzle text ('.' and '0' are empty), 255 for anything else
+_DIGIT = np.full(256, 255, dtype=np.uint8)
+_DIGIT[ord("0") : ord("9") + 1] = np.arange(10)
+_DIGIT[ord(".")] = 0
+
+ROW = [i // 9 for i in range(81)]
+COL = [i % 9 for i in range(81)]
+BOX = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+UNITS = (
+    [[r * 9 + c for c in range(9)] for r in range(9)]
+    + [[r * 9 + c for r in range(9)] for c in range(9)]
+    + [[(b // 3) * 27 + (b % 3) * 3 + r * 9 + c for r in range(3) for c in range(3)] for b in range(9)]
+)
+
+
+# --- parsing -------------------------------------------------------------
+
+
+def parse_boards(data: Union[str, bytes, Iterable[str]]) -> np.ndarray:
+    """Boards as an (N, 9, 9) uint8 array from puzzle text.
+
+    Every line that starts with 81 puzzle characters ('1'-'9', '0' or '.')
+    is one board; the rest of the line is ignored, so "quiz,solution" CSV
+    files work and header lines are skipped. Text without such lines is
+    read as a stream of cells (e.g. nine rows of nine digits each).
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    elif not isinstance(data, (bytes, bytearray, memoryview)):
+        data = "\n".join(data).encode()
+    raw = np.frombuffer(data, dtype=np.uint8)
+    digits = _DIGIT[raw]
+
+    # one board per line: the first 81 bytes of each line, if they are all cells
+    starts = np.concatenate(([0], np.flatnonzero(raw == ord("\n")) + 1))
+    starts = starts[starts + 81 <= raw.size]
+    if starts.size:
+        cells = digits[starts[:, None] + np.arange(81)]
+        cells = cells[(cells != 255).all(axis=1)]
+        if cells.size:
+            return cells.reshape(-1, 9, 9)
+
+    # otherwise every puzzle character in order, whitespace and separators dropped
+    cells = digits[digits != 255]
+    if cells.size % 81:
+        raise ValueError(f"{cells.size} cells is not a whole number of boards")
+    return cells.reshape(-1, 9, 9)
+
+
+def load_boards(path: str) -> np.ndarray:
+    """parse_boards on the contents of a file."""
+    with open(path, "rb") as f:
+        return parse_boards(f.read())
+
+
+# --- validation ----------------------------------------------------------
+
+
+def _units_ok(bits: np.ndarray) -> np.ndarray:
+    # bits is (n, 9, 9): True for boards whose rows (axis 2) have no repeated bit
+    total = bits.sum(axis=2, dtype=np.uint16)
+    union = np.bitwise_or.reduce(bits, axis=2)
+    return (total == union).all(axis=1)
+
+
+def validate_many(boards, chunk: int = CHUNK) -> np.ndarray:
+    """True for every board with no repeated digit in a row, column or box.
+
+    boards is (N, 9, 9) or a single (9, 9) board; 0 marks an empty cell and
+    any value outside 0..9 makes the board invalid.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim == 2:
+        boards = boards[None]
+    if boards.shape[1:] != (9, 9):
+        raise ValueError(f"expected boards of shape (N, 9, 9), got {boards.shape}")
+    out = np.empty(boards.shape[0], dtype=bool)
+    for start in range(0, boards.shape[0], chunk):
+        block = boards[start : start + chunk]
+        in_range = ((block >= 0) & (block <= 9)).all(axis=(1, 2))
+        bits = _BIT[np.where(in_range[:, None, None], block, 0).astype(np.intp)]
+        n = bits.shape[0]
+        boxes = bits.reshape(n, 3, 3, 3, 3).transpose(0, 1, 3, 2, 4).reshape(n, 9, 9)
+        ok = in_range & _units_ok(bits) & _units_ok(bits.transpose(0, 2, 1)) & _units_ok(boxes)
+        out[start : start + chunk] = ok
+    return out
+
+
+def valid(board) -> bool:
+    """Drop-in for valid() in Q4_ValidSudoku.py."""
+    return bool(validate_many(board)[0])
+
+
+# --- solving -------------------------------------------------------------
+
+
+def _place(grid: List[int], rows: List[int], cols: List[int], boxes: List[int], i: int, bit: int) -> None:
+    grid[i] = bit
+    rows[ROW[i]] |= bit
+    cols[COL[i]] |= bit
+    boxes[BOX[i]] |= bit
+
+
+def _propagate(grid: List[int], rows: List[int], cols: List[int], boxes: List[int]) -> Optional[List[Tuple[int, int]]]:
+    # fill forced cells in place; returns None on a contradiction, otherwise the
+    # (cell, bit) alternatives to branch on, [] once the board is full
+    while True:
+        changed = False
+        best, best_count, best_cand = -1, 10, 0
+        for i in range(81):
+            if grid[i]:
+                continue
+            cand = ALL & ~(rows[ROW[i]] | cols[COL[i]] | boxes[BOX[i]])
+            count = BITCOUNT[cand]
+            if count == 1:
+                _place(grid, rows, cols, boxes, i, cand)
+                changed = True
+            elif count == 0:
+                return None
+            elif count < best_count:
+                best, best_count, best_cand = i, count, cand
+        if changed:
+            continue
+        if best < 0:
+            return []
+
+        # hidden singles: digits that appear as a candidate in exactly one cell of a unit
+        pair_unit, pair_bit = None, 0
+        for unit in UNITS:
+            once = twice = thrice = used = 0
+            for i in unit:
+                if grid[i]:
+                    used |= grid[i]
+                else:
+                    cand = ALL & ~(rows[ROW[i]] | cols[COL[i]] | boxes[BOX[i]])
+                    thrice |= twice & cand
+                    twice |= once & cand
+                    once |= cand
+            if (once | used) != ALL:
+                return None  # some digit fits nowhere in this unit
+            hidden = once & ~twice
+            if not hidden:
+                if best_count > 2 and pair_unit is None and twice & ~thrice:
+                    pair_unit, pair_bit = unit, twice & ~thrice
+                continue
+            for i in unit:
+                if grid[i]:
+                    continue
+                cand = ALL & ~(rows[ROW[i]] | cols[COL[i]] | boxes[BOX[i]]) & hidden
+                if cand:
+                    if cand & (cand - 1):
+                        return None  # two digits can only go in this one cell
+                    _place(grid, rows, cols, boxes, i, cand)
+                    changed = True
+        if changed:
+            continue
+
+        if pair_unit is not None:
+            # a digit with two places in a unit is a two-way branch, better than a 3+ candidate cell
+            bit = pair_bit & -pair_bit
+            return [(i, bit) for i in pair_unit
+                    if not grid[i] and ALL & ~(rows[ROW[i]] | cols[COL[i]] | boxes[BOX[i]]) & bit]
+        options = []
+        while best_cand:
+            bit = best_cand & -best_cand
+            best_cand ^= bit
+            options.append((best, bit))
+        return options
+
+
+def _search(grid: List[int], rows: List[int], cols: List[int], boxes: List[int], limit: int,
+            found: List[List[int]]) -> None:
+    options = _propagate(grid, rows, cols, boxes)
+    if options is None:
+        return
+    if not options:
+        found.append(grid)
+        return
+    for i, bit in options:
+        if len(found) >= limit:
+            return
+        g, r, c, b = grid[:], rows[:], cols[:], boxes[:]
+        _place(g, r, c, b, i, bit)
+        _search(g, r, c, b, limit, found)
+
+
+def _solutions(board, limit: int) -> List[List[int]]:
+    # up to `limit` solutions as flat lists of digit bits; [] for contradictory givens
+    cells = np.asarray(board).reshape(81)
+    if not validate_many(cells.reshape(9, 9))[0]:
+        return []
+    grid, rows, cols, boxes = [0] * 81, [0] * 9, [0] * 9, [0] * 9
+    for i, value in enumerate(cells.tolist()):
+        if value:
+            _place(grid, rows, cols, boxes, i, 1 << (value - 1))
+    found: List[List[int]] = []
+    _search(grid, rows, cols, boxes, limit, found)
+    return found
+
+
+def solve(board) -> Optional[np.ndarray]:
+    """A solved (9, 9) board, or None if there is no solution."""
+    found = _solutions(board, 1)
+    if not found:
+        return None
+    return np.array([bit.bit_length() for bit in found[0]], dtype=np.uint8).reshape(9, 9)
+
+
+def count_solutions(board, limit: int = 2) -> int:
+    """Number of solutions, counting no further than `limit` (2 checks uniqueness)."""
+    return len(_solutions(board, limit))
+
+
+def solve_many(boards) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve (N, 9, 9) boards; returns (solutions, solved) with unsolvable boards left as given."""
+    boards = np.asarray(boards, dtype=np.uint8)
+    out = boards.copy()
+    solved = np.zeros(boards.shape[0], dtype=bool)
+    for k in range(boards.shape[0]):
+        result = solve(boards[k])
+        if result is not None:
+            out[k] = result
+            solved[k] = True
+    return out, solved
+
+
+# Example usage:
+if __name__ == "__main__":
+    puzzles = parse_boards(
+        "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79\n"
+        "..9748...7.........2.1.9.....7...24..64.1.59..98...3.....8.3.2.........6...2759..\n"
+        "55..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79\n"
+    )
+    print(puzzles.shape)  # Output: (3, 9, 9)
+    print(validate_many(puzzles))  # Output: [ True  True False]
+
+    solutions, solved = solve_many(puzzles)
+    print(solved)  # Output: [ True  True False]
+    print(validate_many(solutions[solved]).all())  # Output: True
+    print(solutions[0, 0])  # Output: [5 3 4 6 7 8 9 1 2]
+    print(count_solutions(puzzles[0]))  # Output: 1
@@ -0,0 +1,169 @@
+"""Caesar and Vigenère over bytes, strings and multi-GB files.
+
+ciphers.py (test_playground/miscellaneous) builds every output with a
+generator that calls _shift_char once per character. That is a few
+Python calls per byte, so a few MB/s at best. Here:
+
+- Caesar is a fixed byte -> byte map. It is built once per shift with
+  bytes.maketrans and applied with bytes.translate, which runs in C at
+  memory speed.
+- Vigenère shifts letter i by key[i % len(key)], where i counts only the
+  letters. Per block, np.flatnonzero finds the letters, a pre-tiled key
+  array is sliced at the current key position, and the shift is a few
+  uint8 operations. Blocks are 128 KiB so the temporaries stay in cache.
+- Files are processed in fixed-size chunks by a stream object. The stream
+  remembers how many letters it has seen, so the key position is the same
+  as if the whole file were one string.
+
+Only ASCII letters are shifted; the case is kept and everything else
+(digits, punctuation, UTF-8 multibyte sequences) passes through. str
+input is encoded as UTF-8, processed as bytes and decoded back.
+"""
+
+import argparse
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, Union
+
+import numpy as np
+
+BLOCK = 1 << 17  # bytes per NumPy pass
+CHUNK = 1 << 24  # bytes read per file chunk
+
+UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWER = UPPER.lower()
+
+Data = Union[str, bytes, bytearray, memoryview]
+
+
+@lru_cache(maxsize=26)
+def caesar_table(shift: int) -> bytes:
+    """256-byte translation table shifting ASCII letters forward by `shift`."""
+    s = shift % 26
+    return bytes.maketrans(UPPER + LOWER, UPPER[s:] + UPPER[:s] + LOWER[s:] + LOWER[:s])
+
+
+def key_shifts(key: str) -> np.ndarray:
+    """Shift of every key character (a/A = 0 ... z/Z = 25) as uint8."""
+    return np.array([(ord(ch.lower()) - ord("a")) % 26 for ch in key], dtype=np.uint8)
+
+
+def _apply(data: Data, transform: Callable[[bytes], bytes]) -> Data:
+    # run a bytes -> bytes transform on str or bytes input, returning the same type
+    if isinstance(data, str):
+        return transform(data.encode("utf-8")).decode("utf-8")
+    return transform(bytes(data))
+
+
+class CaesarStream:
+    # stateless, but shares the update() interface with VigenereStream
+    def __init__(self, shift: Union[int, str], decrypt: bool = False):
+        shift = int(shift)
+        self.table = caesar_table(-shift if decrypt else shift)
+
+    def update(self, chunk: bytes) -> bytes:
+        """Encrypt/decrypt the next chunk."""
+        return bytes(chunk).translate(self.table)
+
+
+class VigenereStream:
+    # feed chunks in order; `position` counts the letters seen so far
+    def __init__(self, key: str, decrypt: bool = False, block: int = BLOCK):
+        shifts = key_shifts(key)
+        if decrypt:
+            shifts = (26 - shifts) % 26
+        self.shifts = shifts.astype(np.uint8)
+        self.block = block
+        self.position = 0
+        # key repeated past one block, so the shifts for any block are one slice
+        self._tiled = np.tile(self.shifts, block // max(1, shifts.size) + 2)
+
+    def _block(self, a: np.ndarray, out: np.ndarray) -> None:
+        letters = np.flatnonzero(((a | 32) - 97) < 26)  # wraps below 'a', so one compare
+        v = a[letters]
+        base = (v & 32) | 65  # 'a' for lowercase, 'A' for uppercase
+        start = self.position % self.shifts.size
+        x = v - base
+        x += self._tiled[start : start + letters.size]
+        x -= 26 * (x >= 26).view(np.uint8)
+        x += base
+        out[letters] = x
+        self.position += letters.size
+
+    def update(self, chunk: bytes) -> bytes:
+        """Encrypt/decrypt the next chunk, continuing the key where the last one stopped."""
+        if not self.shifts.size:
+            return bytes(chunk)
+        a = np.frombuffer(chunk, dtype=np.uint8)
+        out = a.copy()
+        for start in range(0, a.size, self.block):
+            self._block(a[start : start + self.block], out[start : start + self.block])
+        return out.tobytes()
+
+
+# cipher name -> stream class taking (key, decrypt)
+STREAMS: Dict[str, Callable[..., Union[CaesarStream, VigenereStream]]] = {
+    "caesar": CaesarStream,
+    "vigenere": VigenereStream,
+}
+
+
+def caesar_encrypt(text: Data, shift: int) -> Data:
+    """Return Caesar-encrypted text (str in, str out; bytes in, bytes out)."""
+    return _apply(text, CaesarStream(shift).update)
+
+
+def caesar_decrypt(text: Data, shift: int) -> Data:
+    """Return Caesar-decrypted text."""
+    return _apply(text, CaesarStream(shift, decrypt=True).update)
+
+
+def vigenere_encrypt(text: Data, key: str) -> Data:
+    """Return Vigenère-encrypted text."""
+    return _apply(text, VigenereStream(key).update)
+
+
+def vigenere_decrypt(text: Data, key: str) -> Data:
+    """Return Vigenère-decrypted text."""
+    return _apply(text, VigenereStream(key, decrypt=True).update)
+
+
+def transform_file(src: str, dst: str, cipher: str, key: Union[int, str], decrypt: bool = False,
+                   chunk_size: int = CHUNK) -> int:
+    """Encrypt/decrypt src into dst chunk by chunk (constant memory); returns bytes processed."""
+    stream = STREAMS[cipher](key, decrypt)
+    total = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        while True:
+            chunk = fin.read(chunk_size)
+            if not chunk:
+                break
+            fout.write(stream.update(chunk))
+            total += len(chunk)
+    return total
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Caesar/Vigenère over files, in constant memory.")
+    parser.add_argument("cipher", choices=sorted(STREAMS))
+    parser.add_argument("key", help="shift for caesar, key word for vigenere")
+    parser.add_argument("src")
+    parser.add_argument("dst")
+    parser.add_argument("-d", "--decrypt", action="store_true")
+    args = parser.parse_args(argv)
+    total = transform_file(args.src, args.dst, args.cipher, args.key, args.decrypt)
+    print(f"{total} bytes -> {args.dst}")
+
+
+# Example usage:
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main()
+    else:
+        print(caesar_encrypt("xyz, ABC!", 3))  # Output: abc, DEF!
+        print(vigenere_encrypt("ATTACKATDAWN", "LEMON"))  # Output: LXFOPVEFRNHR
+        print(vigenere_decrypt(vigenere_encrypt("Data Structures", "KEY"), "KEY"))  # Output: Data Structures
+
+        # chunks of any size give the same result as one call
+        stream = VigenereStream("LEMON")
+        print(stream.update(b"ATTAC") + stream.update(b"K AT DAWN"))  # Output: b'LXFOPV EF RNHR'
@@ -0,0 +1,514 @@
+"""Headless grid pathfinding: A*, BFS and Jump Point Search on a NumPy grid.
+
+Astarvisualiser.py keeps a Spot object per cell, builds g/f dicts over the
+whole grid before searching and redraws after every expansion. This engine
+keeps everything in flat arrays instead:
+
+- the grid is padded with a one-cell wall border and flattened, so a
+  neighbor is just `cell + offset` and never needs a bounds check;
+- g-scores, parents and the closed set are flat arrays sized once per
+  search, nothing is allocated per cell;
+- the A* and JPS open sets are plain heapq lists. An entry is pushed only
+  when it improves a cell's g-score, and stale entries are skipped when
+  popped. This measures faster than a decrease-key heap in pure Python
+  (cp_dsa/indexed_heap.py), whose sifts run as bytecode;
+- BFS expands whole frontiers with NumPy (one pass per level);
+- JPS precomputes, for every cell and straight direction, where the next
+  straight jump stops, so each straight jump is O(1).
+
+A step callback can be attached to any search. It is called every `every`
+expansions with the cells closed and opened since the previous call, so a
+front-end can redraw every few frames instead of after every node; return
+False from it to stop the search.
+
+Diagonal moves (diagonal=True) never cut corners: a diagonal step needs
+both orthogonal neighbors to be free. JPS needs diagonal=True.
+"""
+
+from heapq import heappop, heappush
+from math import sqrt
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+Cell = Tuple[int, int]
+StepCallback = Callable[[Dict[str, Any]], Optional[bool]]
+
+SQRT2 = sqrt(2.0)
+
+# heuristic name -> h(dr, dc), dr and dc being absolute row/col distances.
+# They are called once per search on whole arrays of distances, so they
+# must be written with NumPy operations.
+HEURISTICS: Dict[str, Callable[[Any, Any], Any]] = {}
+
+
+def heuristic(name: str):
+    """Register a vectorized h(dr, dc) under name."""
+
+    def register(fn):
+        HEURISTICS[name] = fn
+        return fn
+
+    return register
+
+
+@heuristic("manhattan")
+def manhattan(dr, dc):
+    return dr + dc
+
+
+@heuristic("octile")
+def octile(dr, dc):
+    return dr + dc + (SQRT2 - 2.0) * np.minimum(dr, dc)
+
+
+@heuristic("euclidean")
+def euclidean(dr, dc):
+    return np.sqrt(dr * dr + dc * dc)
+
+
+@heuristic("chebyshev")
+def chebyshev(dr, dc):
+    return np.maximum(dr, dc)
+
+
+@heuristic("zero")
+def zero(dr, dc):
+    # turns A* into Dijkstra
+    return np.zeros(np.broadcast(dr, dc).shape)
+
+
+def _octile(dr: int, dc: int) -> float:
+    # scalar octile distance for JPS segment costs
+    return dr + dc + (SQRT2 - 2.0) * (dr if dr < dc else dc)
+
+
+class _Progress:
+    # batches closed/opened cells and calls the callback every `every` expansions
+    def __init__(self, callback: Optional[StepCallback], every: int, to_cell: Callable[[int], Cell]):
+        self.callback = callback
+        self.every = max(1, every)
+        self.to_cell = to_cell
+        self.expanded = 0
+        self.closed: List[int] = []
+        self.opened: List[int] = []
+        self.stopped = False
+
+    def flush(self) -> None:
+        if self.callback is None:
+            return
+        state = {
+            "expanded": self.expanded,
+            "closed": [self.to_cell(p) for p in self.closed],
+            "opened": [self.to_cell(p) for p in self.opened],
+        }
+        self.closed, self.opened = [], []
+        if self.callback(state) is False:
+            self.stopped = True
+
+    def close(self, p: int) -> None:
+        self.expanded += 1
+        if self.callback is not None:
+            self.closed.append(p)
+            if self.expanded % self.every == 0:
+                self.flush()
+
+
+class GridPathfinder:
+    # blocked: 2-D array-like, nonzero/True = wall
+    def __init__(self, blocked: Any, diagonal: bool = False):
+        walls = np.asarray(blocked).astype(bool)
+        if walls.ndim != 2:
+            raise ValueError("expected a 2-D occupancy grid")
+        self.rows, self.cols = walls.shape
+        self.diagonal = diagonal
+        self.width = self.cols + 2
+        free = np.zeros((self.rows + 2, self.width), dtype=np.uint8)
+        free[1:-1, 1:-1] = ~walls
+        self.free_grid = free.astype(bool)
+        self.free = free.ravel()
+        self._free_mv = memoryview(self.free)
+        w = self.width
+        # (offset, cost, orthogonal offsets that must be free for a diagonal step)
+        self.moves = [(1, 1.0, 0, 0), (w, 1.0, 0, 0), (-1, 1.0, 0, 0), (-w, 1.0, 0, 0)]
+        if diagonal:
+            self.moves += [(dr * w + dc, SQRT2, dr * w, dc) for dr in (1, -1) for dc in (1, -1)]
+        self._jump_tables = None
+
+    # --- coordinates ----------------------------------------------------
+
+    def _flat(self, cell: Cell) -> int:
+        r, c = cell
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(f"cell {cell} is outside the {self.rows}x{self.cols} grid")
+        return (r + 1) * self.width + c + 1
+
+    def _cell(self, p: int) -> Cell:
+        r, c = divmod(p, self.width)
+        return r - 1, c - 1
+
+    def _result(self, found: bool, path: List[int], cost: float, progress: _Progress) -> Dict[str, Any]:
+        progress.flush()
+        return {
+            "found": found,
+            "path": [self._cell(p) for p in path],
+            "cost": cost if found else float("inf"),
+            "expanded": progress.expanded,
+        }
+
+    @staticmethod
+    def _walk_back(parent, s: int, t: int) -> List[int]:
+        path = [t]
+        while path[-1] != s:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+    def _heuristic_table(self, h: Callable[[Any, Any], Any], t: int, weight: float):
+        # weight * h(|r - tr|, |c - tc|) for every padded cell, as a flat memoryview
+        tr, tc = divmod(t, self.width)
+        dr = np.abs(np.arange(self.rows + 2) - tr)[:, None]
+        dc = np.abs(np.arange(self.width) - tc)[None, :]
+        table = np.broadcast_to(np.asarray(h(dr, dc), dtype=np.float64), self.free_grid.shape)
+        return memoryview((weight * table).ravel())
+
+    def _path_cost(self, path: List[int]) -> float:
+        w = self.width
+        cost = 0.0
+        for a, b in zip(path, path[1:]):
+            d = abs(b - a)
+            cost += 1.0 if d in (1, w) else SQRT2
+        return cost
+
+    # --- A* -------------------------------------------------------------
+
+    def astar(self, start: Cell, goal: Cell, heuristic: Union[str, Callable[[Any, Any], Any], None] = None,
+              weight: float = 1.0, on_step: Optional[StepCallback] = None, every: int = 1) -> Dict[str, Any]:
+        """A* from start to goal; returns {"found", "path", "cost", "expanded"}.
+
+        heuristic is a name from HEURISTICS or a vectorized callable
+        h(dr, dc); the default is manhattan for 4-connected grids and
+        octile otherwise.
+        weight > 1 trades optimality for fewer expansions.
+        """
+        if heuristic is None:
+            heuristic = "octile" if self.diagonal else "manhattan"
+        h = HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+        s, t = self._flat(start), self._flat(goal)
+        progress = _Progress(on_step, every, self._cell)
+        free = self._free_mv
+        if not (free[s] and free[t]):
+            return self._result(False, [], 0.0, progress)
+
+        size = self.free.size
+        hs = self._heuristic_table(h, t, weight)
+        g = memoryview(np.full(size, np.inf))
+        parent = memoryview(np.full(size, -1, dtype=np.int64))
+        closed = bytearray(size)
+        straight = [d for d, _, a, _ in self.moves if not a]
+        diagonal = [(d, a, b) for d, _, a, b in self.moves if a]
+        track = on_step is not None
+
+        g[s] = 0.0
+        heap = [(hs[s], hs[s], s)]
+        while heap:
+            _, _, u = heappop(heap)
+            if closed[u]:
+                continue
+            closed[u] = 1
+            if track:
+                progress.close(u)
+                if progress.stopped:
+                    break
+            else:
+                progress.expanded += 1
+            if u == t:
+                path = self._walk_back(parent, s, t)
+                return self._result(True, path, g[t], progress)
+            gu = g[u]
+            ng = gu + 1.0
+            for d in straight:
+                v = u + d
+                if free[v] and not closed[v] and ng < g[v]:
+                    g[v] = ng
+                    parent[v] = u
+                    hv = hs[v]
+                    heappush(heap, (ng + hv, hv, v))
+                    if track:
+                        progress.opened.append(v)
+            if diagonal:
+                ng = gu + SQRT2
+                for d, a, b in diagonal:
+                    v = u + d
+                    if free[v] and not closed[v] and free[u + a] and free[u + b] and ng < g[v]:
+                        g[v] = ng
+                        parent[v] = u
+                        hv = hs[v]
+                        heappush(heap, (ng + hv, hv, v))
+                        if track:
+                            progress.opened.append(v)
+        return self._result(False, [], 0.0, progress)
+
+    # --- BFS ------------------------------------------------------------
+
+    def bfs(self, start: Cell, goal: Cell, on_step: Optional[StepCallback] = None, every: int = 1) -> Dict[str, Any]:
+        """Fewest-steps search (every move counts 1), one NumPy pass per level."""
+        s, t = self._flat(start), self._flat(goal)
+        progress = _Progress(on_step, every, self._cell)
+        if not (self.free[s] and self.free[t]):
+            return self._result(False, [], 0.0, progress)
+
+        free = self.free.astype(bool)
+        seen = np.zeros(self.free.size, dtype=bool)
+        parent = np.full(self.free.size, -1, dtype=np.int64)
+        seen[s] = True
+        frontier = np.array([s], dtype=np.int64)
+        last_flush = 0
+        while frontier.size and not seen[t]:
+            found = []
+            for d, _, a, b in self.moves:
+                cand = frontier + d
+                ok = free[cand] & ~seen[cand]
+                if a:
+                    ok &= free[frontier + a] & free[frontier + b]
+                new = cand[ok]
+                seen[new] = True
+                parent[new] = frontier[ok]
+                found.append(new)
+            progress.expanded += frontier.size
+            if on_step is not None:
+                progress.closed.extend(frontier.tolist())
+                frontier = np.concatenate(found)
+                progress.opened.extend(frontier.tolist())
+                if progress.expanded - last_flush >= progress.every:
+                    last_flush = progress.expanded
+                    progress.flush()
+                    if progress.stopped:
+                        break
+            else:
+                frontier = np.concatenate(found)
+        if not seen[t]:
+            return self._result(False, [], 0.0, progress)
+        path = self._walk_back(memoryview(parent), s, t)
+        return self._result(True, path, self._path_cost(path), progress)
+
+    # --- Jump Point Search ----------------------------------------------
+
+    def _build_jump_tables(self) -> None:
+        # tables[d][p]: first cell at or after p, stepping by d, where a straight
+        # jump stops: either a wall or a cell with a forced neighbor
+        F = self.free_grid
+        R, C = F.shape
+        blocked = ~F
+        up, down = np.roll(F, 1, axis=0), np.roll(F, -1, axis=0)  # F[r-1], F[r+1]
+        left, right = np.roll(F, 1, axis=1), np.roll(F, -1, axis=1)  # F[c-1], F[c+1]
+        flat = np.arange(R * C, dtype=np.int64).reshape(R, C)
+
+        def forced_h(dc):
+            # moving along a row: an open cell above/below whose predecessor is a wall
+            return (up & ~np.roll(up, dc, axis=1)) | (down & ~np.roll(down, dc, axis=1))
+
+        def forced_v(dr):
+            return (left & ~np.roll(left, dr, axis=0)) | (right & ~np.roll(right, dr, axis=0))
+
+        big = R * C
+        east = np.where(blocked | forced_h(1), flat, big)
+        west = np.where(blocked | forced_h(-1), flat, -1)
+        south = np.where(blocked | forced_v(1), flat, big)
+        north = np.where(blocked | forced_v(-1), flat, -1)
+        w = self.width
+        self._jump_tables = {
+            1: memoryview(np.minimum.accumulate(east[:, ::-1], axis=1)[:, ::-1].ravel().copy()),
+            -1: memoryview(np.maximum.accumulate(west, axis=1).ravel().copy()),
+            w: memoryview(np.minimum.accumulate(south[::-1], axis=0)[::-1].ravel().copy()),
+            -w: memoryview(np.maximum.accumulate(north, axis=0).ravel().copy()),
+        }
+
+    def _jump_straight(self, p: int, d: int, t: int) -> int:
+        # O(1) straight jump from p (included) stepping by d; -1 if it runs into a wall
+        q = self._jump_tables[d][p]
+        if (p <= t <= q or q <= t <= p) and (t - p) % d == 0:
+            return t
+        return q if self._free_mv[q] else -1
+
+    def _jump(self, p: int, dr: int, dc: int, t: int) -> int:
+        w = self.width
+        if not (dr and dc):
+            return self._jump_straight(p, dr * w + dc, t)
+        free = self._free_mv
+        dv = dr * w
+        horiz, vert = self._jump_tables[dc], self._jump_tables[dv]
+        while True:
+            if not free[p]:
+                return -1
+            if p == t:
+                return p
+            # a diagonal jump stops where either straight jump out of it finds something
+            q = p + dc
+            stop = horiz[q]
+            if (q <= t <= stop or stop <= t <= q) and (t - q) % dc == 0 or free[stop]:
+                return p
+            q = p + dv
+            stop = vert[q]
+            if (q <= t <= stop or stop <= t <= q) and (t - q) % dv == 0 or free[stop]:
+                return p
+            if free[p + dc] and free[p + dv]:
+                p += dv + dc
+            else:
+                return -1
+
+    def _pruned_dirs(self, p: int, from_p: int) -> List[Tuple[int, int]]:
+        # directions worth jumping in from p, given that we arrived from from_p
+        free, w = self._free_mv, self.width
+        if from_p < 0:
+            return [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                    if (dr or dc) and free[p + dr * w + dc]
+                    and (not (dr and dc) or (free[p + dr * w] and free[p + dc]))]
+        r, c = divmod(p, w)
+        pr, pc = divmod(from_p, w)
+        dr, dc = (r > pr) - (r < pr), (c > pc) - (c < pc)
+        out = []
+        if dr and dc:
+            vert, horiz = free[p + dr * w], free[p + dc]
+            if vert:
+                out.append((dr, 0))
+            if horiz:
+                out.append((0, dc))
+            if vert and horiz:
+                out.append((dr, dc))
+        elif dc:
+            nxt, below, above = free[p + dc], free[p + w], free[p - w]
+            if nxt:
+                out.append((0, dc))
+                if below:
+                    out.append((1, dc))
+                if above:
+                    out.append((-1, dc))
+            if below:
+                out.append((1, 0))
+            if above:
+                out.append((-1, 0))
+        else:
+            nxt, right, left = free[p + dr * w], free[p + 1], free[p - 1]
+            if nxt:
+                out.append((dr, 0))
+                if right:
+                    out.append((dr, 1))
+                if left:
+                    out.append((dr, -1))
+            if right:
+                out.append((0, 1))
+            if left:
+                out.append((0, -1))
+        return out
+
+    def jps(self, start: Cell, goal: Cell, on_step: Optional[StepCallback] = None, every: int = 1) -> Dict[str, Any]:
+        """Jump Point Search; same optimal costs as octile A*, far fewer expansions."""
+        if not self.diagonal:
+            raise ValueError("JPS needs an 8-connected grid (diagonal=True)")
+        if self._jump_tables is None:
+            self._build_jump_tables()
+        s, t = self._flat(start), self._flat(goal)
+        progress = _Progress(on_step, every, self._cell)
+        free = self._free_mv
+        if not (free[s] and free[t]):
+            return self._result(False, [], 0.0, progress)
+
+        w = self.width
+        tr, tc = divmod(t, w)
+        size = self.free.size
+        g = memoryview(np.full(size, np.inf))
+        parent = memoryview(np.full(size, -1, dtype=np.int64))
+        closed = bytearray(size)
+        track = on_step is not None
+
+        g[s] = 0.0
+        sr, sc = divmod(s, w)
+        h0 = _octile(abs(sr - tr), abs(sc - tc))
+        heap = [(h0, h0, s)]
+        while heap:
+            _, _, u = heappop(heap)
+            if closed[u]:
+                continue
+            closed[u] = 1
+            if track:
+                progress.close(u)
+                if progress.stopped:
+                    break
+            else:
+                progress.expanded += 1
+            if u == t:
+                return self._result(True, self._expand_jumps(parent, s, t), g[t], progress)
+            ur, uc = divmod(u, w)
+            gu = g[u]
+            for dr, dc in self._pruned_dirs(u, parent[u]):
+                j = self._jump(u + dr * w + dc, dr, dc, t)
+                if j < 0 or closed[j]:
+                    continue
+                jr, jc = divmod(j, w)
+                ng = gu + _octile(abs(jr - ur), abs(jc - uc))
+                if ng < g[j]:
+                    g[j] = ng
+                    parent[j] = u
+                    hj = _octile(abs(jr - tr), abs(jc - tc))
+                    heappush(heap, (ng + hj, hj, j))
+                    if track:
+                        progress.opened.append(j)
+        return self._result(False, [], 0.0, progress)
+
+    def _expand_jumps(self, parent, s: int, t: int) -> List[int]:
+        # jump points -> every cell in between (segments are straight or diagonal)
+        w = self.width
+        points = self._walk_back(parent, s, t)
+        path = [points[0]]
+        for a, b in zip(points, points[1:]):
+            (ar, ac), (br, bc) = divmod(a, w), divmod(b, w)
+            step = ((br > ar) - (br < ar)) * w + (bc > ac) - (bc < ac)
+            p = a
+            while p != b:
+                p += step
+                path.append(p)
+        return path
+
+
+def find_path(grid: Any, start: Cell, goal: Cell, method: str = "astar", diagonal: Optional[bool] = None,
+              **options: Any) -> Dict[str, Any]:
+    """One-shot search; method is "astar", "bfs" or "jps" (jps implies diagonal moves)."""
+    if method not in ("astar", "bfs", "jps"):
+        raise ValueError("method must be 'astar', 'bfs' or 'jps'")
+    if diagonal is None:
+        diagonal = method == "jps"
+    finder = GridPathfinder(grid, diagonal=diagonal)
+    return getattr(finder, method)(start, goal, **options)
+
+
+# Example usage:
+if __name__ == "__main__":
+    import time
+
+    maze = np.array([
+        [0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1],
+        [0, 0, 0, 0, 0],
+    ])
+    print(find_path(maze, (0, 0), (4, 4))["path"])
+    print(find_path(maze, (0, 0), (4, 4), "bfs")["cost"])  # Output: 16.0
+
+    # 2000x2000 with 25% random walls: the 4-connected searches the visualiser uses
+    rng = np.random.default_rng(0)
+    cluttered = rng.random((2000, 2000)) < 0.25
+    cluttered[0, 0] = cluttered[-1, -1] = False
+    # 2000x2000 with long walls and gaps: the kind of map JPS is built for
+    rooms = np.zeros((2000, 2000), dtype=bool)
+    rooms[500::500, :] = True
+    rooms[:, 700::700] = True
+    rooms[500::500, 350::700] = False
+    rooms[250::500, 700::700] = False
+
+    for grid, method, diagonal in ((cluttered, "astar", False), (cluttered, "bfs", False),
+                                   (rooms, "astar", True), (rooms, "jps", True)):
+        t0 = time.perf_counter()
+        res = find_path(grid, (0, 0), (1999, 1999), method, diagonal=diagonal)
+        print(f"{method:<5} diagonal={diagonal!s:<5} cost={res['cost']:.1f} expanded={res['expanded']:>8,} "
+              f"{time.perf_counter() - t0:.2f}s")
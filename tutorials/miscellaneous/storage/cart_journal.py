@@ -0,0 +1,286 @@
+"""Append-only cart journals and line-delimited bills for CartManager.
+
+CartManager in test_playground/intermediate/boss.py rewrites the whole
+cart_<user>.json after every add_item and remove_item. add_item looks the
+product up with a linear scan of cart["items"]. checkout appends to
+bills.csv with the item list stored as JSON inside one CSV cell. A
+thousand busy carts therefore mean a thousand full-file rewrites a
+second, and the bills can only be read back by parsing JSON out of CSV.
+This module keeps the same CartManager interface and changes the storage
+under it:
+
+- every mutation is one short line appended to cart_<user>.log
+  ("a <id> <qty>" or "r <id>") with a single write on an
+  O_APPEND descriptor. The cost is the same for a cart of any size, and
+  thousands of carts do not hold thousands of open files;
+- rows live in a dict keyed by product id. Python dicts keep insertion
+  order, so the dict is both the product-id -> row index and the display
+  order: add_item and remove_item are O(1);
+- the journal is replayed on load. A torn last line from a crash is
+  dropped by compacting right away, so later appends start on a clean
+  line. Once it holds more than COMPACT_MIN records and more than
+  COMPACT_RATIO times the live rows, it is rewritten as one "a" line per
+  row (temp file plus os.replace). Compaction therefore costs O(1) per
+  write on average;
+- checkout appends one JSON object per bill to bills.ndjson the same way,
+  so concurrent checkouts never interleave inside a line. iter_bills()
+  streams them back.
+
+A journal that is only appended to cannot be memory-mapped usefully (an
+mmap has a fixed length), so each record is one write() instead. The
+helpers and total() include the fixes that boss.py's hints ask for.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CART_DIR = SCRIPT_DIR / "carts"
+BILLS_PATH = CART_DIR / "bills.ndjson"
+COMPACT_MIN = 64
+COMPACT_RATIO = 4
+
+PRODUCTS = {
+    1: {"name": "Notebook", "price": 45.0},
+    2: {"name": "Pen Pack", "price": 20.0},
+    3: {"name": "Backpack", "price": 950.0},
+    4: {"name": "Bottle", "price": 300.0},
+}
+
+
+def compute_tax(total: float, rate: float = 0.18) -> float:
+    """Return tax amount."""
+    return total * rate
+
+
+def normalize_user_id(user_id: str) -> str:
+    """Normalize user id string."""
+    return user_id.strip().lower()
+
+
+class CartJournal:
+    # one user's append-only mutation log, replayed on open and compacted in place
+    def __init__(self, path: Any, fsync: bool = False):
+        self.path = Path(path)
+        self.fsync = fsync
+        self.records = 0  # lines in the file, live or superseded
+        self.torn = False  # replay stopped at a line it could not read
+
+    def replay(self) -> Dict[int, int]:
+        """Product id -> qty in first-added order, rebuilt from the journal."""
+        rows: Dict[int, int] = {}
+        self.records = 0
+        self.torn = False
+        if not self.path.exists():
+            return rows
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                try:
+                    if not line.endswith("\n"):  # torn write at a crash
+                        raise ValueError(line)
+                    if parts[0] == "a":
+                        item_id = int(parts[1])
+                        rows[item_id] = rows.get(item_id, 0) + int(parts[2])
+                    elif parts[0] == "r":
+                        rows.pop(int(parts[1]), None)
+                    else:
+                        raise ValueError(line)
+                except (IndexError, ValueError):
+                    self.torn = True
+                    break
+                self.records += 1
+        return rows
+
+    def append(self, line: str) -> None:
+        """Append one record (without the newline)."""
+        _append_line(self.path, line + "\n", self.fsync)
+        self.records += 1
+
+    def compact(self, rows: Dict[int, int]) -> None:
+        """Rewrite the journal as one add record per live row."""
+        self.torn = False
+        if not rows:
+            self.remove()
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".log.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(f"a {item_id} {qty}\n" for item_id, qty in rows.items())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.records = len(rows)
+
+    def remove(self) -> None:
+        """Delete the journal file."""
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+
+
+class CartManager:
+    # drop-in for boss.CartManager: rows indexed by product id, mutations journaled, bills as NDJSON
+    def __init__(self, user_id: str, directory: Any = CART_DIR, bills_path: Any = None,
+                 products: Optional[Dict[int, Dict[str, Any]]] = None, fsync: bool = False):
+        self.user_id = user_id
+        self.directory = Path(directory)
+        self.path = self.directory / f"cart_{normalize_user_id(user_id)}.log"
+        self.bills_path = Path(bills_path) if bills_path is not None else self.directory / BILLS_PATH.name
+        self.products = PRODUCTS if products is None else products
+        self.journal = CartJournal(self.path, fsync=fsync)
+        self._rows: Dict[int, Dict[str, int]] = {}  # product id -> {"item_id", "qty"}
+        self._lock = threading.Lock()
+        self.load()
+
+    @property
+    def cart(self) -> Dict[str, Any]:
+        """The cart in boss.py's shape: {"items": [{"item_id", "qty"}, ...]}."""
+        return {"items": [dict(row) for row in self._rows.values()]}
+
+    def load(self) -> None:
+        """Load cart from its journal if present."""
+        with self._lock:
+            rows = self.journal.replay()
+            self._rows = {item_id: {"item_id": item_id, "qty": qty} for item_id, qty in rows.items()}
+            if self.journal.torn:
+                self.journal.compact(rows)
+
+    def save(self) -> None:
+        """Compact the journal to the current rows (every change is already on disk)."""
+        with self._lock:
+            self.journal.compact(self._qtys())
+
+    def _qtys(self) -> Dict[int, int]:
+        return {item_id: row["qty"] for item_id, row in self._rows.items()}
+
+    def _maybe_compact(self) -> None:
+        # with self._lock held
+        if self.journal.records > max(COMPACT_MIN, COMPACT_RATIO * len(self._rows)):
+            self.journal.compact(self._qtys())
+
+    def add_item(self, item_id: int, qty: int = 1) -> None:
+        """Add product and quantity to cart."""
+        if item_id not in self.products:
+            raise ValueError("invalid item id")
+        if qty <= 0:
+            raise ValueError("qty must be positive")
+        with self._lock:
+            self.journal.append(f"a {item_id} {qty}")  # on disk first, so a failed write changes nothing
+            row = self._rows.get(item_id)
+            if row is None:
+                self._rows[item_id] = {"item_id": item_id, "qty": qty}
+            else:
+                row["qty"] += qty
+            self._maybe_compact()
+
+    def remove_item(self, item_id: int) -> bool:
+        """Remove one product row from cart."""
+        with self._lock:
+            if item_id not in self._rows:
+                return False
+            self.journal.append(f"r {item_id}")
+            del self._rows[item_id]
+            self._maybe_compact()
+            return True
+
+    def clear(self) -> None:
+        """Clear cart and delete its journal."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        # with self._lock held
+        self._rows = {}
+        self.journal.remove()
+
+    def list_items(self) -> List[Dict[str, Any]]:
+        """Return expanded cart rows for display."""
+        with self._lock:
+            return self._list_items()
+
+    def _list_items(self) -> List[Dict[str, Any]]:
+        # with self._lock held
+        out: List[Dict[str, Any]] = []
+        for row in self._rows.values():
+            item = self.products.get(row["item_id"], {"name": "Unknown", "price": 0.0})
+            out.append(
+                {
+                    "item_id": row["item_id"],
+                    "name": item["name"],
+                    "price": item["price"],
+                    "qty": row["qty"],
+                    "line_total": item["price"] * row["qty"],
+                }
+            )
+        return out
+
+    def total(self) -> float:
+        """Return cart grand total."""
+        return sum(row["line_total"] for row in self.list_items())
+
+    def checkout(self) -> Dict[str, Any]:
+        """Append the bill as one NDJSON line and clear cart."""
+        # one locked section: an add_item from another thread lands either on this bill or in the next cart
+        with self._lock:
+            items = self._list_items()
+            summary = {"user": self.user_id, "items": items, "total": round(sum(r["line_total"] for r in items), 2)}
+            append_bill(self.bills_path, summary)
+            self._clear()
+        return summary
+
+
+def _append_line(path: Path, line: str, fsync: bool = False) -> None:
+    # one write on an O_APPEND descriptor: the line lands whole at the end, even with other writers
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def append_bill(path: Any, bill: Dict[str, Any]) -> None:
+    """Append one bill as a JSON line."""
+    _append_line(Path(path), json.dumps(bill, separators=(",", ":")) + "\n")
+
+
+def iter_bills(path: Any = BILLS_PATH) -> Iterator[Dict[str, Any]]:
+    """Stream the bills written by checkout, oldest first."""
+    path = Path(path)
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# Example usage:
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cart = CartManager("Student1", directory=tmp)
+        cart.add_item(1, 2)
+        cart.add_item(1, 1)
+        cart.add_item(2, 1)
+        print([r["qty"] for r in cart.list_items()], cart.total())  # Output: [3, 1] 155.0
+        print(CartManager("student1", directory=tmp).cart)
+        # Output: {'items': [{'item_id': 1, 'qty': 3}, {'item_id': 2, 'qty': 1}]}
+
+        carts = [CartManager(f"user{k}", directory=tmp) for k in range(1000)]
+        start = time.perf_counter()
+        for step in range(100):
+            for k, c in enumerate(carts):
+                c.add_item(1 + (step + k) % 4)
+        print(f"100000 add_item calls on 1000 carts in {time.perf_counter() - start:.1f}s")  # Output: ... in ~0.5s
+        print(carts[0].checkout()["total"], sum(1 for _ in iter_bills(carts[0].bills_path)))  # Output: 32875.0 1
@@ -0,0 +1,364 @@
+"""Lock-striped, sharded item store for the basic_flask_routing app.
+
+create_app in test_playground/miscellaneous/basic_flask_routing.py keeps
+items in one dict closed over by the handlers. It takes str(len(store))
+as the next id, so under threaded serving two creates can get the same
+id and one write is lost; a delete followed by a create reuses a live id.
+GET /items copies every value on every request, and the items are gone
+when the process exits. ShardedStore replaces that dict:
+
+- items are spread over N shards by id % N, and each shard has its own
+  lock. Writers only contend when they touch the same shard, not on one
+  global lock;
+- ids come from one counter behind its own small lock. An id is never
+  handed out twice, including after deletes and restarts;
+- items are never changed in place. An update stores a new dict, so get()
+  reads without a lock and always sees a whole item;
+- each shard keeps its ids in a sorted list. page(after, limit) bisects
+  every shard to the cursor and merges at most `limit` ids from each, so
+  a page costs O(shards * limit), not O(items);
+- with log_dir, every write is also appended as one JSON line to its
+  shard's log, under that shard's lock. After snapshot_every records the
+  shard writes a snapshot (temp file plus os.replace) and truncates its
+  log. On open, snapshots are loaded and logs replayed. Records hold whole
+  items, so replaying a log over a newer snapshot gives the same state,
+  and a torn last line from a crash is dropped. File names carry the
+  shard count (shard-<i>-of-<n>) and manifest.json names the count in
+  use. Opening with another count writes the new layout's snapshots
+  first, switches the manifest, and only then deletes the old files.
+  A crash at any point leaves one complete layout to load.
+
+create_app(store) serves the same routes as the playground app, with the
+behaviour its hints ask for. GET /items is paged with ?after=<id>&limit=n
+and sends a Link: rel="next" header while more items follow.
+"""
+
+import bisect
+import heapq
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_SHARDS = 16
+SNAPSHOT_EVERY = 10_000
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+Item = Dict[str, Any]
+
+MANIFEST = "manifest.json"
+# shard-<index>-of-<count>.json / .log / .json.tmp
+SHARD_FILE = re.compile(r"shard-(\d+)-of-(\d+)\.(?:json|log|json\.tmp)")
+
+
+# one stripe: its items, their ids in order and its log, all guarded by one lock
+class _Shard:
+    __slots__ = ("index", "lock", "items", "ids", "log", "records", "max_id")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.lock = threading.Lock()
+        self.items: Dict[int, Item] = {}
+        self.ids: List[int] = []  # sorted keys of items
+        self.log = None
+        self.records = 0  # log lines since the last snapshot
+        self.max_id = 0  # highest id ever written to this shard, kept so ids are not reused after a restart
+
+
+def _key(item_id: Any) -> Optional[int]:
+    # ids are positive integers, exposed as strings like the playground's "1"
+    try:
+        key = int(item_id)
+    except (TypeError, ValueError):
+        return None
+    return key if key > 0 else None
+
+
+class ShardedStore:
+    # dict-like item store: lock-striped shards, atomic ids, keyset pages, optional log + snapshots
+    def __init__(self, shards: int = DEFAULT_SHARDS, log_dir: Any = None, snapshot_every: int = SNAPSHOT_EVERY,
+                 fsync: bool = False):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards = [_Shard(index) for index in range(shards)]
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.log_dir = None if log_dir is None else Path(log_dir)
+        self._next_id = 1
+        self._id_lock = threading.Lock()
+        if self.log_dir is not None:
+            self._open()
+
+    def _shard(self, key: int) -> _Shard:
+        return self._shards[key % len(self._shards)]
+
+    def new_id(self) -> int:
+        """Reserve the next id; every call returns a different one."""
+        with self._id_lock:
+            key = self._next_id
+            self._next_id += 1
+        return key
+
+    # reads
+
+    def get(self, item_id: Any) -> Optional[Item]:
+        """The item with this id, or None (lock-free: stored items are never mutated)."""
+        key = _key(item_id)
+        return None if key is None else self._shard(key).items.get(key)
+
+    def page(self, after: Any = 0, limit: int = PAGE_SIZE) -> Tuple[List[Item], Optional[str]]:
+        """Up to `limit` items with id > after in id order, and the cursor of the next page (None at the end)."""
+        after = _key(after) or 0
+        runs = []
+        more = False
+        for shard in self._shards:
+            with shard.lock:
+                start = bisect.bisect_right(shard.ids, after)
+                keys = shard.ids[start:start + limit]
+                more = more or start + limit < len(shard.ids)
+                runs.append([(key, shard.items[key]) for key in keys])
+        merged = list(heapq.merge(*runs, key=lambda pair: pair[0]))
+        more = more or len(merged) > limit
+        items = [item for _, item in merged[:limit]]
+        return items, (items[-1]["id"] if more and items else None)
+
+    def __len__(self) -> int:
+        return sum(len(shard.items) for shard in self._shards)
+
+    def __contains__(self, item_id: Any) -> bool:
+        return self.get(item_id) is not None
+
+    # writes
+
+    def create(self, fields: Item) -> Item:
+        """Store a new item under a fresh id and return it."""
+        key = self.new_id()
+        item = {**fields, "id": str(key)}
+        shard = self._shard(key)
+        with shard.lock:
+            shard.items[key] = item
+            bisect.insort(shard.ids, key)
+            self._append(shard, ["put", item])
+        return item
+
+    def update(self, item_id: Any, fields: Item) -> Optional[Item]:
+        """Merge fields into an item (its id cannot change); None if the id is missing."""
+        key = _key(item_id)
+        if key is None:
+            return None
+        shard = self._shard(key)
+        with shard.lock:
+            old = shard.items.get(key)
+            if old is None:
+                return None
+            item = {**old, **fields, "id": old["id"]}
+            shard.items[key] = item
+            self._append(shard, ["put", item])
+        return item
+
+    def delete(self, item_id: Any) -> Optional[Item]:
+        """Remove an item and return it; None if the id is missing."""
+        key = _key(item_id)
+        if key is None:
+            return None
+        shard = self._shard(key)
+        with shard.lock:
+            item = shard.items.pop(key, None)
+            if item is None:
+                return None
+            del shard.ids[bisect.bisect_left(shard.ids, key)]
+            self._append(shard, ["del", key])
+        return item
+
+    # persistence
+
+    def _paths(self, index: int, count: Optional[int] = None) -> Tuple[Path, Path]:
+        stem = f"shard-{index:03d}-of-{count or len(self._shards)}"
+        return self.log_dir / f"{stem}.json", self.log_dir / f"{stem}.log"
+
+    def _append(self, shard: _Shard, record: list) -> None:
+        # called with shard.lock held, so each log sees its shard's writes in order
+        if shard.log is None:
+            return
+        key = record[1] if record[0] == "del" else int(record[1]["id"])
+        shard.max_id = max(shard.max_id, key)
+        shard.log.write(json.dumps(record, separators=(",", ":")) + "\n")
+        shard.log.flush()
+        if self.fsync:
+            os.fsync(shard.log.fileno())
+        shard.records += 1
+        if self.snapshot_every and shard.records >= self.snapshot_every:
+            self._write_snapshot(shard)
+
+    def _write_snapshot(self, shard: _Shard) -> None:
+        # with shard.lock held: replace the snapshot atomically, then empty the log it now covers
+        snapshot, _ = self._paths(shard.index)
+        tmp = snapshot.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"max_id": shard.max_id, "items": [shard.items[key] for key in shard.ids]}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, snapshot)
+        shard.log.seek(0)
+        shard.log.truncate()
+        shard.records = 0
+
+    def _load_shard(self, index: int, count: int, items: Dict[int, Item]) -> int:
+        # one shard of a layout: its snapshot, then its log; returns the highest id seen
+        snapshot, log = self._paths(index, count)
+        max_id = 0
+        if snapshot.exists():
+            data = json.loads(snapshot.read_text(encoding="utf-8"))
+            max_id = data["max_id"]
+            items.update((int(item["id"]), item) for item in data["items"])
+        if log.exists():
+            with open(log, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        op, value = json.loads(line)
+                    except ValueError:  # torn write at a crash; nothing after it was acknowledged
+                        break
+                    if op == "put":
+                        key = int(value["id"])
+                        items[key] = value
+                    else:
+                        key = int(value)
+                        items.pop(key, None)
+                    max_id = max(max_id, key)
+        return max_id
+
+    def _open(self) -> None:
+        # load the layout named by the manifest, write a fresh snapshot per current shard
+        # (so each log starts empty), switch the manifest, then delete other layouts' files
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.log_dir / MANIFEST
+        count = len(self._shards)
+        active = json.loads(manifest.read_text(encoding="utf-8"))["shards"] if manifest.exists() else None
+        items: Dict[int, Item] = {}
+        max_id = 0
+        if active is not None:
+            # within one layout every id lives in exactly one shard, so shards load in any order
+            for index in range(active):
+                max_id = max(max_id, self._load_shard(index, active, items))
+        for key in sorted(items):
+            shard = self._shard(key)
+            shard.items[key] = items[key]
+            shard.ids.append(key)
+        for shard in self._shards:
+            shard.max_id = max_id
+            shard.log = open(self._paths(shard.index)[1], "a+", encoding="utf-8")
+            self._write_snapshot(shard)
+        if active != count:
+            tmp = manifest.with_suffix(".json.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"shards": count}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, manifest)
+        for path in self.log_dir.glob("shard-*"):  # other layouts and temp files left by a crash
+            match = SHARD_FILE.fullmatch(path.name)
+            if match and (int(match.group(2)) != count or path.name.endswith(".tmp")):
+                path.unlink()
+        self._next_id = max_id + 1
+
+    def snapshot(self) -> None:
+        """Snapshot every shard now and truncate its log."""
+        for shard in self._shards:
+            with shard.lock:
+                if shard.log is not None:
+                    self._write_snapshot(shard)
+
+    def close(self) -> None:
+        """Snapshot and close the logs (no-op without log_dir)."""
+        for shard in self._shards:
+            with shard.lock:
+                if shard.log is not None:
+                    self._write_snapshot(shard)
+                    shard.log.close()
+                    shard.log = None
+
+
+# build the basic_flask_routing app on a ShardedStore
+def create_app(store: Optional[ShardedStore] = None) -> Any:
+    """Create and return the Flask app; a fresh in-memory store holds the sample item "1"."""
+    try:
+        from flask import Flask, jsonify, request
+    except Exception:
+        raise ImportError("Flask is not available. Install with: pip install flask")
+
+    if store is None:
+        store = ShardedStore()
+        store.create({"name": "sample", "qty": 1})
+
+    app = Flask(__name__)
+    app.config["store"] = store
+
+    @app.route("/items", methods=["GET"])
+    def list_items():
+        after = request.args.get("after", 0, type=int)
+        limit = max(1, min(request.args.get("limit", PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+        items, cursor = store.page(after, limit)
+        response = jsonify(items)
+        if cursor is not None:
+            response.headers["Link"] = f'</items?after={cursor}&limit={limit}>; rel="next"'
+        return response
+
+    @app.route("/items", methods=["POST"])
+    def create_item():
+        payload = request.get_json(silent=True) or {}
+        if not isinstance(payload, dict):
+            return jsonify(error="expected a JSON object"), 400
+        return jsonify(store.create(payload)), 201
+
+    @app.route("/items/<item_id>", methods=["GET"])
+    def get_item(item_id):
+        item = store.get(item_id)
+        if item is None:
+            return ("Not Found", 404)
+        return jsonify(item)
+
+    @app.route("/items/<item_id>", methods=["PUT"])
+    def update_item(item_id):
+        payload = request.get_json(silent=True) or {}
+        if not isinstance(payload, dict):
+            return jsonify(error="expected a JSON object"), 400
+        item = store.update(item_id, payload)
+        if item is None:
+            return ("Not Found", 404)
+        return jsonify(item)
+
+    @app.route("/items/<item_id>", methods=["DELETE"])
+    def delete_item(item_id):
+        if store.delete(item_id) is None:
+            return ("Not Found", 404)
+        return ("", 204)
+
+    return app
+
+
+# Example usage:
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ShardedStore(log_dir=tmp, snapshot_every=5_000)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            created = list(pool.map(lambda k: store.create({"name": f"item-{k}", "qty": k}), range(100_000)))
+        print(len(store), len({item["id"] for item in created}), f"in {time.perf_counter() - start:.1f}s")
+        # Output: 100000 100000 in ~2s
+        store.update("7", {"qty": 0})
+        store.delete("8")
+        items, cursor = store.page(after=5, limit=3)
+        print([item["id"] for item in items], cursor)  # Output: ['6', '7', '9'] 9
+        store.close()
+
+        reopened = ShardedStore(log_dir=tmp)
+        print(len(reopened), reopened.get("7"), reopened.new_id())
+        # Output: 99999 {'name': 'item-6', 'qty': 0, 'id': '7'} 100001
+        reopened.close()
@@ -0,0 +1,227 @@
+"""SQLite item repository for bulk loads and many threads.
+
+sql_handler.py (test_playground/intermediate) opens a new connection for
+every call, runs one statement, commits and closes. Each insert is then
+its own transaction, so it pays for a journal sync, and the statement is
+parsed again every time. Loading a million rows that way takes hours.
+ItemRepository keeps the same CRUD operations and changes how they reach
+the database:
+
+- one long-lived connection per thread (threading.local), opened lazily
+  and closed together by close(). sqlite3 keeps a cache of prepared
+  statements per connection, and every query here is a constant string,
+  so each statement is parsed once per thread and then reused;
+- WAL journal with synchronous=NORMAL: readers no longer block the writer,
+  and a commit appends to the log instead of syncing the database file;
+- insert_many/update_many/delete_many pass an iterable straight to
+  executemany inside one transaction: one prepared statement, one commit,
+  and no list of all rows in memory;
+- iter_items pages through the table by primary key (id > last LIMIT n).
+  Rows are streamed in batches instead of being loaded with fetchall(),
+  and no read transaction stays open between batches.
+
+The module-level functions are drop-ins for the ones in sql_handler.py,
+with the behaviour its hints ask for: prices stay floats, rows come back
+in ascending id order, and update/delete touch exactly one id and report
+whether it existed.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DB_PATH = SCRIPT_DIR / "workshop.db"
+
+DEFAULT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    price REAL DEFAULT 0.0
+);
+"""
+
+# one constant string per statement, so sqlite3's per-connection statement cache reuses them
+INSERT = "INSERT INTO items (name, price) VALUES (?, ?)"
+SELECT_ALL = "SELECT id, name, price FROM items ORDER BY id"
+SELECT_ONE = "SELECT id, name, price FROM items WHERE id = ?"
+SELECT_PAGE = "SELECT id, name, price FROM items WHERE id > ? ORDER BY id LIMIT ?"
+# None leaves a column as it is, so every update shares this one statement
+UPDATE = "UPDATE items SET name = COALESCE(?, name), price = COALESCE(?, price) WHERE id = ?"
+DELETE = "DELETE FROM items WHERE id = ?"
+
+Item = Tuple[int, str, float]
+
+
+class ItemRepository:
+    # CRUD over the items table with one cached connection per thread
+    def __init__(self, path: Any = DB_PATH, timeout: float = 30.0, cache_kib: int = 64 * 1024):
+        self.path = str(path)
+        self.timeout = timeout
+        self.cache_kib = cache_kib
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns: List[sqlite3.Connection] = []
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened (WAL, synchronous=NORMAL) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit mode: transactions are opened explicitly by transaction()
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA cache_size=-{int(self.cache_kib)}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error) on this thread's connection."""
+        conn = self.connection()
+        if conn.in_transaction:  # nested: the outer transaction commits
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")  # inside the try: a failed COMMIT (e.g. SQLITE_BUSY) still rolls back
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Close the connections of every thread."""
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+
+    def init_db(self, schema_sql: Optional[str] = None) -> None:
+        """Initialize default schema or custom schema."""
+        self.connection().executescript(schema_sql or DEFAULT_SCHEMA)
+
+    # single rows
+
+    def insert_item(self, name: str, price: float) -> int:
+        """Insert one item and return its id."""
+        with self.transaction() as conn:
+            return conn.execute(INSERT, (name, float(price))).lastrowid
+
+    def get_item(self, item_id: int) -> Optional[Item]:
+        """(id, name, price) of one item, or None."""
+        return self.connection().execute(SELECT_ONE, (item_id,)).fetchone()
+
+    def query_items(self) -> List[Item]:
+        """All items in ascending id order."""
+        return self.connection().execute(SELECT_ALL).fetchall()
+
+    def update_item(self, item_id: int, name: Optional[str] = None, price: Optional[float] = None) -> bool:
+        """Update the given columns of one item; False if nothing was given or the id is missing."""
+        if name is None and price is None:
+            return False
+        with self.transaction() as conn:
+            return conn.execute(UPDATE, (name, None if price is None else float(price), item_id)).rowcount == 1
+
+    def delete_item(self, item_id: int) -> bool:
+        """Delete one item; False if the id is missing."""
+        with self.transaction() as conn:
+            return conn.execute(DELETE, (item_id,)).rowcount == 1
+
+    # batches
+
+    def insert_many(self, rows: Iterable[Tuple[str, float]]) -> int:
+        """Insert (name, price) rows in one transaction; returns the number inserted.
+
+        rows may be any iterable, including a generator; it is consumed
+        lazily by executemany.
+        """
+        with self.transaction() as conn:
+            return conn.executemany(INSERT, rows).rowcount
+
+    def update_many(self, rows: Iterable[Tuple[int, Optional[str], Optional[float]]]) -> int:
+        """Apply (id, name, price) updates in one transaction (None keeps a column); returns rows changed."""
+        params = ((name, price, item_id) for item_id, name, price in rows)
+        with self.transaction() as conn:
+            return conn.executemany(UPDATE, params).rowcount
+
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Delete the given ids in one transaction; returns rows deleted."""
+        with self.transaction() as conn:
+            return conn.executemany(DELETE, ((item_id,) for item_id in ids)).rowcount
+
+    def iter_items(self, batch_size: int = 1000, after_id: int = 0) -> Iterator[Item]:
+        """Stream items with id > after_id in ascending id order, batch_size rows per query."""
+        conn = self.connection()
+        while True:
+            batch = conn.execute(SELECT_PAGE, (after_id, batch_size)).fetchall()
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1][0]
+
+    def count(self) -> int:
+        """Number of items."""
+        return self.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+# drop-ins for sql_handler.py, sharing one repository at DB_PATH
+
+_default: Optional[ItemRepository] = None
+
+
+def get_repository() -> ItemRepository:
+    """The shared repository behind the module-level functions."""
+    global _default
+    if _default is None:
+        _default = ItemRepository(DB_PATH)
+    return _default
+
+
+def init_db(schema_sql: str = None):
+    """Initialize database schema."""
+    get_repository().init_db(schema_sql)
+
+
+def insert_item(name: str, price: float) -> int:
+    return get_repository().insert_item(name, price)
+
+
+def query_items() -> List[Item]:
+    return get_repository().query_items()
+
+
+def update_item(item_id: int, name: str = None, price: float = None) -> bool:
+    return get_repository().update_item(item_id, name, price)
+
+
+def delete_item(item_id: int) -> bool:
+    return get_repository().delete_item(item_id)
+
+
+# Example usage:
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = ItemRepository(Path(tmp) / "items.db")
+        repo.init_db()
+        pen = repo.insert_item("Pen", 20.25)
+        print(repo.update_item(pen, price=9.5), repo.get_item(pen))  # Output: True (1, 'Pen', 9.5)
+        print(repo.delete_item(pen), repo.delete_item(pen))  # Output: True False
+
+        start = time.perf_counter()
+        repo.insert_many((f"item-{k}", k * 0.01) for k in range(1_000_000))
+        repo.update_many((k, None, 0.0) for k in range(2, 1_000_002, 2))
+        print(repo.count(), f"in {time.perf_counter() - start:.1f}s")  # Output: 1000000 in ~5s
+        print(sum(1 for _ in repo.iter_items(batch_size=10_000)))  # Output: 1000000
+        repo.close()
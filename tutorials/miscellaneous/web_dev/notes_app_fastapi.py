@@ -1,16 +1,32 @@
+from contextlib import asynccontextmanager
 from html import escape
 from pathlib import Path
+from typing import Optional
 import sqlite3
 
-from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-app = FastAPI()
+from notes_cache import NotesPageCache, etag_matches
+from notes_storage import FORMATS, PAGE_SIZE, AsyncNotesStore, NotesStore, guess_format
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DB_PATH = SCRIPT_DIR / "notes_fastapi.db"
 
+# SQLite runs on a small thread pool with pooled WAL connections, never on the event loop
+store = NotesStore(DB_PATH)
+notes = AsyncNotesStore(store)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    notes.close()
+
+
+app = FastAPI(lifespan=lifespan)
+
 FAST_HTML = """
 <!DOCTYPE html>
 <html>
@@ -27,6 +43,7 @@ FAST_HTML = """
         li { background: #f4f6f8; margin: 10px 0; padding: 10px; border-radius: 4px; }
         .row { display: flex; gap: 8px; align-items: center; flex-wrap: wrap; }
         .note-id { font-weight: bold; min-width: 60px; }
+        .pager a { color: #007bff; text-decoration: none; }
     </style>
 </head>
 <body>
@@ -39,6 +56,7 @@ FAST_HTML = """
         <ul>
             __NOTES_ITEMS__
         </ul>
+        __PAGER__
     </div>
 </body>
 </html>
@@ -65,39 +83,18 @@ ERROR_HTML = """
 """
 
 
-def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
 def init_db() -> None:
-    with get_conn() as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS notes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content TEXT NOT NULL
-            )
-            """
-        )
-        conn.commit()
+    store.init_db()
 
 
-def fetch_notes() -> list[sqlite3.Row]:
-    with get_conn() as conn:
-        rows = conn.execute("SELECT id, content FROM notes ORDER BY id DESC").fetchall()
-    return rows
+def fetch_notes(before: Optional[int] = None, limit: int = PAGE_SIZE) -> list[sqlite3.Row]:
+    # one keyset page, newest first: notes with id < before
+    return store.fetch_page(before, limit)[0]
 
 
-def render_notes_page() -> HTMLResponse:
-    rows = fetch_notes()
-    items = []
-    for row in rows:
-        rid = int(row["id"])
-        content = escape(row["content"])
-        items.append(
-            f"""
+def render_note(rid: int, content: str) -> str:
+    content = escape(content)
+    return f"""
             <li>
                 <div class="row">
                     <span class="note-id">#{rid}</span>
@@ -111,13 +108,62 @@ def render_notes_page() -> HTMLResponse:
                 </div>
             </li>
             """
-        )
-    return HTMLResponse(content=FAST_HTML.replace("__NOTES_ITEMS__", "".join(items)))
+
+
+# rendered pages and <li> fragments, invalidated by bumping the version after each write
+cache = NotesPageCache(render_note)
+
+
+def render_notes_page(rows: list[sqlite3.Row], next_before: Optional[int] = None) -> str:
+    pager = "" if next_before is None else f'<p class="pager"><a href="/?before={next_before}">Older notes</a></p>'
+    return FAST_HTML.replace("__NOTES_ITEMS__", cache.render_notes(rows)).replace("__PAGER__", pager)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def read_notes():
-    return render_notes_page()
+async def read_notes(request: Request, before: Optional[int] = None):
+    version = cache.version  # read before the query, so a concurrent write invalidates this page
+    headers = {"ETag": cache.etag(version), "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    page = cache.get_page(before, version)
+    if page is None:
+        rows, next_before = await notes.fetch_page(before)
+        page = render_notes_page(rows, next_before).encode()
+        cache.put_page(before, version, page)
+    return HTMLResponse(content=page, headers=headers)
+
+
+@app.get("/search")
+async def search(q: str = "", page: int = 1):
+    # BM25-ranked FTS5 hits, 20 per page; snippets are escaped HTML with <mark> around matches
+    return await notes.search(q, page)
+
+
+@app.post("/import")
+async def import_notes(file: UploadFile = File(...), fmt: Optional[str] = Query(None, alias="format")):
+    # the upload is spooled to disk by Starlette and parsed line by line on a storage thread
+    fmt = fmt or guess_format(file.filename, file.content_type)
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format {fmt!r}")
+    try:
+        count = await notes.import_notes(file.file, fmt)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    finally:
+        cache.bump()  # earlier batches may have been committed even when a later line failed
+    return {"imported": count}
+
+
+@app.get("/export")
+async def export_notes(fmt: str = Query("ndjson", alias="format")):
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format {fmt!r}")
+    # a sync generator: Starlette pulls each page on a worker thread, so the loop stays free
+    return StreamingResponse(
+        store.export(fmt),
+        media_type=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="notes.{fmt}"'},
+    )
 
 
 @app.post("/add")
@@ -125,9 +171,8 @@ async def create_note(note: str = Form(...)):
     clean = note.strip()
     if not clean:
         raise HTTPException(status_code=400, detail="Note content cannot be empty")
-    with get_conn() as conn:
-        conn.execute("INSERT INTO notes (content) VALUES (?)", (clean,))
-        conn.commit()
+    await notes.add_note(clean)
+    cache.bump()
     return RedirectResponse(url="/", status_code=303)
 
 
@@ -136,21 +181,17 @@ async def update_note(note_id: int, note: str = Form(...)):
     clean = note.strip()
     if not clean:
         raise HTTPException(status_code=400, detail="Note content cannot be empty")
-    with get_conn() as conn:
-        cur = conn.execute("UPDATE notes SET content = ? WHERE id = ?", (clean, note_id))
-        conn.commit()
-        if cur.rowcount == 0:
-            raise HTTPException(status_code=404, detail=f"Note id {note_id} not found")
+    if not await notes.update_note(note_id, clean):
+        raise HTTPException(status_code=404, detail=f"Note id {note_id} not found")
+    cache.bump(note_id)
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.post("/delete/{note_id}")
 async def delete_note(note_id: int):
-    with get_conn() as conn:
-        cur = conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-        conn.commit()
-        if cur.rowcount == 0:
-            raise HTTPException(status_code=404, detail=f"Note id {note_id} not found")
+    if not await notes.delete_note(note_id):
+        raise HTTPException(status_code=404, detail=f"Note id {note_id} not found")
+    cache.bump(note_id)
     return RedirectResponse(url="/", status_code=303)
 
 
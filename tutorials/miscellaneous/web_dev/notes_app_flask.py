@@ -1,7 +1,12 @@
+from contextlib import closing
 from pathlib import Path
 import sqlite3
 
-from flask import Flask, abort, redirect, render_template_string, request, url_for
+from flask import Flask, Response, abort, jsonify, make_response, redirect, render_template_string, request, url_for
+from markupsafe import escape
+
+from notes_cache import NotesPageCache, etag_matches
+from notes_storage import FORMATS, export_chunks, guess_format, import_notes, init_search, search_notes
 
 app = Flask(__name__)
 
@@ -34,24 +39,27 @@ HTML_TEMPLATE = """
             <button type="submit" class="add-btn">Add Note</button>
         </form>
         <ul>
-            {% for note in notes %}
+            {{ notes_html }}
+        </ul>
+    </div>
+</body>
+</html>
+"""
+
+# one <li>, filled with str.format: a Jinja render per note costs far more than the note itself
+NOTE_TEMPLATE = """
                 <li>
                     <div class="row">
-                        <span class="note-id">#{{ note["id"] }}</span>
-                        <form method="POST" action="/update/{{ note['id'] }}">
-                            <input type="text" name="note_content" value="{{ note['content'] }}" required>
+                        <span class="note-id">#{id}</span>
+                        <form method="POST" action="/update/{id}">
+                            <input type="text" name="note_content" value="{content}" required>
                             <button type="submit" class="update-btn">Update</button>
                         </form>
-                        <form method="POST" action="/delete/{{ note['id'] }}">
+                        <form method="POST" action="/delete/{id}">
                             <button type="submit" class="delete-btn">Delete</button>
                         </form>
                     </div>
                 </li>
-            {% endfor %}
-        </ul>
-    </div>
-</body>
-</html>
 """
 
 ERROR_TEMPLATE = """
@@ -91,6 +99,7 @@ def init_db() -> None:
             )
             """
         )
+        init_search(conn)
         conn.commit()
 
 
@@ -100,9 +109,73 @@ def fetch_notes() -> list[sqlite3.Row]:
     return rows
 
 
+def render_note(rid: int, content: str) -> str:
+    return NOTE_TEMPLATE.format(id=rid, content=escape(content))
+
+
+# rendered page and <li> fragments, invalidated by bumping the version after each write
+cache = NotesPageCache(render_note)
+# the page around the list is static, so it is joined with the items instead of going through Jinja
+PAGE_HEAD, PAGE_TAIL = HTML_TEMPLATE.split("{{ notes_html }}")
+
+
 @app.route("/")
 def index():
-    return render_template_string(HTML_TEMPLATE, notes=fetch_notes())
+    version = cache.version  # read before the query, so a concurrent write invalidates this page
+    etag = cache.etag(version)
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        response = make_response("", 304)
+    else:
+        page = cache.get_page("index", version)
+        if page is None:
+            page = "".join((PAGE_HEAD, cache.render_notes(fetch_notes()), PAGE_TAIL)).encode()
+            cache.put_page("index", version, page)
+        response = make_response(page)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+@app.route("/search")
+def search():
+    # BM25-ranked FTS5 hits, 20 per page; snippets are escaped HTML with <mark> around matches
+    text = request.args.get("q", "")
+    page = request.args.get("page", 1, type=int)
+    with get_conn() as conn:
+        return jsonify(search_notes(conn, text, page))
+
+
+@app.route("/import", methods=["POST"])
+def import_upload():
+    # multipart field "file"; werkzeug spools big uploads to disk and the parser reads it line by line
+    upload = request.files.get("file")
+    if upload is None:
+        return jsonify(error="expected a multipart upload in field 'file'"), 400
+    fmt = request.args.get("format") or guess_format(upload.filename, upload.mimetype)
+    if fmt not in FORMATS:
+        return jsonify(error=f"unknown format {fmt!r}"), 400
+    try:
+        with closing(get_conn()) as conn:
+            count = import_notes(conn, upload.stream, fmt)
+    except ValueError as exc:
+        return jsonify(error=str(exc)), 400
+    finally:
+        cache.bump()  # earlier batches may have been committed even when a later line failed
+    return jsonify(imported=count)
+
+
+@app.route("/export")
+def export():
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in FORMATS:
+        return jsonify(error=f"unknown format {fmt!r}"), 400
+    # generator body: one page of rows per chunk, each on a short-lived connection
+    chunks = export_chunks(lambda: closing(get_conn()), fmt)
+    return Response(
+        chunks,
+        mimetype=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="notes.{fmt}"'},
+    )
 
 
 @app.route("/add", methods=["POST"])
@@ -113,6 +186,7 @@ def add_note():
     with get_conn() as conn:
         conn.execute("INSERT INTO notes (content) VALUES (?)", (note,))
         conn.commit()
+    cache.bump()
     return redirect(url_for("index"))
 
 
@@ -126,6 +200,7 @@ def update_note(note_id: int):
         conn.commit()
         if cur.rowcount == 0:
             abort(404)
+    cache.bump(note_id)
     return redirect(url_for("index"))
 
 
@@ -136,6 +211,7 @@ def delete_note(note_id: int):
         conn.commit()
         if cur.rowcount == 0:
             abort(404)
+    cache.bump(note_id)
     return redirect(url_for("index"))
 
 
@@ -0,0 +1,100 @@
+"""Rendered-page cache with per-note fragments and ETags for the notes apps.
+
+Both notes apps used to rebuild the whole page from every row on every
+GET. NotesPageCache avoids the repeated work at three levels:
+
+- a table version counter, bumped by the add/update/delete handlers after
+  their commit. The ETag is the version (plus a per-process token, so a
+  restart never matches an old tag). A request whose If-None-Match holds
+  the current tag gets 304 before any query is run;
+- rendered pages are kept, already encoded, per page key and are valid
+  while the version they were built at is current, so a repeated GET
+  costs a dict lookup;
+- each note's <li> is cached by id together with the content it was
+  rendered from. After an edit the page is rebuilt from the rows, but
+  only the edited note is rendered again; the rest are joined as they
+  are. A fragment is only reused when the content matches, so a page
+  built from rows read just before an edit cannot keep a stale fragment.
+
+The version counter lives in the process. Running several worker
+processes needs a shared counter (for example a row bumped by the writes)
+in its place.
+"""
+
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+MAX_PAGES = 256
+MAX_FRAGMENTS = 200_000
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value lists etag (weak comparison, as for GET)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class NotesPageCache:
+    # pages keyed on (page key, table version) and <li> fragments keyed on note id
+    def __init__(self, render_note: Callable[[int, str], str], max_pages: int = MAX_PAGES,
+                 max_fragments: int = MAX_FRAGMENTS):
+        self.render_note = render_note
+        self.max_pages = max_pages
+        self.max_fragments = max_fragments
+        self.version = 0
+        self._token = secrets.token_hex(4)
+        self._pages: "OrderedDict[Hashable, Tuple[int, bytes]]" = OrderedDict()
+        self._fragments: Dict[int, Tuple[str, str]] = {}  # id -> (content, html)
+        self._lock = threading.Lock()
+
+    def etag(self, version: Optional[int] = None) -> str:
+        """Quoted ETag for a table version (the current one by default)."""
+        return f'"{self._token}-{self.version if version is None else version}"'
+
+    def bump(self, note_id: Optional[int] = None) -> None:
+        """Record a committed write; pass the id of an updated or deleted note to drop its fragment."""
+        with self._lock:
+            self.version += 1
+            self._pages.clear()
+            if note_id is not None:
+                self._fragments.pop(note_id, None)
+
+    def get_page(self, key: Hashable, version: int) -> Optional[bytes]:
+        """Cached page body for a page key if it was built at this version."""
+        with self._lock:
+            hit = self._pages.get(key)
+            if hit is None or hit[0] != version:
+                return None
+            self._pages.move_to_end(key)
+            return hit[1]
+
+    def put_page(self, key: Hashable, version: int, body: bytes) -> None:
+        """Store a page body built from rows read at `version` (read self.version before the query)."""
+        with self._lock:
+            if version != self.version:  # a write landed meanwhile; the page may already be stale
+                return
+            self._pages[key] = (version, body)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def render_notes(self, rows: Iterable) -> str:
+        """<li> items of (id, content) rows, rendering only notes that are new or changed."""
+        fragments = self._fragments
+        parts = []
+        for row in rows:
+            rid, content = int(row[0]), row[1]
+            hit = fragments.get(rid)
+            if hit is None or hit[0] != content:
+                hit = (content, self.render_note(rid, content))
+                fragments[rid] = hit
+            parts.append(hit[1])
+        if len(fragments) > self.max_fragments:
+            with self._lock:
+                for rid in list(fragments)[: len(fragments) - self.max_fragments]:
+                    fragments.pop(rid, None)
+        return "".join(parts)
@@ -0,0 +1,463 @@
+"""Pooled SQLite storage for the notes apps, usable from sync and async code.
+
+notes_app_fastapi.py used to open a new sqlite3 connection inside its
+`async def` handlers. Every query then ran on the event loop thread, so
+while one request waited on SQLite no other request made progress, and
+the page listed every note on every GET. Here:
+
+- ConnectionPool keeps a few WAL-mode connections (readers do not block
+  the writer) and hands them out one per call. They are created lazily,
+  and the most recently used one is reused first while it is still warm;
+- NotesStore holds the note queries. fetch_page is keyset-paginated on
+  id (WHERE id < cursor ORDER BY id DESC LIMIT n), so any page costs
+  one index range scan, however deep it is;
+- AsyncNotesStore runs the same methods on a thread pool no larger than
+  the connection pool. The event loop never blocks, a worker never waits
+  for a connection, and SQLite sees at most pool-size concurrent calls,
+  however many clients are connected.
+
+Search uses an FTS5 index, notes_fts, over notes.content. It is an
+external-content table: it stores only the inverted index, and triggers
+on notes keep it in step with every insert, update and delete. A query is
+then an index lookup ranked by BM25, not a LIKE scan over every row.
+`python notes_storage.py reindex <db>` rebuilds the index in bulk, for
+example after rows were loaded with the triggers missing.
+
+Bulk import and export never hold a whole table or upload in memory.
+import_notes parses NDJSON or CSV line by line from the uploaded file and
+inserts it with executemany, IMPORT_BATCH rows per transaction.
+export_chunks pages through the table by id, EXPORT_BATCH rows per query,
+and yields one encoded chunk per page for a streaming response.
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import queue
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from html import escape
+from itertools import islice
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+PAGE_SIZE = 100
+POOL_SIZE = 4
+SEARCH_PAGE_SIZE = 20
+SNIPPET_TOKENS = 16
+IMPORT_BATCH = 50_000
+EXPORT_BATCH = 10_000
+
+# bulk formats -> media type
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content TEXT NOT NULL
+)
+"""
+
+# index only (content lives in notes); the triggers mirror every write into it
+INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+    INSERT INTO notes_fts (rowid, content) VALUES (new.id, new.content);
+END;
+"""
+SEARCH_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    content, content='notes', content_rowid='id', tokenize='porter unicode61'
+);
+{INSERT_TRIGGER}
+CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE OF content ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO notes_fts (rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+# snippet() marks matches with control characters; they become <mark> after escaping the text
+SEARCH = f"""
+SELECT rowid, snippet(notes_fts, 0, char(2), char(3), '...', {SNIPPET_TOKENS}), rank
+FROM notes_fts WHERE notes_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?
+"""
+
+
+def init_search(conn: sqlite3.Connection) -> None:
+    """Create the FTS5 index and its triggers, indexing existing notes the first time."""
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'notes_fts'").fetchone()
+    conn.executescript(SEARCH_SCHEMA)
+    if not exists:
+        reindex(conn)
+
+
+def reindex(conn: sqlite3.Connection) -> None:
+    """Rebuild the whole FTS5 index from notes and merge its segments."""
+    conn.execute("INSERT INTO notes_fts (notes_fts) VALUES ('rebuild')")
+    conn.execute("INSERT INTO notes_fts (notes_fts) VALUES ('optimize')")
+    if conn.in_transaction:
+        conn.commit()
+
+
+def match_query(text: str) -> str:
+    """FTS5 query matching notes that contain every word of text (the last one as a prefix)."""
+    words = text.split()
+    terms = ['"' + word.replace('"', '""') + '"' for word in words]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search_notes(conn: sqlite3.Connection, text: str, page: int = 1,
+                 per_page: int = SEARCH_PAGE_SIZE) -> Dict[str, Any]:
+    """One page of BM25-ranked hits: {"query", "page", "hits": [{"id", "snippet", "rank"}], "next_page"}.
+
+    Snippets are HTML: the note text escaped, with matches in <mark>.
+    """
+    query = match_query(text)
+    page = max(1, page)
+    hits: List[Dict[str, Any]] = []
+    if query:
+        rows = conn.execute(SEARCH, (query, per_page + 1, (page - 1) * per_page)).fetchall()
+        for rid, snippet, rank in rows[:per_page]:
+            marked = escape(snippet).replace("\x02", "<mark>").replace("\x03", "</mark>")
+            hits.append({"id": rid, "snippet": marked, "rank": rank})
+        more = len(rows) > per_page
+    else:
+        more = False
+    return {"query": text, "page": page, "hits": hits, "next_page": page + 1 if more else None}
+
+
+# rows with an id replace that note (the update trigger keeps the index right); rows without one are appended
+UPSERT = "INSERT INTO notes (id, content) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET content = excluded.content"
+
+# during an import, new ids are collected here (a temp trigger, private to the importing connection)
+# and indexed with one INSERT ... SELECT per batch: FTS5 writes through a per-row trigger are ~8x slower
+IMPORT_TRACKING = """
+CREATE TEMP TABLE IF NOT EXISTS imported_ids (id INTEGER PRIMARY KEY);
+CREATE TEMP TRIGGER IF NOT EXISTS imported_track AFTER INSERT ON main.notes BEGIN
+    INSERT INTO imported_ids (id) VALUES (new.id);
+END;
+"""
+INDEX_IMPORTED = "INSERT INTO notes_fts (rowid, content) SELECT id, content FROM notes WHERE id IN imported_ids"
+
+
+def guess_format(filename: Optional[str] = None, content_type: Optional[str] = None) -> str:
+    """"csv" for .csv files or text/csv uploads, "ndjson" otherwise."""
+    if (filename or "").lower().endswith(".csv") or (content_type or "").startswith(FORMATS["csv"]):
+        return "csv"
+    return "ndjson"
+
+
+def _note(line: int, note_id: Any, content: Any) -> Optional[Tuple[Optional[int], str]]:
+    # validated (id, content) parameters for UPSERT; None for a blank note
+    if not isinstance(content, str):
+        raise ValueError(f"line {line}: 'content' must be a string")
+    content = content.strip()
+    if not content:
+        return None
+    if note_id in (None, ""):
+        return None, content
+    try:
+        return int(note_id), content
+    except (TypeError, ValueError):
+        raise ValueError(f"line {line}: bad id {note_id!r}") from None
+
+
+def _parse(text: io.TextIOBase, fmt: str) -> Iterator[Tuple[Optional[int], str]]:
+    # (id or None, content) per record, read one line at a time
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        if "content" not in (reader.fieldnames or ()):
+            raise ValueError("CSV needs a header row with a 'content' column")
+        for row in reader:
+            note = _note(reader.line_num, row.get("id"), row["content"])
+            if note is not None:
+                yield note
+        return
+    for line, raw in enumerate(text, 1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {line}: {exc.msg}") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"line {line}: expected an object with a 'content' field")
+        note = _note(line, record.get("id"), record.get("content"))
+        if note is not None:
+            yield note
+
+
+def import_notes(conn: sqlite3.Connection, stream: BinaryIO, fmt: str = "ndjson",
+                 batch_size: int = IMPORT_BATCH) -> int:
+    """Load NDJSON ({"content": ..., "id": optional}) or CSV (content[,id] header) notes; returns the count.
+
+    Each batch of `batch_size` rows is one transaction. Inside it the FTS
+    insert trigger is dropped, and the new rows are indexed in bulk before
+    it is recreated. Other connections never see the table without it.
+    A malformed record raises ValueError naming its line; the batches
+    before it stay committed.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}")
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    count = 0
+    conn.executescript(IMPORT_TRACKING)
+    try:
+        notes = _parse(text, fmt)
+        while True:
+            batch = list(islice(notes, batch_size))
+            if not batch:
+                break
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DROP TRIGGER notes_fts_insert")
+            conn.executemany(UPSERT, batch)
+            conn.execute(INDEX_IMPORTED)
+            conn.execute("DELETE FROM imported_ids")
+            conn.execute(INSERT_TRIGGER)
+            conn.commit()
+            count += len(batch)
+    except ValueError as exc:
+        raise ValueError(f"{exc} ({count} notes imported before it)") from None
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.execute("DROP TRIGGER IF EXISTS temp.imported_track")
+        text.detach()  # leave the caller's stream open
+    return count
+
+
+def export_chunks(connect: Callable[[], ContextManager[sqlite3.Connection]], fmt: str = "ndjson",
+                  batch_size: int = EXPORT_BATCH) -> Iterator[bytes]:
+    """All notes in id order as NDJSON or CSV, one encoded chunk per page of `batch_size` rows.
+
+    A connection is taken from connect() for each page only, so a slow
+    client does not hold one for the whole download.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}")
+    if fmt == "csv":
+        yield b"id,content\r\n"
+    after = 0
+    while True:
+        with connect() as conn:
+            rows = conn.execute(
+                "SELECT id, content FROM notes WHERE id > ? ORDER BY id LIMIT ?", (after, batch_size)
+            ).fetchall()
+        if not rows:
+            return
+        if fmt == "csv":
+            buf = io.StringIO()
+            csv.writer(buf).writerows(rows)
+            chunk = buf.getvalue()
+        else:
+            chunk = "".join(json.dumps({"id": rid, "content": content}, ensure_ascii=False) + "\n" for rid, content in rows)
+        yield chunk.encode("utf-8")
+        if len(rows) < batch_size:
+            return
+        after = rows[-1][0]
+
+
+class ConnectionPool:
+    # at most `size` WAL connections to one database file, opened on demand
+    def __init__(self, path: Any, size: int = POOL_SIZE, timeout: float = 30.0):
+        self.path = str(path)
+        self.size = size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        # autocommit; writes are wrapped in explicit transactions by the caller
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, waiting for one if all `size` are in use."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                fresh = self._opened < self.size
+                self._opened += fresh
+            conn = self._open() if fresh else self._idle.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:  # an exception escaped mid-transaction
+                conn.rollback()
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close the idle connections (call once no requests are running)."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._opened -= 1
+
+
+class NotesStore:
+    # note queries over a ConnectionPool; every method is safe to call from any thread
+    def __init__(self, path: Any, pool_size: int = POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """A pooled connection inside BEGIN IMMEDIATE ... COMMIT."""
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+
+    def init_db(self) -> None:
+        """Create the notes table and its search index."""
+        with self.pool.connection() as conn:
+            conn.execute(SCHEMA)
+            init_search(conn)
+
+    def fetch_page(self, before: Optional[int] = None, limit: int = PAGE_SIZE) -> Tuple[List[sqlite3.Row], Optional[int]]:
+        """Newest notes with id < before (all when None); returns (rows, cursor of the next page or None)."""
+        with self.pool.connection() as conn:
+            if before is None:
+                rows = conn.execute("SELECT id, content FROM notes ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT id, content FROM notes WHERE id < ? ORDER BY id DESC LIMIT ?", (before, limit)
+                ).fetchall()
+        return rows, (int(rows[-1]["id"]) if len(rows) == limit else None)
+
+    def add_note(self, content: str) -> int:
+        """Insert a note and return its id."""
+        with self.transaction() as conn:
+            return conn.execute("INSERT INTO notes (content) VALUES (?)", (content,)).lastrowid
+
+    def update_note(self, note_id: int, content: str) -> bool:
+        """Replace a note's content; False if the id is missing."""
+        with self.transaction() as conn:
+            return conn.execute("UPDATE notes SET content = ? WHERE id = ?", (content, note_id)).rowcount > 0
+
+    def delete_note(self, note_id: int) -> bool:
+        """Delete a note; False if the id is missing."""
+        with self.transaction() as conn:
+            return conn.execute("DELETE FROM notes WHERE id = ?", (note_id,)).rowcount > 0
+
+    def search(self, text: str, page: int = 1, per_page: int = SEARCH_PAGE_SIZE) -> Dict[str, Any]:
+        """Ranked, paginated full-text search (see search_notes)."""
+        with self.pool.connection() as conn:
+            return search_notes(conn, text, page, per_page)
+
+    def reindex(self) -> None:
+        """Rebuild the search index."""
+        with self.pool.connection() as conn:
+            reindex(conn)
+
+    def import_notes(self, stream: BinaryIO, fmt: str = "ndjson", batch_size: int = IMPORT_BATCH) -> int:
+        """Bulk-load notes from a binary NDJSON/CSV stream (see import_notes)."""
+        with self.pool.connection() as conn:
+            return import_notes(conn, stream, fmt, batch_size)
+
+    def export(self, fmt: str = "ndjson", batch_size: int = EXPORT_BATCH) -> Iterator[bytes]:
+        """Stream every note as encoded NDJSON/CSV chunks (see export_chunks)."""
+        return export_chunks(self.pool.connection, fmt, batch_size)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+
+class AsyncNotesStore:
+    # NotesStore methods as coroutines, run on a thread pool sized to the connection pool
+    def __init__(self, store: NotesStore):
+        self.store = store
+        self._executor: Optional[ThreadPoolExecutor] = None  # started on first use, again after close()
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Await fn(*args, **kwargs) on the storage threads."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.store.pool.size, thread_name_prefix="notes-db")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def fetch_page(self, before: Optional[int] = None, limit: int = PAGE_SIZE):
+        return await self.run(self.store.fetch_page, before, limit)
+
+    async def add_note(self, content: str) -> int:
+        return await self.run(self.store.add_note, content)
+
+    async def update_note(self, note_id: int, content: str) -> bool:
+        return await self.run(self.store.update_note, note_id, content)
+
+    async def delete_note(self, note_id: int) -> bool:
+        return await self.run(self.store.delete_note, note_id)
+
+    async def search(self, text: str, page: int = 1, per_page: int = SEARCH_PAGE_SIZE) -> Dict[str, Any]:
+        return await self.run(self.store.search, text, page, per_page)
+
+    async def import_notes(self, stream: BinaryIO, fmt: str = "ndjson") -> int:
+        return await self.run(self.store.import_notes, stream, fmt)
+
+    def close(self) -> None:
+        """Stop the threads and close the connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.store.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain a notes database: search index, bulk import/export.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rebuild = sub.add_parser("reindex", help="rebuild the FTS5 index of a notes database")
+    rebuild.add_argument("db")
+    find = sub.add_parser("search", help="print one page of hits as JSON")
+    find.add_argument("db")
+    find.add_argument("text")
+    find.add_argument("--page", type=int, default=1)
+    load = sub.add_parser("import", help="load notes from an NDJSON or CSV file")
+    load.add_argument("db")
+    load.add_argument("src")
+    dump = sub.add_parser("export", help="write every note to stdout")
+    dump.add_argument("db")
+    for cmd in (load, dump):
+        cmd.add_argument("--format", choices=sorted(FORMATS), help="default: from the file name, else ndjson")
+    args = parser.parse_args(argv)
+
+    store = NotesStore(args.db, pool_size=1)
+    store.init_db()
+    if args.command == "reindex":
+        store.reindex()
+        print(f"reindexed {args.db}")
+    elif args.command == "search":
+        print(json.dumps(store.search(args.text, args.page), indent=2))
+    elif args.command == "import":
+        with open(args.src, "rb") as f:
+            count = store.import_notes(f, args.format or guess_format(args.src))
+        print(f"imported {count} notes into {args.db}")
+    else:
+        for chunk in store.export(args.format or "ndjson"):
+            sys.stdout.buffer.write(chunk)
+    store.close()
+
+
+# Usage: python notes_storage.py reindex notes_fastapi.db
+#        python notes_storage.py export notes_flask.db > notes.ndjson
+#        python notes_storage.py import notes_fastapi.db notes.ndjson
+if __name__ == "__main__":
+    main()